@@ -17,12 +17,20 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Created by raw SQL in the transcript search migration, not part of the models
+SEARCH_OBJECTS = ("lecture_search", "search_vector", "ix_lectures_search_vector")
+
+
+def include_name(name, type_, parent_names) -> bool:
+    return not (name or "").startswith(SEARCH_OBJECTS)
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -31,7 +39,13 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        # SQLite can't ALTER constraints; autogenerate batch (copy-and-move) operations
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
     with context.begin_transaction():
         context.run_migrations()
 
@@ -48,7 +62,12 @@ async def run_async_migrations() -> None:
 
 
 def run_migrations_online() -> None:
-    asyncio.run(run_async_migrations())
+    # app.db.migrations passes in a connection from the app's engine
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
@@ -0,0 +1,89 @@
+"""Initial schema: thinkers, disciplines, courses and lectures
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "disciplines",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_table(
+        "thinkers",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=False),
+        sa.Column("era", sa.String(length=100), nullable=False),
+        sa.Column("birth_year", sa.Integer(), nullable=True),
+        sa.Column("death_year", sa.Integer(), nullable=True),
+        sa.Column("nationality", sa.String(length=100), nullable=False),
+        sa.Column("bio", sa.Text(), nullable=False),
+        sa.Column("personality_traits", sa.Text(), nullable=False),
+        sa.Column("speaking_style", sa.Text(), nullable=False),
+        sa.Column("system_prompt", sa.Text(), nullable=False),
+        sa.Column("voice_id", sa.String(length=100), nullable=True),
+        sa.Column("image_url", sa.String(length=500), nullable=True),
+        sa.Column("discipline_id", sa.Uuid(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "courses",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("title", sa.String(length=300), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("difficulty_level", sa.String(length=50), nullable=False),
+        sa.Column("num_lectures", sa.Integer(), nullable=False),
+        sa.Column("thinker_id", sa.Uuid(), nullable=False),
+        sa.Column("discipline_id", sa.Uuid(), nullable=True),
+        sa.ForeignKeyConstraint(["discipline_id"], ["disciplines.id"]),
+        sa.ForeignKeyConstraint(["thinker_id"], ["thinkers.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "lectures",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("title", sa.String(length=300), nullable=False),
+        sa.Column("sequence_number", sa.Integer(), nullable=False),
+        sa.Column("transcript", sa.Text(), nullable=False),
+        sa.Column("audio_url", sa.String(length=500), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("duration_seconds", sa.Integer(), nullable=True),
+        sa.Column("course_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["course_id"], ["courses.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("lectures")
+    op.drop_table("courses")
+    op.drop_table("thinkers")
+    op.drop_table("disciplines")
@@ -0,0 +1,82 @@
+"""Generation job queue and audio backfill runs
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:05:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    # Databases created by create_all before migrations were tracked may have them
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    if not _has_table("generation_jobs"):
+        op.create_table(
+            "generation_jobs",
+            sa.Column("id", sa.Uuid(), nullable=False),
+            sa.Column("kind", sa.String(length=50), nullable=False),
+            sa.Column("status", sa.String(length=50), nullable=False),
+            sa.Column("payload", sa.Text(), nullable=False),
+            sa.Column("progress", sa.Float(), nullable=False),
+            sa.Column("stage", sa.String(length=100), nullable=False),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("worker_id", sa.String(length=200), nullable=True),
+            sa.Column("lecture_id", sa.Uuid(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+            sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["lecture_id"], ["lectures.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    if not _has_table("backfill_runs"):
+        op.create_table(
+            "backfill_runs",
+            sa.Column("id", sa.Uuid(), nullable=False),
+            sa.Column("status", sa.String(length=50), nullable=False),
+            sa.Column("course_id", sa.Uuid(), nullable=True),
+            sa.Column("thinker_id", sa.Uuid(), nullable=True),
+            sa.Column("lecture_ids", sa.Text(), nullable=False),
+            sa.Column("total", sa.Integer(), nullable=False),
+            sa.Column("total_chars", sa.Integer(), nullable=False),
+            sa.Column("completed", sa.Integer(), nullable=False),
+            sa.Column("completed_chars", sa.Integer(), nullable=False),
+            sa.Column("failed", sa.Integer(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+            sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("backfill_runs")
+    op.drop_table("generation_jobs")
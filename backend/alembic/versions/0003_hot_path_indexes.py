@@ -0,0 +1,60 @@
+"""Indexes for every hot query path; thinkers.discipline_id foreign key
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 09:10:00.000000
+
+Composite indexes end in ``id`` so they also serve keyset pagination
+(``ORDER BY sort_key, id``); a leading column alone (``lectures.course_id``,
+``courses.thinker_id``, ``thinkers.discipline_id``) is served by the same
+index, so there are no separate single-column ones.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_thinkers_name_id", "thinkers", ["name", "id"]),
+    ("ix_thinkers_discipline_name_id", "thinkers", ["discipline_id", "name", "id"]),
+    ("ix_courses_title_id", "courses", ["title", "id"]),
+    ("ix_courses_thinker_title_id", "courses", ["thinker_id", "title", "id"]),
+    ("ix_courses_discipline_title_id", "courses", ["discipline_id", "title", "id"]),
+    ("ix_lectures_sequence_id", "lectures", ["sequence_number", "id"]),
+    ("ix_lectures_course_sequence_id", "lectures", ["course_id", "sequence_number", "id"]),
+    ("ix_lectures_status_sequence_id", "lectures", ["status", "sequence_number", "id"]),
+    ("ix_generation_jobs_status_created", "generation_jobs", ["status", "created_at"]),
+    ("ix_generation_jobs_lecture_created", "generation_jobs", ["lecture_id", "created_at"]),
+    ("ix_generation_jobs_created", "generation_jobs", ["created_at"]),
+]
+
+
+def upgrade() -> None:
+    # Thinkers pointing at a discipline that no longer exists would fail the constraint
+    op.execute(
+        "UPDATE thinkers SET discipline_id = NULL WHERE discipline_id IS NOT NULL "
+        "AND discipline_id NOT IN (SELECT id FROM disciplines)"
+    )
+    foreign_keys = sa.inspect(op.get_bind()).get_foreign_keys("thinkers")
+    if not any(fk["constrained_columns"] == ["discipline_id"] for fk in foreign_keys):
+        with op.batch_alter_table("thinkers") as batch_op:
+            batch_op.create_foreign_key(
+                "thinkers_discipline_id_fkey", "disciplines", ["discipline_id"], ["id"]
+            )
+
+    # create_all already made the pagination indexes on some existing databases
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    with op.batch_alter_table("thinkers") as batch_op:
+        batch_op.drop_constraint("thinkers_discipline_id_fkey", type_="foreignkey")
@@ -0,0 +1,102 @@
+"""Full-text search over ready lectures' titles and transcripts
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 09:20:00.000000
+
+SQLite: an external-content FTS5 table over ``lectures`` (no second copy of
+the text), kept in sync by triggers. PostgreSQL: a generated, weighted
+``tsvector`` column with a GIN index. Either way only ``status = 'ready'``
+lectures are indexed, so the partial transcripts a worker streams into a
+``generating`` lecture cost nothing to index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE lecture_search USING fts5(
+        title, transcript,
+        content='lectures', content_rowid='rowid',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER lectures_search_insert AFTER INSERT ON lectures
+    WHEN new.status = 'ready' BEGIN
+        INSERT INTO lecture_search(rowid, title, transcript)
+        VALUES (new.rowid, new.title, new.transcript);
+    END
+    """,
+    """
+    CREATE TRIGGER lectures_search_delete AFTER DELETE ON lectures
+    WHEN old.status = 'ready' BEGIN
+        INSERT INTO lecture_search(lecture_search, rowid, title, transcript)
+        VALUES ('delete', old.rowid, old.title, old.transcript);
+    END
+    """,
+    # One trigger so the old entry is always removed before the new one is added
+    """
+    CREATE TRIGGER lectures_search_update AFTER UPDATE OF title, transcript, status ON lectures
+    BEGIN
+        INSERT INTO lecture_search(lecture_search, rowid, title, transcript)
+        SELECT 'delete', old.rowid, old.title, old.transcript WHERE old.status = 'ready';
+        INSERT INTO lecture_search(rowid, title, transcript)
+        SELECT new.rowid, new.title, new.transcript WHERE new.status = 'ready';
+    END
+    """,
+    """
+    INSERT INTO lecture_search(rowid, title, transcript)
+    SELECT rowid, title, transcript FROM lectures WHERE status = 'ready'
+    """,
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER lectures_search_update",
+    "DROP TRIGGER lectures_search_delete",
+    "DROP TRIGGER lectures_search_insert",
+    "DROP TABLE lecture_search",
+]
+
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE lectures ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        CASE WHEN status = 'ready' THEN
+            setweight(to_tsvector('english', title), 'A')
+            || setweight(to_tsvector('english', transcript), 'B')
+        END
+    ) STORED
+    """,
+    "CREATE INDEX ix_lectures_search_vector ON lectures USING gin (search_vector)",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX ix_lectures_search_vector",
+    "ALTER TABLE lectures DROP COLUMN search_vector",
+]
+
+
+def _statements(sqlite: list[str], postgres: list[str]) -> list[str]:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite
+    if dialect == "postgresql":
+        return postgres
+    raise NotImplementedError(f"Transcript search is not implemented for {dialect}")
+
+
+def upgrade() -> None:
+    for statement in _statements(SQLITE_UPGRADE, POSTGRES_UPGRADE):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _statements(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE):
+        op.execute(statement)
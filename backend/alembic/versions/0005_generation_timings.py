@@ -0,0 +1,55 @@
+"""Per-job pipeline stage timings
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 09:35:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # scripts/seed.py's create_all may already have made it
+    if sa.inspect(op.get_bind()).has_table("generation_timings"):
+        return
+    op.create_table(
+        "generation_timings",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("lecture_id", sa.Uuid(), nullable=False),
+        sa.Column("job_id", sa.Uuid(), nullable=True),
+        sa.Column("backfill_id", sa.Uuid(), nullable=True),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("trace_id", sa.String(length=32), nullable=False),
+        sa.Column("total_ms", sa.Float(), nullable=False),
+        sa.Column("stages", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["lecture_id"], ["lectures.id"]),
+        sa.ForeignKeyConstraint(["job_id"], ["generation_jobs.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_generation_timings_lecture_created", "generation_timings", ["lecture_id", "created_at"]
+    )
+    op.create_index(
+        "ix_generation_timings_backfill_total", "generation_timings", ["backfill_id", "total_ms"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_generation_timings_backfill_total", table_name="generation_timings")
+    op.drop_index("ix_generation_timings_lecture_created", table_name="generation_timings")
+    op.drop_table("generation_timings")
@@ -0,0 +1,35 @@
+"""Catalog generation counter for cross-process response cache invalidation
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 10:10:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # scripts/seed.py's create_all may already have made it (without the row)
+    if not sa.inspect(op.get_bind()).has_table("catalog_generation"):
+        op.create_table(
+            "catalog_generation",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("generation", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    op.execute(
+        "INSERT INTO catalog_generation (id, generation) SELECT 1, 0 "
+        "WHERE NOT EXISTS (SELECT 1 FROM catalog_generation WHERE id = 1)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_generation")
@@ -0,0 +1,144 @@
+"""Key the SQLite search index by a stable id instead of lectures' implicit rowid
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 10:40:00.000000
+
+``lectures`` has a UUID primary key, so its rowid is implicit and ``VACUUM``
+may renumber it, leaving the FTS5 index pointing at the wrong lectures.
+``lecture_search_ids`` gives each indexed lecture an ``INTEGER PRIMARY KEY``
+(which is its rowid, and never renumbered); the index is external content
+over a view that joins it to ``lectures``, so the text is still stored once.
+PostgreSQL's generated column is unaffected.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DROP_SEARCH = [
+    "DROP TRIGGER lectures_search_update",
+    "DROP TRIGGER lectures_search_delete",
+    "DROP TRIGGER lectures_search_insert",
+    "DROP TABLE lecture_search",
+]
+
+_SEARCH_ID = "(SELECT id FROM lecture_search_ids WHERE lecture_id = {row}.id)"
+
+UPGRADE = [
+    *_DROP_SEARCH,
+    """
+    CREATE TABLE lecture_search_ids (
+        id INTEGER PRIMARY KEY,
+        lecture_id CHAR(32) NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIEW lecture_search_content AS
+    SELECT lecture_search_ids.id AS search_id, lectures.title, lectures.transcript
+    FROM lecture_search_ids JOIN lectures ON lectures.id = lecture_search_ids.lecture_id
+    """,
+    """
+    CREATE VIRTUAL TABLE lecture_search USING fts5(
+        title, transcript,
+        content='lecture_search_content', content_rowid='search_id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER lectures_search_insert AFTER INSERT ON lectures
+    WHEN new.status = 'ready' BEGIN
+        INSERT OR IGNORE INTO lecture_search_ids(lecture_id) VALUES (new.id);
+        INSERT INTO lecture_search(rowid, title, transcript)
+        VALUES ({_SEARCH_ID.format(row="new")}, new.title, new.transcript);
+    END
+    """,
+    f"""
+    CREATE TRIGGER lectures_search_delete AFTER DELETE ON lectures BEGIN
+        INSERT INTO lecture_search(lecture_search, rowid, title, transcript)
+        SELECT 'delete', {_SEARCH_ID.format(row="old")}, old.title, old.transcript
+        WHERE old.status = 'ready';
+        DELETE FROM lecture_search_ids WHERE lecture_id = old.id;
+    END
+    """,
+    # One trigger so the old entry is always removed before the new one is added
+    f"""
+    CREATE TRIGGER lectures_search_update AFTER UPDATE OF title, transcript, status ON lectures
+    BEGIN
+        INSERT INTO lecture_search(lecture_search, rowid, title, transcript)
+        SELECT 'delete', {_SEARCH_ID.format(row="old")}, old.title, old.transcript
+        WHERE old.status = 'ready';
+        INSERT OR IGNORE INTO lecture_search_ids(lecture_id)
+        SELECT new.id WHERE new.status = 'ready';
+        INSERT INTO lecture_search(rowid, title, transcript)
+        SELECT {_SEARCH_ID.format(row="new")}, new.title, new.transcript
+        WHERE new.status = 'ready';
+    END
+    """,
+    # Oldest first, so newer lectures keep getting higher ids
+    """
+    INSERT INTO lecture_search_ids(lecture_id)
+    SELECT id FROM lectures WHERE status = 'ready' ORDER BY rowid
+    """,
+    """
+    INSERT INTO lecture_search(rowid, title, transcript)
+    SELECT search_id, title, transcript FROM lecture_search_content
+    """,
+]
+
+DOWNGRADE = [
+    *_DROP_SEARCH,
+    "DROP VIEW lecture_search_content",
+    "DROP TABLE lecture_search_ids",
+    """
+    CREATE VIRTUAL TABLE lecture_search USING fts5(
+        title, transcript,
+        content='lectures', content_rowid='rowid',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER lectures_search_insert AFTER INSERT ON lectures
+    WHEN new.status = 'ready' BEGIN
+        INSERT INTO lecture_search(rowid, title, transcript)
+        VALUES (new.rowid, new.title, new.transcript);
+    END
+    """,
+    """
+    CREATE TRIGGER lectures_search_delete AFTER DELETE ON lectures
+    WHEN old.status = 'ready' BEGIN
+        INSERT INTO lecture_search(lecture_search, rowid, title, transcript)
+        VALUES ('delete', old.rowid, old.title, old.transcript);
+    END
+    """,
+    """
+    CREATE TRIGGER lectures_search_update AFTER UPDATE OF title, transcript, status ON lectures
+    BEGIN
+        INSERT INTO lecture_search(lecture_search, rowid, title, transcript)
+        SELECT 'delete', old.rowid, old.title, old.transcript WHERE old.status = 'ready';
+        INSERT INTO lecture_search(rowid, title, transcript)
+        SELECT new.rowid, new.title, new.transcript WHERE new.status = 'ready';
+    END
+    """,
+    """
+    INSERT INTO lecture_search(rowid, title, transcript)
+    SELECT rowid, title, transcript FROM lectures WHERE status = 'ready'
+    """,
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in UPGRADE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in DOWNGRADE:
+            op.execute(statement)
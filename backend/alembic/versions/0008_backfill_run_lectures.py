@@ -0,0 +1,79 @@
+"""Backfill run membership as rows instead of a JSON list
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 11:20:00.000000
+
+``backfill_runs.lecture_ids`` was a JSON array rewritten whole every time a
+resumed run gained lectures, and read whole to count progress.
+``backfill_run_lectures`` holds one row per (run, lecture) instead.
+"""
+import json
+import uuid
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_runs = sa.table(
+    "backfill_runs",
+    sa.column("id", sa.Uuid()),
+    sa.column("lecture_ids", sa.Text()),
+)
+_run_lectures = sa.table(
+    "backfill_run_lectures",
+    sa.column("backfill_id", sa.Uuid()),
+    sa.column("lecture_id", sa.Uuid()),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    members = []
+    if any(c["name"] == "lecture_ids" for c in inspector.get_columns("backfill_runs")):
+        for run_id, lecture_ids in bind.execute(sa.select(_runs.c.id, _runs.c.lecture_ids)):
+            members.extend(
+                {"backfill_id": run_id, "lecture_id": uuid.UUID(lecture_id)}
+                for lecture_id in dict.fromkeys(json.loads(lecture_ids or "[]"))
+            )
+        with op.batch_alter_table("backfill_runs") as batch_op:
+            batch_op.drop_column("lecture_ids")
+
+    # scripts/seed.py's create_all may already have made it
+    if not inspector.has_table("backfill_run_lectures"):
+        op.create_table(
+            "backfill_run_lectures",
+            sa.Column("backfill_id", sa.Uuid(), nullable=False),
+            sa.Column("lecture_id", sa.Uuid(), nullable=False),
+            sa.ForeignKeyConstraint(["backfill_id"], ["backfill_runs.id"]),
+            sa.ForeignKeyConstraint(["lecture_id"], ["lectures.id"]),
+            sa.PrimaryKeyConstraint("backfill_id", "lecture_id"),
+        )
+    if members:
+        op.bulk_insert(_run_lectures, members)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    lecture_ids: dict[uuid.UUID, list[str]] = {}
+    for run_id, lecture_id in bind.execute(
+        sa.select(_run_lectures.c.backfill_id, _run_lectures.c.lecture_id)
+    ):
+        lecture_ids.setdefault(run_id, []).append(str(lecture_id))
+    op.drop_table("backfill_run_lectures")
+
+    with op.batch_alter_table("backfill_runs") as batch_op:
+        batch_op.add_column(
+            sa.Column("lecture_ids", sa.Text(), nullable=False, server_default="[]")
+        )
+    for run_id, ids in lecture_ids.items():
+        bind.execute(
+            _runs.update().where(_runs.c.id == run_id).values(lecture_ids=json.dumps(ids))
+        )
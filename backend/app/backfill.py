@@ -0,0 +1,179 @@
+"""Bulk audio backfill: synthesize audio for every ready lecture that lacks it.
+
+    python -m app.backfill                          # all courses
+    python -m app.backfill --course <id>            # one course
+    python -m app.backfill --thinker <id> -c 4      # one thinker, four lectures at a time
+    python -m app.backfill --dry-run                # list what would be synthesized
+
+Lectures are queued as audio jobs (see ``app.services.backfill``) and this
+process runs ``--concurrency`` workers that only take audio jobs until the
+run is finished. Stopping it (Ctrl-C, or a crash) loses nothing: running the
+same command again resumes the run and queues only the lectures still
+without audio. Progress and throughput are logged as it goes.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+import uuid
+
+from app.config import settings
+from app.db.migrations import upgrade_database
+from app.db.session import async_session, engine
+from app.models import BackfillRun
+from app.services import metrics, tracing
+from app.services.backfill import (
+    backfill_throughput,
+    find_lectures_missing_audio,
+    open_backfill,
+    refresh_backfill,
+)
+from app.services.http_client import close_http_client, init_http_client
+from app.services.job_queue import JOB_AUDIO
+from app.services.response_cache import close_response_cache
+from app.worker import worker_loop
+
+logger = logging.getLogger("app.backfill")
+
+
+async def _refresh(run_id: uuid.UUID) -> BackfillRun:
+    async with async_session() as session:
+        run = await session.get(BackfillRun, run_id)
+        await refresh_backfill(session, run)
+        await session.commit()
+        return run
+
+
+async def _report_loop(
+    run: BackfillRun, stop: asyncio.Event, interval: float
+) -> BackfillRun:
+    """Log progress every ``interval`` seconds; set ``stop`` once the run is finished."""
+    session_start = time.monotonic()
+    start_completed, start_chars = run.completed, run.completed_chars
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        run = await _refresh(run.id)
+        minutes = max(time.monotonic() - session_start, 1e-9) / 60
+        logger.info(
+            "Backfill %s: %d/%d lectures done, %d failed — %.2f lectures/min, %.0f chars/min",
+            run.id,
+            run.completed,
+            run.total,
+            run.failed,
+            (run.completed - start_completed) / minutes,
+            (run.completed_chars - start_chars) / minutes,
+        )
+        if run.status != "running":
+            stop.set()
+    return run
+
+
+async def run_backfill(
+    course_id: uuid.UUID | None,
+    thinker_id: uuid.UUID | None,
+    concurrency: int,
+    report_interval: float,
+    dry_run: bool = False,
+) -> None:
+    if settings.db_auto_migrate:
+        await upgrade_database()
+
+    try:
+        async with async_session() as session:
+            if dry_run:
+                missing = await find_lectures_missing_audio(session, course_id, thinker_id)
+                for lecture_id, chars in missing:
+                    print(f"{lecture_id}  {chars:>8} chars")
+                print(f"{len(missing)} lectures, {sum(c for _, c in missing)} chars")
+                return
+            run = await open_backfill(session, course_id, thinker_id)
+            await session.commit()
+        logger.info(
+            "Backfill %s: %d lectures (%d chars), %d already done",
+            run.id, run.total, run.total_chars, run.completed,
+        )
+        if run.status != "running":
+            return
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:  # Windows
+                pass
+
+        await init_http_client()
+        base_id = f"{socket.gethostname()}:{os.getpid()}:backfill"
+        try:
+            # Workers keep polling until the reporter sees the run finish, so jobs a
+            # crashed earlier run left "running" are picked up once their lease expires
+            results = await asyncio.gather(
+                _report_loop(run, stop, report_interval),
+                *(
+                    worker_loop(f"{base_id}:{i}", stop, kinds=(JOB_AUDIO,))
+                    for i in range(concurrency)
+                ),
+                metrics.write_snapshots(stop),
+            )
+        finally:
+            await close_http_client()
+            await close_response_cache()
+            await asyncio.to_thread(tracing.shutdown_tracing)
+
+        run = results[0]
+        throughput = backfill_throughput(run)
+        logger.info(
+            "Backfill %s %s: %d/%d lectures, %d failed in %.0f s "
+            "(%.2f lectures/min, %.0f chars/min overall)",
+            run.id,
+            run.status,
+            run.completed,
+            run.total,
+            run.failed,
+            throughput.elapsed_seconds,
+            throughput.lectures_per_minute,
+            throughput.chars_per_minute,
+        )
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Synthesize audio for ready lectures that have none."
+    )
+    parser.add_argument("--course", type=uuid.UUID, help="Only lectures of this course")
+    parser.add_argument("--thinker", type=uuid.UUID, help="Only lectures of this thinker")
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=settings.backfill_concurrency,
+        help="Lectures to synthesize at once",
+    )
+    parser.add_argument(
+        "--report-interval", type=float, default=10.0, help="Seconds between progress reports"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="List matching lectures without queuing them"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(
+        run_backfill(
+            args.course, args.thinker, args.concurrency, args.report_interval, args.dry_run
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
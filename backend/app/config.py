@@ -4,19 +4,94 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # Database — defaults to SQLite for local dev; set DATABASE_URL for PostgreSQL in production
     database_url: str = "sqlite+aiosqlite:///./symposium.db"
+    db_echo: bool = False  # log every SQL statement (independent of APP_DEBUG)
+    db_auto_migrate: bool = True  # run "alembic upgrade head" when the API or a worker starts
+    db_profile: str = "tuned"  # "tuned" applies the settings below; "default" uses driver defaults
+    # SQLite (applied on every new connection)
+    db_sqlite_wal: bool = True  # journal_mode=WAL: readers don't block on the writer
+    db_sqlite_synchronous: str = "NORMAL"  # safe with WAL; FULL fsyncs every commit
+    db_sqlite_mmap_size: int = 256 * 1024**2
+    db_sqlite_cache_size: int = -64 * 1024  # negative = KiB per connection (64 MiB)
+    db_sqlite_busy_timeout_ms: int = 5000  # wait this long for a write lock before failing
+    # PostgreSQL connection pool
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800  # seconds before a pooled connection is replaced
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 500  # asyncpg prepared statements per connection (0: pgbouncer)
 
     # GitHub Models API
     github_token: str = ""
     github_models_endpoint: str = "https://models.inference.ai.azure.com/chat/completions"
     default_model: str = "gpt-4o-mini"
+    llm_stream: bool = True  # stream tokens into the lecture row as they arrive
+    llm_stop_at_words: int = 0  # end the stream at a sentence break past this many words (0 = off)
+    transcript_flush_interval: float = 0.5  # seconds between partial transcript writes
+    transcript_stream_poll_interval: float = 0.5  # SSE endpoint poll interval
+
+    # Shared upstream HTTP client (GitHub Models, OpenAI)
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 30.0  # seconds an idle connection stays pooled
+    http2: bool = False  # requires the "http2" extra
+    http_connect_timeout: float = 10.0
+    http_read_timeout: float = 120.0
+    http_write_timeout: float = 30.0
+    http_pool_timeout: float = 30.0
 
     # OpenAI TTS
     openai_api_key: str = ""
-    tts_provider: str = "edge-tts"  # "azure", "openai", or "edge-tts"
+    openai_tts_concurrency: int = 4  # chunk requests in flight per lecture
+    tts_provider: str = "edge-tts"  # "azure", "openai", "edge-tts", or "fake" (offline)
 
     # Azure Speech
     azure_speech_key: str = ""
     azure_speech_region: str = "eastus"
+    azure_tts_concurrency: int = 4  # chunks synthesized in parallel (and warm synthesizers kept)
+
+    # Offline fake TTS (TTS_PROVIDER=fake), for benchmarks and local development
+    fake_tts_profile: str = "azure"  # chunking and pacing to imitate: "edge-tts", "azure", "openai"
+    fake_tts_latency: float = 0.3  # seconds before a chunk's first audio
+    fake_tts_chars_per_second: float = 250.0  # synthesis speed of one chunk stream
+    fake_tts_failure_rate: float = 0.0  # probability that a chunk fails
+
+    # Generation worker (python -m app.worker)
+    worker_concurrency: int = 1
+    worker_poll_interval: float = 1.0  # seconds between queue polls when idle
+    worker_embedded: bool = False  # also run a worker inside the API process
+    job_heartbeat_interval: float = 10.0
+    job_lease_seconds: float = 120.0  # requeue running jobs with no heartbeat for this long
+    job_max_attempts: int = 3
+    backfill_concurrency: int = 2  # lectures synthesized at once by python -m app.backfill
+
+    # Synthesized audio cache (shared by all TTS providers)
+    audio_cache_enabled: bool = True
+    audio_cache_dir: str = ""  # defaults to backend/audio_cache
+    audio_cache_max_bytes: int = 2 * 1024**3
+
+    # Read-through cache of catalog responses (thinkers, courses, lectures)
+    response_cache_enabled: bool = True
+    response_cache_ttl: float = 300.0  # seconds
+    response_cache_max_entries: int = 1024
+    response_cache_url: str = ""  # e.g. redis://localhost:6379/0 to share it (needs "cache" extra)
+    response_cache_generation_poll: float = 1.0  # seconds between catalog generation reads
+    response_cache_warm: bool = True  # prefill thinker and course responses at startup
+
+    # List endpoints (keyset pagination)
+    page_size_default: int = 50
+    page_size_max: int = 500
+
+    # Prometheus metrics (GET /metrics)
+    metrics_enabled: bool = True
+    metrics_multiproc_dir: str = ""  # shared by all processes on a node to aggregate their metrics
+    metrics_flush_interval: float = 5.0  # seconds between snapshots written there
+
+    # Generation pipeline tracing (per-job stage breakdowns are always stored)
+    tracing_exporter: str = ""  # "file" (OTLP/JSON lines) or "otlp" (OTLP/HTTP collector)
+    tracing_file: str = ""  # defaults to backend/traces.jsonl
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    tracing_service_name: str = "synthetic-symposium"
 
     # Admin
     admin_api_key: str = ""
@@ -0,0 +1,47 @@
+"""Bring the database schema up to date with Alembic.
+
+The API, the worker and the backfill CLI call :func:`upgrade_database` at
+startup (unless ``DB_AUTO_MIGRATE=false``), so indexes and constraints added
+in ``alembic/versions`` reach every deployment, not just fresh databases.
+A database created by ``create_all`` before migrations existed has tables
+but no ``alembic_version``; it is stamped at the initial revision first, and
+the later revisions skip what ``create_all`` already made.
+"""
+
+import logging
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+INITIAL_REVISION = "0001"
+
+
+def alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    return config
+
+
+def _upgrade(connection: Connection) -> None:
+    config = alembic_config()
+    config.attributes["connection"] = connection
+    tables = set(inspect(connection).get_table_names())
+    if "thinkers" in tables and "alembic_version" not in tables:
+        logger.info("Stamping a create_all database at revision %s", INITIAL_REVISION)
+        command.stamp(config, INITIAL_REVISION)
+    command.upgrade(config, "head")
+
+
+async def upgrade_database(db_engine: AsyncEngine = engine) -> None:
+    """Run ``alembic upgrade head`` on ``db_engine``."""
+    async with db_engine.begin() as conn:
+        await conn.run_sync(_upgrade)
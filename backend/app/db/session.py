@@ -1,10 +1,90 @@
+"""Async engine and session factory.
+
+With ``DB_PROFILE=tuned`` (the default) SQLite connections run in WAL mode
+with ``synchronous=NORMAL``, memory-mapped reads, a larger page cache and a
+busy timeout, so page views keep reading while the worker writes transcripts
+and audio status. PostgreSQL gets an explicitly sized pool with pre-ping and
+recycling, plus asyncpg's prepared statement cache size. ``DB_PROFILE=default``
+leaves every driver default alone. SQL logging is ``DB_ECHO``, not
+``APP_DEBUG``. Every engine's statements are timed for ``/metrics`` unless
+``METRICS_ENABLED=false``.
+"""
+
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import settings
+from app.services.metrics import instrument_engine
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+def _sqlite_pragmas() -> list[str]:
+    synchronous = settings.db_sqlite_synchronous.upper()
+    if synchronous not in _SYNCHRONOUS_MODES:
+        raise ValueError(f"DB_SQLITE_SYNCHRONOUS must be one of {', '.join(_SYNCHRONOUS_MODES)}")
+    pragmas = [
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA mmap_size={int(settings.db_sqlite_mmap_size)}",
+        f"PRAGMA cache_size={int(settings.db_sqlite_cache_size)}",
+        f"PRAGMA busy_timeout={int(settings.db_sqlite_busy_timeout_ms)}",
+    ]
+    if settings.db_sqlite_wal:
+        pragmas.insert(0, "PRAGMA journal_mode=WAL")
+    return pragmas
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return {}
+    options: dict[str, Any] = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if parsed.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.db_statement_cache_size
+        }
+    return options
+
+
+def build_engine(url: str, profile: str | None = None) -> AsyncEngine:
+    """Create an engine for ``url`` with the ``tuned`` or ``default`` profile."""
+    profile = profile or settings.db_profile
+    if profile not in ("tuned", "default"):
+        raise ValueError(f"Unknown DB_PROFILE {profile!r} (expected 'tuned' or 'default')")
+    options = _engine_options(url) if profile == "tuned" else {}
+    new_engine = create_async_engine(url, echo=settings.db_echo, **options)
+    if settings.metrics_enabled:
+        instrument_engine(new_engine.sync_engine)
+
+    if profile == "tuned" and new_engine.dialect.name == "sqlite":
+        pragmas = _sqlite_pragmas()
+
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection, _record) -> None:
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    return new_engine
+
 
-engine = create_async_engine(settings.database_url, echo=settings.app_debug)
+engine = build_engine(settings.database_url)
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -1,4 +1,7 @@
+import asyncio
+import logging
 import os
+import socket
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -6,23 +9,68 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
-from app.db.base import Base
-from app.db.session import engine
-from app.routers import courses, health, lectures, thinkers
+from app.db.migrations import upgrade_database
+from app.db.session import async_session
+from app.routers import audio, courses, health, jobs, lectures, thinkers
+from app.services import metrics, tracing
+from app.services.http_client import close_http_client, init_http_client
+from app.services.pagination import NEXT_CURSOR_HEADER
+from app.services.response_cache import close_response_cache
+from app.services.transcript_search import SEARCH_TRUNCATED_HEADER
 
 # Ensure all models are imported so Base.metadata knows about them
 import app.models.thinker  # noqa: F401
 import app.models.discipline  # noqa: F401
 import app.models.course  # noqa: F401
 import app.models.lecture  # noqa: F401
+import app.models.job  # noqa: F401
+import app.models.backfill  # noqa: F401
+import app.models.generation_timing  # noqa: F401
+import app.models.catalog_generation  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_response_cache() -> None:
+    """Prefill cached catalog responses so the first page views skip the database."""
+    try:
+        async with async_session() as session:
+            await thinkers.warm_cache(session)
+            await courses.warm_cache(session)
+    except Exception:
+        logger.warning("Could not warm the response cache", exc_info=True)
 
 
 @asynccontextmanager
 async def lifespan(application: FastAPI):
-    # Create tables on startup (safe no-op if they already exist)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Apply pending migrations on startup (a no-op when the schema is current)
+    if settings.db_auto_migrate:
+        await upgrade_database()
+
+    await init_http_client()
+    if settings.response_cache_enabled and settings.response_cache_warm:
+        await warm_response_cache()
+
+    # Optionally process generation jobs in-process (single-node deploys without
+    # a separate `python -m app.worker`)
+    stop = asyncio.Event()
+    worker_tasks = []
+    if settings.worker_embedded:
+        from app.worker import worker_loop
+
+        base_id = f"{socket.gethostname()}:{os.getpid()}:api"
+        worker_tasks = [
+            asyncio.create_task(worker_loop(f"{base_id}:{i}", stop))
+            for i in range(settings.worker_concurrency)
+        ]
+    # Share this process's metrics with the others on the node (METRICS_MULTIPROC_DIR)
+    worker_tasks.append(asyncio.create_task(metrics.write_snapshots(stop)))
     yield
+    stop.set()
+    await asyncio.gather(*worker_tasks, return_exceptions=True)
+    await close_http_client()
+    await close_response_cache()
+    await asyncio.to_thread(tracing.shutdown_tracing)
 
 
 def create_app() -> FastAPI:
@@ -39,17 +87,19 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, SEARCH_TRUNCATED_HEADER],
     )
+    if settings.metrics_enabled:
+        # Outermost, so latency includes the other middleware
+        application.add_middleware(metrics.MetricsMiddleware)
 
     application.include_router(health.router)
     application.include_router(thinkers.router)
     application.include_router(courses.router)
     application.include_router(lectures.router)
-
-    # Serve generated audio files
-    audio_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "audio")
-    os.makedirs(audio_dir, exist_ok=True)
-    application.mount("/audio", StaticFiles(directory=audio_dir), name="audio")
+    application.include_router(jobs.router)
+    # Serve generated audio files and word timings
+    application.include_router(audio.router)
 
     # Serve static assets (thinker images, etc.)
     static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
@@ -1,6 +1,11 @@
+from app.models.backfill import BackfillRun, BackfillRunLecture
+from app.models.catalog_generation import CatalogGeneration
 from app.models.course import Course
 from app.models.discipline import Discipline
+from app.models.generation_timing import GenerationTiming
+from app.models.job import GenerationJob
 from app.models.lecture import Lecture
 from app.models.thinker import Thinker
 
-__all__ = ["Thinker", "Discipline", "Course", "Lecture"]
+__all__ = ["Thinker", "Discipline", "Course", "Lecture", "GenerationJob", "BackfillRun",
+           "BackfillRunLecture", "GenerationTiming", "CatalogGeneration"]
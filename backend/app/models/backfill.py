@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Uuid, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class BackfillRun(Base):
+    """A bulk audio backfill and when it ran; its lectures are ``BackfillRunLecture`` rows.
+
+    Per-lecture progress lives on the lectures (``audio_url``) and their audio
+    jobs, so an interrupted run is resumed by reopening this row.
+    """
+
+    __tablename__ = "backfill_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(), primary_key=True, default=uuid.uuid4)
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="running")
+    course_id: Mapped[uuid.UUID | None] = mapped_column(Uuid(), nullable=True)
+    thinker_id: Mapped[uuid.UUID | None] = mapped_column(Uuid(), nullable=True)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_chars: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_chars: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<BackfillRun(status='{self.status}', {self.completed}/{self.total})>"
+
+
+class BackfillRunLecture(Base):
+    """A lecture covered by a backfill run."""
+
+    __tablename__ = "backfill_run_lectures"
+
+    backfill_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(), ForeignKey("backfill_runs.id"), primary_key=True
+    )
+    lecture_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(), ForeignKey("lectures.id"), primary_key=True
+    )
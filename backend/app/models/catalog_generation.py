@@ -0,0 +1,20 @@
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class CatalogGeneration(Base):
+    """How many times the catalog has changed; a single row with ``id = 1``.
+
+    Every process that caches catalog responses polls it, so a change
+    committed by a worker or a backfill reaches the API's response cache.
+    """
+
+    __tablename__ = "catalog_generation"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<CatalogGeneration({self.generation})>"
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -8,6 +8,12 @@ from app.db.base import Base
 
 class Course(Base):
     __tablename__ = "courses"
+    __table_args__ = (
+        # Keyset pagination order (see app.services.pagination)
+        Index("ix_courses_title_id", "title", "id"),
+        Index("ix_courses_thinker_title_id", "thinker_id", "title", "id"),
+        Index("ix_courses_discipline_title_id", "discipline_id", "title", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(), primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(300), nullable=False)
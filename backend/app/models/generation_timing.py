@@ -0,0 +1,43 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, Uuid, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class GenerationTiming(Base):
+    """Where one generation job's time went, per pipeline stage.
+
+    ``stages`` is the job's span breakdown as JSON:
+    ``{"tts.azure.chunk": {"count": 12, "total_ms": 81234.5, "max_ms": 9120.3,
+    "wall_ms": 30511.8}, ...}`` (rows stored before ``wall_ms`` was added lack it).
+    """
+
+    __tablename__ = "generation_timings"
+    __table_args__ = (
+        Index("ix_generation_timings_lecture_created", "lecture_id", "created_at"),
+        Index("ix_generation_timings_backfill_total", "backfill_id", "total_ms"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(), primary_key=True, default=uuid.uuid4)
+    lecture_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(), ForeignKey("lectures.id"), nullable=False
+    )
+    job_id: Mapped[uuid.UUID | None] = mapped_column(
+        Uuid(), ForeignKey("generation_jobs.id"), nullable=True
+    )
+    backfill_id: Mapped[uuid.UUID | None] = mapped_column(Uuid(), nullable=True)
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)  # job kind
+    status: Mapped[str] = mapped_column(String(50), nullable=False)  # "succeeded" or "failed"
+    trace_id: Mapped[str] = mapped_column(String(32), nullable=False)
+    total_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    stages: Mapped[str] = mapped_column(Text, nullable=False, default="{}")  # JSON
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<GenerationTiming(kind='{self.kind}', total_ms={self.total_ms:.0f})>"
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Uuid, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -9,6 +9,13 @@ from app.db.base import Base
 
 class Lecture(Base):
     __tablename__ = "lectures"
+    __table_args__ = (
+        # Keyset pagination order (see app.services.pagination)
+        Index("ix_lectures_sequence_id", "sequence_number", "id"),
+        # Also serves lookups by course_id alone (backfill, course pages)
+        Index("ix_lectures_course_sequence_id", "course_id", "sequence_number", "id"),
+        Index("ix_lectures_status_sequence_id", "status", "sequence_number", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(), primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(300), nullable=False)
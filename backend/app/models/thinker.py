@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import String, Text, Uuid
+from sqlalchemy import ForeignKey, Index, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -8,6 +8,11 @@ from app.db.base import Base
 
 class Thinker(Base):
     __tablename__ = "thinkers"
+    __table_args__ = (
+        # Keyset pagination order (see app.services.pagination)
+        Index("ix_thinkers_name_id", "name", "id"),
+        Index("ix_thinkers_discipline_name_id", "discipline_id", "name", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -23,7 +28,7 @@ class Thinker(Base):
     image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     discipline_id: Mapped[uuid.UUID | None] = mapped_column(
-        Uuid(), nullable=True
+        Uuid(), ForeignKey("disciplines.id"), nullable=True
     )
 
     courses: Mapped[list["Course"]] = relationship(back_populates="thinker")  # noqa: F821
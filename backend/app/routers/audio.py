@@ -0,0 +1,127 @@
+"""Serve lecture audio and word timings.
+
+``GET /audio/{lecture_id}.{fingerprint}.mp3`` is the URL stored in
+``Lecture.audio_url``. Because the fingerprint names the exact bytes, it and
+its sibling ``.json`` timings URL are served with ``immutable`` caching; the
+unfingerprinted names older lectures still reference must be revalidated.
+Every response carries a strong content-hash ETag (``If-None-Match`` ->
+304), and Range/If-Range requests get 206 partial content for seeking.
+Files go out through ``FileResponse``, which uses the ASGI ``pathsend``
+extension for zero-copy sends when the server offers it.
+
+Timings are content-negotiated: clients that list ``COMPACT_MEDIA_TYPE`` in
+``Accept`` get the compact binary encoding (JSON otherwise), and a
+precompressed brotli/gzip copy is sent when ``Accept-Encoding`` allows it.
+"""
+
+import asyncio
+import os
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+
+from app.services.audio_assets import file_fingerprint, lecture_audio_path, parse_audio_name
+from app.services.audio_writer import (
+    COMPACT_SUFFIX,
+    ENCODED_SUFFIXES,
+    JSON_SUFFIX,
+    ensure_timings_variants,
+)
+from app.services.word_timings import COMPACT_MEDIA_TYPE
+
+router = APIRouter(prefix="/audio", tags=["audio"])
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def _qualities(header: str | None) -> dict[str, float]:
+    """Parse an ``Accept``/``Accept-Encoding`` header into ``{token: q}``."""
+    result: dict[str, float] = {}
+    for item in (header or "").split(","):
+        token, _, params = item.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        result[token.strip().lower()] = q
+    return result
+
+
+def _pick_encoding(path: str, accept_encoding: str | None) -> tuple[str, str | None]:
+    """Return the best precompressed sibling of ``path`` the client accepts."""
+    accepted = _qualities(accept_encoding)
+    for suffix, coding in ENCODED_SUFFIXES:
+        if accepted.get(coding, accepted.get("*", 0.0)) > 0 and os.path.exists(path + suffix):
+            return path + suffix, coding
+    return path, None
+
+
+async def _pick_timings(json_path: str, request: Request) -> tuple[str, str]:
+    """Choose the compact or JSON timings file for this request's ``Accept``."""
+    accept = _qualities(request.headers.get("accept"))
+    compact_q = accept.get(COMPACT_MEDIA_TYPE, 0.0)
+    if compact_q > 0 and compact_q >= accept.get("application/json", 0.0):
+        compact_path = json_path[: -len(JSON_SUFFIX)] + COMPACT_SUFFIX
+        if not os.path.exists(compact_path):
+            # Timings generated before the compact encoding existed
+            await asyncio.to_thread(ensure_timings_variants, json_path)
+        if os.path.exists(compact_path):
+            return compact_path, COMPACT_MEDIA_TYPE
+    return json_path, "application/json"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as RFC 9110 specifies for If-None-Match."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
+@router.api_route("/{filename}", methods=["GET", "HEAD"])
+async def get_audio_file(filename: str, request: Request):
+    parsed = parse_audio_name(filename)
+    if parsed is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    lecture_id, fingerprint, ext = parsed
+
+    mp3_path = lecture_audio_path(lecture_id)
+    path = lecture_audio_path(lecture_id, ext)
+    try:
+        if fingerprint is not None:
+            # A stale fingerprint names audio that has since been regenerated
+            current = await asyncio.to_thread(file_fingerprint, mp3_path)
+            if current != fingerprint or not os.path.exists(path):
+                raise HTTPException(status_code=404, detail="Not found")
+
+        headers = {
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL if fingerprint else REVALIDATE_CACHE_CONTROL,
+        }
+        media_type = "audio/mpeg"
+        if ext == "json":
+            path, media_type = await _pick_timings(path, request)
+            path, coding = _pick_encoding(path, request.headers.get("accept-encoding"))
+            headers["Vary"] = "Accept, Accept-Encoding"
+            if coding:
+                headers["Content-Encoding"] = coding
+        else:
+            headers["Accept-Ranges"] = "bytes"
+
+        # Each representation (format x encoding) gets its own strong validator
+        headers["ETag"] = f'"{await asyncio.to_thread(file_fingerprint, path)}"'
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Not found")
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
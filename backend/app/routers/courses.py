@@ -1,50 +1,118 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.config import settings
 from app.db.session import get_db
 from app.models.course import Course
-from app.models.thinker import Thinker  # noqa: F401 — needed for selectinload
+from app.models.thinker import Thinker
 from app.schemas.course import CourseCreate, CourseResponse
+from app.services.pagination import Page, fetch_page
+from app.services.response_cache import cache_key, invalidate_catalog, read_through
+from app.services.sparse_fields import (
+    fields_key,
+    list_adapter,
+    project,
+    requested_fields,
+    schema_columns,
+)
 
 router = APIRouter(prefix="/api/courses", tags=["courses"])
 
+_COURSE = TypeAdapter(CourseResponse)
+
+
+def _course_select(schema: type[BaseModel] = CourseResponse):
+    """Core select of the course columns ``schema`` needs, joined to the thinker's name."""
+    columns = schema_columns(Course, schema, extra=("title",))
+    if "thinker_name" not in schema.model_fields:
+        return select(*columns)
+    return select(*columns, Thinker.name.label("thinker_name")).outerjoin(
+        Thinker, Course.thinker_id == Thinker.id
+    )
+
+
+async def _load_courses(
+    db: AsyncSession,
+    schema: type[BaseModel],
+    limit: int,
+    cursor: str | None = None,
+    thinker_id: uuid.UUID | None = None,
+    discipline_id: uuid.UUID | None = None,
+    difficulty_level: str | None = None,
+) -> Page:
+    query = _course_select(schema)
+    if thinker_id:
+        query = query.where(Course.thinker_id == thinker_id)
+    if discipline_id:
+        query = query.where(Course.discipline_id == discipline_id)
+    if difficulty_level:
+        query = query.where(Course.difficulty_level == difficulty_level)
+    return await fetch_page(
+        db, query, (Course.title, Course.id), limit, cursor, "courses", scalars=False
+    )
+
+
+async def _load_course(db: AsyncSession, course_id: uuid.UUID) -> CourseResponse:
+    row = (await db.execute(_course_select().where(Course.id == course_id))).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return CourseResponse.model_validate(row)
+
+
+async def warm_cache(db: AsyncSession) -> None:
+    """Prefill the first page of courses and each of those courses' detail responses."""
+    adapter = list_adapter(CourseResponse)
+    limit = settings.page_size_default
+    courses = await read_through(
+        cache_key("list_courses", limit=limit),
+        adapter,
+        lambda: _load_courses(db, CourseResponse, limit),
+    )
+    for course in adapter.validate_json(courses.body):
+        await read_through(
+            cache_key("get_course", id=course.id), _COURSE, lambda: _load_course(db, course.id)
+        )
+
 
 @router.get("/", response_model=list[CourseResponse])
 async def list_courses(
-    thinker_id: uuid.UUID | None = None, db: AsyncSession = Depends(get_db)
+    thinker_id: uuid.UUID | None = None,
+    discipline_id: uuid.UUID | None = None,
+    difficulty_level: str | None = None,
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    cursor: str | None = Query(None, description="X-Next-Cursor from the previous page"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_db),
 ):
-    query = select(Course).options(selectinload(Course.thinker)).order_by(Course.title)
-    if thinker_id:
-        query = query.where(Course.thinker_id == thinker_id)
-    result = await db.execute(query)
-    courses = result.scalars().all()
-    response = []
-    for c in courses:
-        data = CourseResponse.model_validate(c)
-        if c.thinker:
-            data.thinker_name = c.thinker.name
-        response.append(data)
-    return response
+    """Courses by title, one page at a time (next page cursor in ``X-Next-Cursor``)."""
+    selected = requested_fields(fields, CourseResponse)
+    schema = project(CourseResponse, selected)
+    return await read_through(
+        cache_key(
+            "list_courses",
+            thinker_id=thinker_id,
+            discipline_id=discipline_id,
+            difficulty_level=difficulty_level,
+            limit=limit,
+            cursor=cursor,
+            fields=fields_key(selected),
+        ),
+        list_adapter(schema),
+        lambda: _load_courses(
+            db, schema, limit, cursor, thinker_id, discipline_id, difficulty_level
+        ),
+    )
 
 
 @router.get("/{course_id}", response_model=CourseResponse)
 async def get_course(course_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Course)
-        .options(selectinload(Course.lectures), selectinload(Course.thinker))
-        .where(Course.id == course_id)
+    return await read_through(
+        cache_key("get_course", id=course_id), _COURSE, lambda: _load_course(db, course_id)
     )
-    course = result.scalar_one_or_none()
-    if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    data = CourseResponse.model_validate(course)
-    if course.thinker:
-        data.thinker_name = course.thinker.name
-    return data
 
 
 @router.post("/", response_model=CourseResponse, status_code=201)
@@ -53,6 +121,8 @@ async def create_course(data: CourseCreate, db: AsyncSession = Depends(get_db)):
     db.add(course)
     await db.flush()
     await db.refresh(course)
+    await db.commit()
+    await invalidate_catalog()
     return course
 
 
@@ -62,3 +132,5 @@ async def delete_course(course_id: uuid.UUID, db: AsyncSession = Depends(get_db)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
     await db.delete(course)
+    await db.commit()
+    await invalidate_catalog()
@@ -1,8 +1,52 @@
-from fastapi import APIRouter
+import asyncio
+from dataclasses import asdict
+
+from fastapi import APIRouter, Header, HTTPException, Response
+
+from app.config import settings
+from app.routers.lectures import _require_admin
+from app.services import audio_cache, metrics, response_cache
 
 router = APIRouter(tags=["health"])
 
 
+def _cache_metrics() -> dict:
+    families = {
+        **metrics.stats_callback("response_cache", "Catalog response cache", response_cache.stats),
+        **metrics.stats_callback("audio_cache", "Synthesized audio cache", audio_cache.stats),
+    }
+    families["response_cache_entries"] = {
+        "type": "gauge",
+        "help": "Entries in this process's catalog response cache",
+        "labels": [],
+        "samples": [[[], response_cache.cache_size()]],
+    }
+    return families
+
+
+metrics.REGISTRY.register_callback(_cache_metrics)
+
+
 @router.get("/health")
 async def health_check():
     return {"status": "ok", "service": "synthetic-symposium"}
+
+
+@router.get("/health/cache")
+async def cache_stats():
+    """Hit/miss counters for the catalog response cache."""
+    stats = asdict(response_cache.stats)
+    lookups = stats["hits"] + stats["shared_hits"] + stats["misses"]
+    stats["hit_ratio"] = (stats["hits"] + stats["shared_hits"]) / lookups if lookups else 0.0
+    stats["entries"] = response_cache.cache_size()
+    return stats
+
+
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(x_admin_key: str | None = Header(None)):
+    """HTTP, database, LLM, TTS and cache metrics in the Prometheus text format. Admin only."""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    _require_admin(x_admin_key)
+    body = await asyncio.to_thread(metrics.exposition)
+    return Response(body, media_type=metrics.CONTENT_TYPE)
@@ -0,0 +1,42 @@
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.models.job import GenerationJob
+from app.schemas.job import JobResponse
+from app.services.sparse_fields import column_options, json_response, project, requested_fields
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+@router.get("/", response_model=list[JobResponse])
+async def list_jobs(
+    lecture_id: uuid.UUID | None = None,
+    status: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_db),
+):
+    schema = project(JobResponse, requested_fields(fields, JobResponse))
+    query = (
+        select(GenerationJob)
+        .options(*column_options(GenerationJob, schema))
+        .order_by(GenerationJob.created_at.desc())
+        .limit(100)
+    )
+    if lecture_id:
+        query = query.where(GenerationJob.lecture_id == lecture_id)
+    if status:
+        query = query.where(GenerationJob.status == status)
+    result = await db.execute(query)
+    return json_response(schema, result.scalars().all())
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    job = await db.get(GenerationJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
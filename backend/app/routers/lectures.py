@@ -1,19 +1,53 @@
+import asyncio
+import json
 import uuid
+from typing import Literal
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.config import settings
-from app.db.session import get_db
+from app.db.session import async_session, get_db
+from app.models.backfill import BackfillRun
 from app.models.course import Course
 from app.models.lecture import Lecture
-from app.schemas.lecture import LectureGenerateRequest, LectureResponse
-from app.services.lecture_generator import generate_lecture_transcript
+from app.models.thinker import Thinker
+from app.schemas.backfill import BackfillRequest, BackfillResponse
+from app.schemas.generation_timing import BackfillTimingsResponse, GenerationTimingResponse
+from app.schemas.job import JobResponse
+from app.schemas.lecture import (
+    LectureGenerateRequest,
+    LectureResponse,
+    LectureSummary,
+    LectureTimingsWindow,
+    TimedParagraph,
+    TranscriptSearchHit,
+    WordTiming,
+)
+from app.services.backfill import backfill_throughput, open_backfill, refresh_backfill
+from app.services.generation_timings import backfill_timings, lecture_generation_timings
+from app.services.job_queue import JOB_AUDIO, JOB_TRANSCRIPT, enqueue_job, find_active_job
+from app.services.pagination import fetch_page
+from app.services.response_cache import cache_key, invalidate_catalog, read_through
+from app.services.sparse_fields import (
+    column_options,
+    json_response,
+    list_adapter,
+    project,
+    requested_fields,
+    schema_columns,
+)
+from app.services.timings_index import load_timings_index
+from app.services.transcript_search import search_transcripts
 
 router = APIRouter(prefix="/api/lectures", tags=["lectures"])
 
+_LECTURE = TypeAdapter(LectureResponse)
+
 
 def _require_admin(x_admin_key: str | None):
     """Validate admin API key."""
@@ -21,65 +55,203 @@ def _require_admin(x_admin_key: str | None):
         raise HTTPException(status_code=403, detail="Admin access required")
 
 
-async def _generate_audio_for_lecture(transcript: str, thinker_name: str, lecture_id):
-    """Dispatch to the configured TTS provider."""
-    if settings.tts_provider == "azure":
-        from app.services.azure_tts_service import generate_audio
-    elif settings.tts_provider == "openai":
-        from app.services.openai_tts_service import generate_audio
-    else:
-        from app.services.tts_service import generate_audio
-    return await generate_audio(transcript, thinker_name, lecture_id)
-
-
-@router.get("/", response_model=list[LectureResponse])
+@router.get("/", response_model=list[LectureResponse] | list[LectureSummary])
 async def list_lectures(
-    course_id: uuid.UUID | None = None, db: AsyncSession = Depends(get_db)
+    course_id: uuid.UUID | None = None,
+    status: str | None = None,
+    view: Literal["full", "summary"] = "full",
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    cursor: str | None = Query(None, description="X-Next-Cursor from the previous page"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_db),
 ):
-    query = select(Lecture).order_by(Lecture.sequence_number)
+    """Lectures by sequence number, one page at a time (next cursor in ``X-Next-Cursor``).
+
+    ``view=summary`` leaves out transcripts (never read from the database).
+    """
+    base = LectureSummary if view == "summary" else LectureResponse
+    schema = project(base, requested_fields(fields, base))
+    query = select(Lecture).options(
+        *column_options(Lecture, schema, extra=("sequence_number",))
+    )
     if course_id:
         query = query.where(Lecture.course_id == course_id)
-    result = await db.execute(query)
-    return result.scalars().all()
+    if status:
+        query = query.where(Lecture.status == status)
+    page = await fetch_page(
+        db, query, (Lecture.sequence_number, Lecture.id), limit, cursor, "lectures"
+    )
+    return json_response(schema, page)
+
+
+@router.get("/search", response_model=list[TranscriptSearchHit])
+async def search_lectures(
+    q: str = Query(..., min_length=1, max_length=200),
+    course_id: uuid.UUID | None = None,
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    """Ranked transcript matches, each with the paragraph and audio offset to jump to.
+
+    ``X-Search-Truncated: true`` means there were too many matches to rank them all.
+    """
+    return await read_through(
+        cache_key("search_lectures", q=q, course_id=course_id, limit=limit),
+        list_adapter(TranscriptSearchHit),
+        lambda: search_transcripts(db, q, limit, course_id),
+    )
+
+
+# One joined select that returns exactly the LectureResponse columns
+_LECTURE_DETAIL = (
+    select(
+        *schema_columns(Lecture, LectureResponse),
+        Course.title.label("course_title"),
+        Thinker.name.label("thinker_name"),
+        Thinker.image_url.label("thinker_image_url"),
+    )
+    .outerjoin(Course, Lecture.course_id == Course.id)
+    .outerjoin(Thinker, Course.thinker_id == Thinker.id)
+)
+
+
+async def _load_lecture(db: AsyncSession, lecture_id: uuid.UUID) -> LectureResponse:
+    row = (await db.execute(_LECTURE_DETAIL.where(Lecture.id == lecture_id))).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Lecture not found")
+    return LectureResponse.model_validate(row)
 
 
 @router.get("/{lecture_id}", response_model=LectureResponse)
 async def get_lecture(lecture_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Lecture)
-        .options(selectinload(Lecture.course).selectinload(Course.thinker))
-        .where(Lecture.id == lecture_id)
+    # A transcript that is still streaming in changes every flush, so it isn't cached
+    return await read_through(
+        cache_key("get_lecture", id=lecture_id),
+        _LECTURE,
+        lambda: _load_lecture(db, lecture_id),
+        cacheable=lambda lecture: lecture.status != "generating",
     )
-    lecture = result.scalar_one_or_none()
+
+
+@router.get("/{lecture_id}/timings", response_model=LectureTimingsWindow)
+async def get_lecture_timings(
+    lecture_id: uuid.UUID,
+    from_ms: int = Query(0, ge=0),
+    to_ms: int | None = Query(None, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """Word timings and paragraphs overlapping ``[from_ms, to_ms)`` of the audio.
+
+    Lets the player render the words around the playhead (and prefetch the next
+    window) without downloading the timings for the whole lecture.
+    """
+    if to_ms is not None and to_ms <= from_ms:
+        raise HTTPException(status_code=400, detail="to_ms must be greater than from_ms")
+    lecture = await db.get(Lecture, lecture_id)
     if not lecture:
         raise HTTPException(status_code=404, detail="Lecture not found")
-    resp = LectureResponse.model_validate(lecture)
-    if lecture.course:
-        resp.course_title = lecture.course.title
-        if lecture.course.thinker:
-            resp.thinker_name = lecture.course.thinker.name
-            resp.thinker_image_url = lecture.course.thinker.image_url
-    return resp
+    try:
+        index = await asyncio.to_thread(load_timings_index, lecture_id)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Lecture has no word timings")
+
+    end_ms = index.duration_ms + 1 if to_ms is None else to_ms
+    window = index.window(from_ms, end_ms)
+    return LectureTimingsWindow(
+        lecture_id=lecture_id,
+        from_ms=from_ms,
+        to_ms=end_ms,
+        duration_ms=index.duration_ms,
+        total_words=len(index),
+        first_word=window.first_word,
+        paragraphs=[TimedParagraph(index=i, text=t) for i, t in window.paragraphs.items()],
+        words=[
+            WordTiming(s=s, e=e, p=p)
+            for s, e, p in zip(window.starts, window.ends, window.paras)
+        ],
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _transcript_events(lecture_id: uuid.UUID):
+    """Yield SSE events as a worker streams transcript text into the lecture row."""
+    sent = 0
+    idle = 0.0
+    while True:
+        # Fresh session per poll so we never hold a connection between polls
+        async with async_session() as session:
+            row = (
+                await session.execute(
+                    select(Lecture.transcript, Lecture.status).where(Lecture.id == lecture_id)
+                )
+            ).one_or_none()
+        if row is None:
+            yield _sse("error", {"detail": "Lecture not found"})
+            return
+
+        transcript, status = row
+        if len(transcript) < sent:
+            # Generation restarted (retry) or failed — resend from scratch
+            yield _sse("reset", {"text": transcript})
+            sent = len(transcript)
+            idle = 0.0
+        elif len(transcript) > sent:
+            yield _sse("delta", {"text": transcript[sent:]})
+            sent = len(transcript)
+            idle = 0.0
+
+        if status != "generating":
+            yield _sse("done", {"status": status})
+            return
+
+        if idle >= 15.0:
+            yield ": keep-alive\n\n"
+            idle = 0.0
+        await asyncio.sleep(settings.transcript_stream_poll_interval)
+        idle += settings.transcript_stream_poll_interval
+
+
+@router.get("/{lecture_id}/transcript/stream")
+async def stream_lecture_transcript(lecture_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    """Server-sent events for a lecture's transcript as it is generated.
+
+    Emits ``delta`` events with new text, ``reset`` if generation restarts, and a
+    final ``done`` event carrying the lecture status.
+    """
+    lecture = await db.get(Lecture, lecture_id)
+    if not lecture:
+        raise HTTPException(status_code=404, detail="Lecture not found")
+    return StreamingResponse(
+        _transcript_events(lecture_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
-@router.post("/generate", response_model=LectureResponse, status_code=201)
+@router.post("/generate", response_model=JobResponse, status_code=202)
 async def generate_lecture(
     data: LectureGenerateRequest,
     db: AsyncSession = Depends(get_db),
     x_admin_key: str | None = Header(None),
 ):
-    """Generate a new lecture transcript using AI. Admin only."""
+    """Queue AI generation of a new lecture transcript. Admin only.
+
+    The lecture row is created immediately with status "generating"; a worker
+    fills in the transcript. Poll the returned job at /api/jobs/{id}.
+    """
     _require_admin(x_admin_key)
     result = await db.execute(
         select(Course)
-        .options(selectinload(Course.thinker), selectinload(Course.lectures))
+        .options(selectinload(Course.lectures))
         .where(Course.id == data.course_id)
     )
     course = result.scalar_one_or_none()
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
 
-    thinker = course.thinker
     next_seq = len(course.lectures) + 1
 
     lecture = Lecture(
@@ -91,38 +263,21 @@ async def generate_lecture(
     db.add(lecture)
     await db.flush()
 
-    try:
-        transcript = await generate_lecture_transcript(
-            thinker_name=thinker.name,
-            system_prompt=thinker.system_prompt,
-            topic=data.topic,
-            speaking_style=thinker.speaking_style,
-        )
-        lecture.transcript = transcript
-        lecture.status = "ready"
-    except Exception as e:
-        lecture.status = "error"
-        lecture.transcript = f"Generation failed: {str(e)}"
-
-    await db.flush()
-    await db.refresh(lecture)
-    return lecture
+    job = await enqueue_job(db, JOB_TRANSCRIPT, lecture.id, {"topic": data.topic})
+    await db.commit()
+    await invalidate_catalog()
+    return job
 
 
-@router.post("/{lecture_id}/generate-audio", response_model=LectureResponse)
+@router.post("/{lecture_id}/generate-audio", response_model=JobResponse, status_code=202)
 async def generate_lecture_audio(
     lecture_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     x_admin_key: str | None = Header(None),
 ):
-    """Generate TTS audio for an existing lecture. Admin only."""
+    """Queue TTS audio generation for an existing lecture. Admin only."""
     _require_admin(x_admin_key)
-    result = await db.execute(
-        select(Lecture)
-        .options(selectinload(Lecture.course).selectinload(Course.thinker))
-        .where(Lecture.id == lecture_id)
-    )
-    lecture = result.scalar_one_or_none()
+    lecture = await db.get(Lecture, lecture_id)
     if not lecture:
         raise HTTPException(status_code=404, detail="Lecture not found")
 
@@ -132,21 +287,77 @@ async def generate_lecture_audio(
     if not lecture.transcript:
         raise HTTPException(status_code=400, detail="Lecture has no transcript")
 
-    thinker_name = lecture.course.thinker.name
+    # Don't queue duplicate work for a lecture that already has audio in flight
+    existing = await find_active_job(db, JOB_AUDIO, lecture.id)
+    if existing:
+        return existing
 
-    try:
-        result = await _generate_audio_for_lecture(
-            transcript=lecture.transcript,
-            thinker_name=thinker_name,
-            lecture_id=lecture.id,
-        )
-        lecture.audio_url = result.url
-        lecture.duration_seconds = result.duration_seconds
-        await db.flush()
-        await db.refresh(lecture)
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Audio generation failed: {str(e)}"
-        )
-
-    return lecture
+    return await enqueue_job(db, JOB_AUDIO, lecture.id)
+
+
+def _backfill_response(run: BackfillRun) -> BackfillResponse:
+    resp = BackfillResponse.model_validate(run)
+    throughput = backfill_throughput(run)
+    resp.elapsed_seconds = throughput.elapsed_seconds
+    resp.lectures_per_minute = throughput.lectures_per_minute
+    resp.chars_per_minute = throughput.chars_per_minute
+    return resp
+
+
+@router.post("/backfill-audio", response_model=BackfillResponse, status_code=202)
+async def backfill_lecture_audio(
+    data: BackfillRequest,
+    db: AsyncSession = Depends(get_db),
+    x_admin_key: str | None = Header(None),
+):
+    """Queue audio for every ready lecture without it, optionally for one course or thinker.
+
+    Admin only. Resumes the unfinished backfill with the same filters if there
+    is one. Workers synthesize the queued jobs (``python -m app.backfill`` runs
+    a dedicated pool); poll ``/api/lectures/backfill-audio/{id}`` for progress.
+    """
+    _require_admin(x_admin_key)
+    return _backfill_response(await open_backfill(db, data.course_id, data.thinker_id))
+
+
+@router.get("/backfill-audio/{run_id}", response_model=BackfillResponse)
+async def get_audio_backfill(
+    run_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    x_admin_key: str | None = Header(None),
+):
+    """Progress and throughput of an audio backfill. Admin only."""
+    _require_admin(x_admin_key)
+    run = await db.get(BackfillRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Backfill not found")
+    return _backfill_response(await refresh_backfill(db, run))
+
+
+@router.get("/backfill-audio/{run_id}/generation-timings", response_model=BackfillTimingsResponse)
+async def get_audio_backfill_timings(
+    run_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    x_admin_key: str | None = Header(None),
+):
+    """Where a backfill's synthesis time went, per pipeline stage. Admin only."""
+    _require_admin(x_admin_key)
+    if not await db.get(BackfillRun, run_id):
+        raise HTTPException(status_code=404, detail="Backfill not found")
+    return await backfill_timings(db, run_id)
+
+
+@router.get("/{lecture_id}/generation-timings", response_model=list[GenerationTimingResponse])
+async def get_lecture_generation_timings(
+    lecture_id: uuid.UUID,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    x_admin_key: str | None = Header(None),
+):
+    """Per-stage timings of the lecture's most recent generation jobs, newest first.
+
+    Admin only. Each entry's ``trace_id`` finds the full trace when tracing
+    export is enabled.
+    """
+    _require_admin(x_admin_key)
+    return await lecture_generation_timings(db, lecture_id, limit)
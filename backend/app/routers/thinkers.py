@@ -1,20 +1,71 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.db.session import get_db
 from app.models.thinker import Thinker
 from app.schemas.thinker import ThinkerCreate, ThinkerResponse, ThinkerUpdate
+from app.services.pagination import Page, fetch_page
+from app.services.response_cache import cache_key, invalidate_catalog, read_through
+from app.services.sparse_fields import (
+    column_options,
+    fields_key,
+    list_adapter,
+    project,
+    requested_fields,
+)
 
 router = APIRouter(prefix="/api/thinkers", tags=["thinkers"])
 
 
+async def _load_thinkers(
+    db: AsyncSession,
+    schema: type[BaseModel],
+    limit: int,
+    cursor: str | None = None,
+    discipline_id: uuid.UUID | None = None,
+) -> Page:
+    query = select(Thinker).options(*column_options(Thinker, schema, extra=("name",)))
+    if discipline_id:
+        query = query.where(Thinker.discipline_id == discipline_id)
+    return await fetch_page(db, query, (Thinker.name, Thinker.id), limit, cursor, "thinkers")
+
+
+async def warm_cache(db: AsyncSession) -> None:
+    limit = settings.page_size_default
+    await read_through(
+        cache_key("list_thinkers", limit=limit),
+        list_adapter(ThinkerResponse),
+        lambda: _load_thinkers(db, ThinkerResponse, limit),
+    )
+
+
 @router.get("/", response_model=list[ThinkerResponse])
-async def list_thinkers(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Thinker).order_by(Thinker.name))
-    return result.scalars().all()
+async def list_thinkers(
+    discipline_id: uuid.UUID | None = None,
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    cursor: str | None = Query(None, description="X-Next-Cursor from the previous page"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Thinkers by name, one page at a time (next page cursor in ``X-Next-Cursor``)."""
+    selected = requested_fields(fields, ThinkerResponse)
+    schema = project(ThinkerResponse, selected)
+    return await read_through(
+        cache_key(
+            "list_thinkers",
+            discipline_id=discipline_id,
+            limit=limit,
+            cursor=cursor,
+            fields=fields_key(selected),
+        ),
+        list_adapter(schema),
+        lambda: _load_thinkers(db, schema, limit, cursor, discipline_id),
+    )
 
 
 @router.get("/{thinker_id}", response_model=ThinkerResponse)
@@ -31,6 +82,8 @@ async def create_thinker(data: ThinkerCreate, db: AsyncSession = Depends(get_db)
     db.add(thinker)
     await db.flush()
     await db.refresh(thinker)
+    await db.commit()
+    await invalidate_catalog()
     return thinker
 
 
@@ -45,6 +98,8 @@ async def update_thinker(
         setattr(thinker, key, value)
     await db.flush()
     await db.refresh(thinker)
+    await db.commit()
+    await invalidate_catalog()
     return thinker
 
 
@@ -54,3 +109,5 @@ async def delete_thinker(thinker_id: uuid.UUID, db: AsyncSession = Depends(get_d
     if not thinker:
         raise HTTPException(status_code=404, detail="Thinker not found")
     await db.delete(thinker)
+    await db.commit()
+    await invalidate_catalog()
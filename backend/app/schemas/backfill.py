@@ -0,0 +1,29 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class BackfillRequest(BaseModel):
+    course_id: uuid.UUID | None = None
+    thinker_id: uuid.UUID | None = None
+
+
+class BackfillResponse(BaseModel):
+    id: uuid.UUID
+    status: str
+    course_id: uuid.UUID | None = None
+    thinker_id: uuid.UUID | None = None
+    total: int
+    total_chars: int
+    completed: int
+    completed_chars: int
+    failed: int
+    created_at: datetime
+    finished_at: datetime | None = None
+    # Throughput since the run was created (populated by router)
+    elapsed_seconds: float = 0.0
+    lectures_per_minute: float = 0.0
+    chars_per_minute: float = 0.0
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,52 @@
+import json
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, field_validator
+
+
+class StageTiming(BaseModel):
+    count: int
+    total_ms: float  # summed over the stage's spans
+    max_ms: float
+    wall_ms: float | None = None  # while any of them ran; not recorded before it was added
+
+
+class GenerationTimingResponse(BaseModel):
+    id: uuid.UUID
+    lecture_id: uuid.UUID
+    job_id: uuid.UUID | None = None
+    backfill_id: uuid.UUID | None = None
+    kind: str
+    status: str
+    trace_id: str
+    total_ms: float
+    stages: dict[str, StageTiming]
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+    @field_validator("stages", mode="before")
+    @classmethod
+    def _parse_stages(cls, value):
+        return json.loads(value) if isinstance(value, str) else value
+
+
+class StageSummary(BaseModel):
+    name: str
+    lectures: int  # jobs that ran this stage
+    count: int
+    total_ms: float  # summed span time; concurrent spans each count
+    wall_ms: float  # time at least one of the stage's spans was running
+    mean_ms: float  # summed span time per job that ran it
+    p95_ms: float  # summed span time per job that ran it
+    max_ms: float  # slowest single span
+    share: float  # wall_ms over all jobs' total time; nested stages overlap their parents
+
+
+class BackfillTimingsResponse(BaseModel):
+    backfill_id: uuid.UUID
+    jobs: int
+    total_ms: float  # wall time, summed over jobs
+    stages: list[StageSummary]  # most total time first
+    slowest: list[GenerationTimingResponse]
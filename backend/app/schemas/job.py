@@ -0,0 +1,20 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class JobResponse(BaseModel):
+    id: uuid.UUID
+    kind: str
+    status: str
+    progress: float
+    stage: str
+    error: str | None = None
+    attempts: int
+    lecture_id: uuid.UUID
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
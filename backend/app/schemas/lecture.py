@@ -20,6 +20,19 @@ class LectureGenerateRequest(BaseModel):
     course_id: uuid.UUID
 
 
+class LectureSummary(LectureBase):
+    """A lecture without its transcript, for listings."""
+
+    id: uuid.UUID
+    audio_url: str | None = None
+    status: str
+    duration_seconds: int | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
 class LectureResponse(LectureBase):
     id: uuid.UUID
     transcript: str
@@ -34,3 +47,40 @@ class LectureResponse(LectureBase):
     course_title: str | None = None
 
     model_config = {"from_attributes": True}
+
+
+class WordTiming(BaseModel):
+    s: int
+    e: int
+    p: int
+
+
+class TimedParagraph(BaseModel):
+    index: int
+    text: str
+
+
+class LectureTimingsWindow(BaseModel):
+    """Word timings overlapping ``[from_ms, to_ms)`` of a lecture's audio."""
+
+    lecture_id: uuid.UUID
+    from_ms: int
+    to_ms: int
+    duration_ms: int
+    total_words: int
+    # Ordinal of the first word in ``words`` within the whole lecture
+    first_word: int
+    paragraphs: list[TimedParagraph]
+    words: list[WordTiming]
+
+
+class TranscriptSearchHit(BaseModel):
+    lecture_id: uuid.UUID
+    title: str
+    course_id: uuid.UUID
+    snippet: str  # markdown, matches in **bold**
+    score: float  # higher is better; comparable only within one response
+    paragraph_index: int | None = None  # first paragraph with a match (None: title only)
+    offset_ms: int | None = None  # where that match is spoken, if the audio has timings
+
+    model_config = {"from_attributes": True}
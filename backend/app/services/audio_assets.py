@@ -0,0 +1,78 @@
+"""Content fingerprints for files under ``audio/``.
+
+Lecture audio is published at ``/audio/{lecture_id}.{fingerprint}.mp3``,
+where the fingerprint is a hash of the mp3 bytes, so a URL always names one
+exact file and can be cached forever; regenerating the audio changes the URL.
+The timings URL the frontend derives from it (``.mp3`` -> ``.json``) carries
+the same fingerprint. File hashes double as strong ETags and are memoized
+per (inode, size, mtime), so each file is read once per process.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import threading
+import uuid
+from collections import OrderedDict
+
+from app.services.audio_cache import AUDIO_DIR
+
+FINGERPRINT_CHARS = 16
+HASH_BLOCK_BYTES = 1024 * 1024
+_MEMO_SIZE = 4096
+
+# {lecture_id}.mp3 / {lecture_id}.json, optionally with .{fingerprint} before the extension
+_AUDIO_NAME_RE = re.compile(
+    rf"^(?P<lecture_id>[0-9a-fA-F-]{{36}})(?:\.(?P<fingerprint>[0-9a-f]{{{FINGERPRINT_CHARS}}}))?"
+    r"\.(?P<ext>mp3|json)$"
+)
+
+_memo: OrderedDict[str, tuple[tuple[int, int, int], str]] = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def file_fingerprint(path: str) -> str:
+    """Hex content hash of ``path`` (raises FileNotFoundError if it is missing)."""
+    st = os.stat(path)
+    stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+    with _memo_lock:
+        cached = _memo.get(path)
+        if cached is not None and cached[0] == stamp:
+            _memo.move_to_end(path)
+            return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_BYTES):
+            digest.update(block)
+    fingerprint = digest.hexdigest()[:FINGERPRINT_CHARS]
+
+    with _memo_lock:
+        _memo[path] = (stamp, fingerprint)
+        _memo.move_to_end(path)
+        if len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+    return fingerprint
+
+
+def lecture_audio_path(lecture_id: str | uuid.UUID, ext: str = "mp3") -> str:
+    return os.path.join(AUDIO_DIR, f"{lecture_id}.{ext}")
+
+
+def parse_audio_name(name: str) -> tuple[uuid.UUID, str | None, str] | None:
+    """Split ``{lecture_id}[.{fingerprint}].{mp3|json}``; None if it is not one."""
+    m = _AUDIO_NAME_RE.match(name)
+    if m is None:
+        return None
+    try:
+        lecture_id = uuid.UUID(m.group("lecture_id"))
+    except ValueError:
+        return None
+    return lecture_id, m.group("fingerprint"), m.group("ext")
+
+
+async def fingerprinted_audio_url(lecture_id: str | uuid.UUID) -> str:
+    """The immutable public URL for a lecture's current mp3."""
+    fingerprint = await asyncio.to_thread(file_fingerprint, lecture_audio_path(lecture_id))
+    return f"/audio/{lecture_id}.{fingerprint}.mp3"
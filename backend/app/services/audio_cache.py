@@ -0,0 +1,209 @@
+"""Content-addressed cache of synthesized lecture audio, shared by all TTS providers.
+
+Entries are keyed by a hash of the normalized text, provider, voice settings
+and output format, so regenerating an unchanged lecture (or a second lecture
+with identical text) reuses the existing mp3 and word-timings files instead of
+calling the TTS service again. Files are hard-linked into ``audio/`` when the
+cache and audio directories share a filesystem, and copied otherwise.
+
+Eviction is size-based LRU: a hit refreshes an entry's mtime, and when the
+cache grows past ``audio_cache_max_bytes`` the least recently used entries
+are removed. Evicting an entry never touches the lecture files linked from it.
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+
+from app.config import settings
+from app.services.audio_writer import TIMINGS_SUFFIXES
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+AUDIO_DIR = os.path.join(BACKEND_DIR, "audio")
+DEFAULT_CACHE_DIR = os.path.join(BACKEND_DIR, "audio_cache")
+
+CACHE_VERSION = 1  # bump to invalidate every entry (e.g. timings schema change)
+
+
+@dataclass
+class AudioResult:
+    url: str
+    duration_seconds: int
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+stats = CacheStats()
+
+
+def _cache_dir() -> str:
+    return settings.audio_cache_dir or DEFAULT_CACHE_DIR
+
+
+def normalize_text(clean_text: str) -> str:
+    """Collapse whitespace inside paragraphs so formatting-only edits still hit."""
+    paragraphs = (" ".join(p.split()) for p in clean_text.split("\n\n"))
+    return "\n\n".join(p for p in paragraphs if p)
+
+
+def cache_key(clean_text: str, provider: str, voice: object, output_format: str) -> str:
+    """Hash everything that affects the synthesized bytes and timings."""
+    if dataclasses.is_dataclass(voice):
+        voice = dataclasses.asdict(voice)
+    material = json.dumps(
+        {
+            "v": CACHE_VERSION,
+            "text": normalize_text(clean_text),
+            "provider": provider,
+            "voice": voice,
+            "format": output_format,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+# Files stored per entry besides the .meta marker (timings first, mp3 last)
+_FILE_SUFFIXES = (*TIMINGS_SUFFIXES, ".mp3")
+_REQUIRED_SUFFIXES = (".json", ".mp3")
+
+
+def _entry_base(key: str) -> str:
+    return os.path.join(_cache_dir(), key[:2], key)
+
+
+def _lecture_base(lecture_id: str | uuid.UUID) -> str:
+    return os.path.join(AUDIO_DIR, str(lecture_id))
+
+
+def _link_into_place(src: str, dest: str) -> None:
+    """Hard-link (or copy) ``src`` to ``dest``, atomically replacing ``dest``."""
+    tmp = f"{dest}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+def release_lecture_files(lecture_id: str | uuid.UUID) -> None:
+    """Unlink a lecture's current audio files before regenerating them.
+
+    They may be hard links to cache entries; providers open their output with
+    ``"wb"``, which would otherwise truncate the shared inode.
+    """
+    base = _lecture_base(lecture_id)
+    for suffix in _FILE_SUFFIXES:
+        try:
+            os.unlink(base + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def _lookup(key: str, lecture_id: str | uuid.UUID) -> AudioResult | None:
+    base = _entry_base(key)
+    meta = f"{base}.meta"
+    try:
+        with open(meta, encoding="utf-8") as f:
+            info = json.load(f)
+        if not all(os.path.exists(base + suffix) for suffix in _REQUIRED_SUFFIXES):
+            return None
+        dest = _lecture_base(lecture_id)
+        os.makedirs(AUDIO_DIR, exist_ok=True)
+        for suffix in _FILE_SUFFIXES:
+            if os.path.exists(base + suffix):
+                _link_into_place(base + suffix, dest + suffix)
+            else:
+                # Entry cached before this variant existed: drop the lecture's
+                # stale copy; it is re-derived from the JSON when requested
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(dest + suffix)
+        os.utime(meta)  # refresh LRU position
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return AudioResult(url=f"/audio/{lecture_id}.mp3", duration_seconds=info["duration_seconds"])
+
+
+def _store(key: str, lecture_id: str | uuid.UUID, duration_seconds: int) -> None:
+    base = _entry_base(key)
+    meta = f"{base}.meta"
+    src = _lecture_base(lecture_id)
+    os.makedirs(os.path.dirname(meta), exist_ok=True)
+    for suffix in _FILE_SUFFIXES:
+        if os.path.exists(src + suffix):
+            _link_into_place(src + suffix, base + suffix)
+    # The .meta file is written last: its presence marks the entry complete
+    tmp = f"{meta}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"duration_seconds": duration_seconds}, f)
+    os.replace(tmp, meta)
+
+
+def _evict() -> None:
+    """Drop least recently used entries until the cache fits its size budget."""
+    root = _cache_dir()
+    entries: list[tuple[float, int, str]] = []  # (last_used, size, base path)
+    total = 0
+    for shard in os.scandir(root):
+        if not shard.is_dir():
+            continue
+        for item in os.scandir(shard.path):
+            if not item.name.endswith(".meta"):
+                continue
+            base = item.path[: -len(".meta")]
+            size = sum(
+                os.path.getsize(p)
+                for p in (*(base + suffix for suffix in _FILE_SUFFIXES), item.path)
+                if os.path.exists(p)
+            )
+            entries.append((item.stat().st_mtime, size, base))
+            total += size
+
+    entries.sort()
+    for _, size, base in entries:
+        if total <= settings.audio_cache_max_bytes:
+            break
+        for suffix in (".meta", *_FILE_SUFFIXES):
+            try:
+                os.unlink(base + suffix)
+            except FileNotFoundError:
+                pass
+        total -= size
+        stats.evictions += 1
+
+
+async def lookup(key: str, lecture_id: str | uuid.UUID) -> AudioResult | None:
+    """Materialize a cached entry as the lecture's audio files, or return None on a miss."""
+    result = await asyncio.to_thread(_lookup, key, lecture_id)
+    if result is None:
+        stats.misses += 1
+    else:
+        stats.hits += 1
+    return result
+
+
+async def store(key: str, lecture_id: str | uuid.UUID, duration_seconds: int) -> None:
+    """Add a lecture's freshly generated files to the cache, then enforce the size budget."""
+    try:
+        await asyncio.to_thread(_store, key, lecture_id, duration_seconds)
+        stats.stores += 1
+        await asyncio.to_thread(_evict)
+    except OSError:
+        # Caching is best-effort; the lecture's own files are already in place
+        logger.exception("Failed to cache audio for lecture %s", lecture_id)
@@ -0,0 +1,171 @@
+"""Bounded-memory, non-blocking output for generated audio and timings files.
+
+Every TTS provider writes through :class:`AudioFileWriter`: bytes are
+buffered up to a small fixed size, written to a temp file in a worker thread
+(so the event loop keeps serving other requests), and the finished file is
+renamed into place atomically. Readers never see a half-written mp3, and
+peak memory no longer grows with lecture length.
+
+Word timings are written as the ``{lecture_id}.json`` file plus a compact
+binary ``{lecture_id}.wt`` next to it, each with gzip (and, when the optional
+``brotli`` package is installed, brotli) precompressed copies for
+content-negotiated serving.
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+import uuid
+
+from app.services.word_timings import WordTimings
+
+try:
+    import brotli
+except ImportError:  # optional: pip install synthetic-symposium[compression]
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+WRITE_BUFFER_BYTES = 256 * 1024
+COPY_BLOCK_BYTES = 1024 * 1024
+
+JSON_SUFFIX = ".json"
+COMPACT_SUFFIX = ".wt"
+# Precompressed siblings, in server preference order: (suffix, Content-Encoding)
+ENCODED_SUFFIXES = ((".br", "br"), (".gz", "gzip"))
+# Every file that makes up a lecture's timings, relative to the audio basename
+TIMINGS_SUFFIXES = tuple(
+    base + enc
+    for base in (JSON_SUFFIX, COMPACT_SUFFIX)
+    for enc in ("", *(suffix for suffix, _ in ENCODED_SUFFIXES))
+)
+
+
+class AudioFileWriter:
+    """Async context manager that streams bytes to ``path`` via a temp file.
+
+    On a clean exit the temp file is fsynced and renamed over ``path``; if the
+    block raises, the temp file is removed and ``path`` is left untouched.
+    """
+
+    def __init__(self, path: str, buffer_bytes: int = WRITE_BUFFER_BYTES):
+        self.path = path
+        self.tmp_path = os.path.join(
+            os.path.dirname(path), f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp"
+        )
+        self.buffer_bytes = buffer_bytes
+        self.bytes_written = 0
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._file = None
+
+    async def __aenter__(self) -> "AudioFileWriter":
+        self._file = await asyncio.to_thread(open, self.tmp_path, "wb")
+        return self
+
+    async def write(self, data: bytes) -> None:
+        if not data:
+            return
+        self._buffer.append(data)
+        self._buffered += len(data)
+        self.bytes_written += len(data)
+        if self._buffered >= self.buffer_bytes:
+            await self._flush()
+
+    async def copy_from(self, src_path: str) -> None:
+        """Append a file's contents in fixed-size blocks."""
+        await self._flush()
+        self.bytes_written += await asyncio.to_thread(self._copy_blocks, src_path)
+
+    def _copy_blocks(self, src_path: str) -> int:
+        copied = 0
+        with open(src_path, "rb") as src:
+            while block := src.read(COPY_BLOCK_BYTES):
+                self._file.write(block)
+                copied += len(block)
+        return copied
+
+    async def _flush(self) -> None:
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        await asyncio.to_thread(self._file.write, data)
+
+    def _commit(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.tmp_path, self.path)
+
+    def _abort(self) -> None:
+        self._file.close()
+        try:
+            os.unlink(self.tmp_path)
+        except FileNotFoundError:
+            pass
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self._flush()
+            await asyncio.to_thread(self._commit)
+        else:
+            self._buffer = []
+            await asyncio.to_thread(self._abort)
+
+
+def _write_bytes_atomic(path: str, data: bytes) -> None:
+    tmp_path = os.path.join(
+        os.path.dirname(path), f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp"
+    )
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _write_with_encodings(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` plus its precompressed siblings."""
+    _write_bytes_atomic(f"{path}.gz", gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_bytes_atomic(f"{path}.br", brotli.compress(data, quality=11))
+    _write_bytes_atomic(path, data)
+
+
+def write_timings_variants(json_path: str, paragraphs: list[str], timings: WordTimings) -> None:
+    """Write every timings representation; the plain JSON file is written last."""
+    base = json_path[: -len(JSON_SUFFIX)]
+    _write_with_encodings(base + COMPACT_SUFFIX, timings.dumps_compact(paragraphs))
+    _write_with_encodings(json_path, timings.dumps(paragraphs).encode("utf-8"))
+
+
+def ensure_timings_variants(json_path: str) -> None:
+    """Derive the compact and precompressed files for a timings JSON written before they existed."""
+    base = json_path[: -len(JSON_SUFFIX)]
+    if os.path.exists(base + COMPACT_SUFFIX) or not os.path.exists(json_path):
+        return
+    try:
+        with open(json_path, "rb") as f:
+            raw = f.read()
+        paragraphs, timings = WordTimings.loads(raw)
+        _write_with_encodings(base + COMPACT_SUFFIX, timings.dumps_compact(paragraphs))
+        _write_bytes_atomic(f"{json_path}.gz", gzip.compress(raw, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write_bytes_atomic(f"{json_path}.br", brotli.compress(raw, quality=11))
+    except (OSError, ValueError, KeyError):
+        logger.exception("Could not derive timings variants for %s", json_path)
+
+
+async def write_timings(path: str, paragraphs: list[str], timings: WordTimings) -> None:
+    """Serialize and write the timings files off the event loop.
+
+    ``path`` is the ``{"p": paragraphs, "w": word_timings}`` JSON file; the
+    compact encoding and precompressed copies are written alongside it.
+    """
+    await asyncio.to_thread(write_timings_variants, path, paragraphs, timings)
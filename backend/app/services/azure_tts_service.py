@@ -1,20 +1,31 @@
 """Text-to-speech service using Azure AI Speech with SSML accent controls."""
 
 import asyncio
-import json
 import os
-import re
+import queue
+import threading
+import time
 import uuid
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import azure.cognitiveservices.speech as speechsdk
 
 from app.config import settings
+from app.services.audio_writer import AudioFileWriter, write_timings
+from app.services.metrics import TTS_CHUNK_SECONDS
+from app.services.text_normalizer import normalize_transcript
+from app.services.tracing import in_context, span
+from app.services.word_timings import ParagraphLocator, WordTimings
 
 AUDIO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "audio")
 
 TICKS_PER_MS = 10_000  # Azure uses 100ns ticks
 
+PROVIDER_NAME = "azure"
+OUTPUT_FORMAT = speechsdk.SpeechSynthesisOutputFormat.Audio16Khz128KBitRateMonoMp3.name
+
 
 @dataclass
 class VoiceConfig:
@@ -81,21 +92,6 @@ AZURE_VOICE_MAP: dict[str, VoiceConfig] = {
 DEFAULT_VOICE = VoiceConfig(voice_name="en-US-GuyNeural")
 
 
-def strip_markdown(text: str) -> str:
-    """Remove markdown formatting so TTS reads clean text."""
-    text = re.sub(r"#{1,6}\s*", "", text)
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"\*(.+?)\*", r"\1", text)
-    text = re.sub(r"_(.+?)_", r"\1", text)
-    text = re.sub(r"`(.+?)`", r"\1", text)
-    text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)
-    text = re.sub(r"^[-*+]\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\d+\.\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"---+", "", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
-
-
 def _build_ssml(text: str, voice_cfg: VoiceConfig) -> str:
     """Build SSML document with voice, rate, pitch, and optional accent."""
     # Escape XML special chars in text
@@ -149,31 +145,27 @@ def get_voice_for_thinker(thinker_name: str) -> VoiceConfig:
     return AZURE_VOICE_MAP.get(thinker_name, DEFAULT_VOICE)
 
 
-def _synthesize_with_word_boundaries(
-    ssml: str,
-) -> tuple[bytes, list[WordBoundaryEvent], float]:
-    """Run Azure Speech synthesis synchronously, collecting word boundaries.
+class _PooledSynthesizer:
+    """A warm SpeechSynthesizer with its word-boundary callback already connected."""
 
-    Returns (audio_data, word_boundaries, duration_seconds).
-    """
-    speech_config = speechsdk.SpeechConfig(
-        subscription=settings.azure_speech_key,
-        region=settings.azure_speech_region,
-    )
-    speech_config.set_speech_synthesis_output_format(
-        speechsdk.SpeechSynthesisOutputFormat.Audio16Khz128KBitRateMonoMp3
-    )
-
-    # Synthesize to in-memory stream
-    synthesizer = speechsdk.SpeechSynthesizer(
-        speech_config=speech_config,
-        audio_config=None,  # No audio output device, get bytes
-    )
-
-    boundaries: list[WordBoundaryEvent] = []
-
-    def on_word_boundary(evt):
-        boundaries.append(WordBoundaryEvent(
+    def __init__(self):
+        speech_config = speechsdk.SpeechConfig(
+            subscription=settings.azure_speech_key,
+            region=settings.azure_speech_region,
+        )
+        speech_config.set_speech_synthesis_output_format(
+            speechsdk.SpeechSynthesisOutputFormat[OUTPUT_FORMAT]
+        )
+        # Synthesize to in-memory stream
+        self.synthesizer = speechsdk.SpeechSynthesizer(
+            speech_config=speech_config,
+            audio_config=None,  # No audio output device, get bytes
+        )
+        self.boundaries: list[WordBoundaryEvent] = []
+        self.synthesizer.synthesis_word_boundary.connect(self._on_word_boundary)
+
+    def _on_word_boundary(self, evt):
+        self.boundaries.append(WordBoundaryEvent(
             audio_offset_ms=evt.audio_offset / TICKS_PER_MS,
             duration_ms=evt.duration.total_seconds() * 1000,
             text=evt.text,
@@ -181,18 +173,90 @@ def _synthesize_with_word_boundaries(
             word_length=evt.word_length,
         ))
 
-    synthesizer.synthesis_word_boundary.connect(on_word_boundary)
 
-    result = synthesizer.speak_ssml_async(ssml).get()
+class _SynthesizerPool:
+    """Thread-safe pool of warm synthesizers, grown lazily up to ``size``."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: queue.SimpleQueue[_PooledSynthesizer] = queue.SimpleQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> _PooledSynthesizer:
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    break
+            try:
+                return self._idle.get(timeout=1.0)
+            except queue.Empty:
+                continue  # re-check: a failed synthesizer may have freed a slot
+
+        try:
+            return _PooledSynthesizer()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def release(self, synth: _PooledSynthesizer) -> None:
+        synth.boundaries = []
+        self._idle.put(synth)
+
+    def discard(self, synth: _PooledSynthesizer) -> None:
+        """Drop a synthesizer that failed so a fresh one is created next time."""
+        with self._lock:
+            self._created -= 1
+
+
+_pool: _SynthesizerPool | None = None
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_pool() -> tuple[_SynthesizerPool, ThreadPoolExecutor]:
+    """Lazily create the synthesizer pool and the thread pool that drives it."""
+    global _pool, _executor
+    if _pool is None:
+        size = max(1, settings.azure_tts_concurrency)
+        _pool = _SynthesizerPool(size)
+        _executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="azure-tts")
+    return _pool, _executor
+
+
+def _synthesize_with_word_boundaries(
+    ssml: str,
+) -> tuple[bytes, list[WordBoundaryEvent], float]:
+    """Run Azure Speech synthesis synchronously on a pooled synthesizer.
+
+    Returns (audio_data, word_boundaries, duration_seconds).
+    """
+    pool, _ = _get_pool()
+    synth = pool.acquire()
+    try:
+        synth.boundaries = []
+        result = synth.synthesizer.speak_ssml_async(ssml).get()
+        boundaries = synth.boundaries
+    except Exception:
+        pool.discard(synth)
+        raise
 
     if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+        pool.release(synth)
         audio_data = result.audio_data
         duration_s = len(audio_data) / (16000 * 2)  # rough estimate for 16kHz
         # Better: use audio duration from result if available
         if result.audio_duration:
             duration_s = result.audio_duration.total_seconds()
         return audio_data, boundaries, duration_s
-    elif result.reason == speechsdk.ResultReason.Canceled:
+
+    pool.discard(synth)
+    if result.reason == speechsdk.ResultReason.Canceled:
         details = result.cancellation_details
         raise RuntimeError(
             f"Azure Speech synthesis canceled: {details.reason}. "
@@ -228,12 +292,18 @@ def _synthesize_chunk(
     paragraphs: list[str],
     para_indices: list[int],
     voice_cfg: VoiceConfig,
-    time_offset_ms: float,
-) -> tuple[bytes, list[dict], float]:
-    """Synthesize a chunk of paragraphs, returning (audio_bytes, word_timings, duration_ms)."""
+) -> tuple[bytes, WordTimings, float]:
+    """Synthesize a chunk of paragraphs.
+
+    Returns (audio_bytes, word_timings, duration_ms) with timings relative to
+    the start of the chunk.
+    """
     chunk_text = "\n\n".join(paragraphs[i] for i in para_indices)
     ssml = _build_ssml(chunk_text, voice_cfg)
-    audio_data, boundaries, duration_s = _synthesize_with_word_boundaries(ssml)
+    started = time.perf_counter()
+    with span("tts.azure.chunk", first_paragraph=para_indices[0], characters=len(chunk_text)):
+        audio_data, boundaries, duration_s = _synthesize_with_word_boundaries(ssml)
+    TTS_CHUNK_SECONDS.labels(PROVIDER_NAME).observe(time.perf_counter() - started)
 
     # Build char ranges within the chunk text
     para_char_ranges: list[tuple[int, int, int]] = []  # (start, end, global_para_idx)
@@ -244,19 +314,14 @@ def _synthesize_chunk(
         para_char_ranges.append((start, end, idx))
         offset = end
 
-    word_timings: list[dict] = []
+    locator = ParagraphLocator.from_char_ranges(para_char_ranges, default=para_indices[-1])
+    word_timings = WordTimings("d")
     for wb in boundaries:
-        para_idx = para_indices[-1]  # default to last
-        for pstart, pend, gidx in para_char_ranges:
-            if pstart <= wb.text_offset < pend:
-                para_idx = gidx
-                break
-
-        word_timings.append({
-            "s": round(wb.audio_offset_ms + time_offset_ms),
-            "e": round(wb.audio_offset_ms + wb.duration_ms + time_offset_ms),
-            "p": para_idx,
-        })
+        word_timings.append(
+            wb.audio_offset_ms,
+            wb.audio_offset_ms + wb.duration_ms,
+            locator.for_offset(wb.text_offset),
+        )
 
     return audio_data, word_timings, duration_s * 1000
 
@@ -266,36 +331,60 @@ async def generate_audio(
     thinker_name: str,
     lecture_id: str | uuid.UUID,
 ) -> AudioResult:
-    """Generate audio via Azure Speech TTS with SSML accent controls."""
+    """Generate audio via Azure Speech TTS with SSML accent controls.
+
+    Chunks are synthesized concurrently (up to ``azure_tts_concurrency`` at a
+    time) on pooled synthesizers and written out in order as they complete.
+    """
     os.makedirs(AUDIO_DIR, exist_ok=True)
 
     voice_cfg = get_voice_for_thinker(thinker_name)
-    clean_text = strip_markdown(transcript)
 
-    paragraphs = [p.strip() for p in clean_text.split("\n\n") if p.strip()]
-    chunks = _chunk_paragraphs(paragraphs)
+    with span("text.normalize"):
+        paragraphs = list(normalize_transcript(transcript).paragraphs)
+    chunks = iter(_chunk_paragraphs(paragraphs))
 
-    all_audio = bytearray()
-    all_timings: list[dict] = []
-    total_duration_ms = 0.0
-    loop = asyncio.get_event_loop()
+    pool, executor = _get_pool()
+    loop = asyncio.get_running_loop()
 
-    for chunk_indices in chunks:
-        audio_data, timings, chunk_dur_ms = await loop.run_in_executor(
-            None, _synthesize_chunk, paragraphs, chunk_indices, voice_cfg, total_duration_ms
+    def submit(chunk_indices: list[int]) -> asyncio.Future:
+        # in_context: the chunk's span nests under this lecture's trace
+        return loop.run_in_executor(
+            executor, in_context(_synthesize_chunk), paragraphs, chunk_indices, voice_cfg
         )
-        all_audio.extend(audio_data)
-        all_timings.extend(timings)
-        total_duration_ms += chunk_dur_ms
 
-    # Write audio file
+    # Sliding window: at most pool.size chunks are in flight or waiting to be
+    # written, so memory stays bounded however long the lecture is
+    pending: deque[asyncio.Future] = deque()
+    for chunk_indices in chunks:
+        pending.append(submit(chunk_indices))
+        if len(pending) >= pool.size:
+            break
+
+    all_timings = WordTimings()
+    total_duration_ms = 0.0
     filepath = os.path.join(AUDIO_DIR, f"{lecture_id}.mp3")
-    with open(filepath, "wb") as f:
-        f.write(all_audio)
+    try:
+        async with AudioFileWriter(filepath) as out:
+            while pending:
+                audio_data, timings, chunk_dur_ms = await pending.popleft()
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(submit(next_chunk))
+
+                with span("audio.write"):
+                    await out.write(audio_data)
+                # Each chunk's timings start at zero; shift them by the real
+                # duration of everything before it
+                all_timings.extend_shifted(timings, total_duration_ms)
+                total_duration_ms += chunk_dur_ms
+    finally:
+        for fut in pending:
+            fut.cancel()
 
     # Write word timings JSON
     timings_path = os.path.join(AUDIO_DIR, f"{lecture_id}.json")
-    with open(timings_path, "w", encoding="utf-8") as f:
-        json.dump({"p": paragraphs, "w": all_timings}, f, ensure_ascii=False)
+    with span("timings.write"):
+        await write_timings(timings_path, paragraphs, all_timings)
 
     return AudioResult(url=f"/audio/{lecture_id}.mp3", duration_seconds=int(total_duration_ms / 1000))
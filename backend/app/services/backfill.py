@@ -0,0 +1,186 @@
+"""Bulk audio backfill for ready lectures that have no audio yet.
+
+A backfill run selects every ``ready`` lecture with a transcript but no
+``audio_url`` (optionally only one course's or one thinker's) and queues an
+audio job for each, so synthesis goes through the same durable job queue and
+workers as single-lecture requests. ``backfill_run_lectures`` keeps the
+run's lecture set; progress is read back from the lectures and their jobs, so a run interrupted
+by a crash is resumed by opening it again: lectures that got their audio are
+skipped and only the rest are queued.
+"""
+
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.backfill import BackfillRun, BackfillRunLecture
+from app.models.course import Course
+from app.models.job import GenerationJob
+from app.models.lecture import Lecture
+from app.services.job_queue import ACTIVE_STATUSES, JOB_AUDIO, enqueue_job
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+_ID_BATCH = 500
+
+
+@dataclass(frozen=True)
+class BackfillThroughput:
+    elapsed_seconds: float
+    lectures_per_minute: float
+    chars_per_minute: float
+
+
+def _batches(ids: list[uuid.UUID]) -> Iterator[list[uuid.UUID]]:
+    for i in range(0, len(ids), _ID_BATCH):
+        yield ids[i:i + _ID_BATCH]
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for server-side UTC defaults
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+async def find_lectures_missing_audio(
+    db: AsyncSession,
+    course_id: uuid.UUID | None = None,
+    thinker_id: uuid.UUID | None = None,
+) -> list[tuple[uuid.UUID, int]]:
+    """``(lecture_id, transcript length)`` of ready lectures without audio, in course order."""
+    query = (
+        select(Lecture.id, func.length(Lecture.transcript))
+        .where(
+            Lecture.status == "ready",
+            Lecture.audio_url.is_(None),
+            Lecture.transcript != "",
+        )
+        .order_by(Lecture.course_id, Lecture.sequence_number)
+    )
+    if course_id:
+        query = query.where(Lecture.course_id == course_id)
+    if thinker_id:
+        query = query.join(Course, Lecture.course_id == Course.id).where(
+            Course.thinker_id == thinker_id
+        )
+    return [(row[0], row[1]) for row in await db.execute(query)]
+
+
+async def _active_audio_jobs(db: AsyncSession, lecture_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+    active: set[uuid.UUID] = set()
+    for batch in _batches(lecture_ids):
+        active.update(
+            await db.scalars(
+                select(GenerationJob.lecture_id).where(
+                    GenerationJob.kind == JOB_AUDIO,
+                    GenerationJob.status.in_(ACTIVE_STATUSES),
+                    GenerationJob.lecture_id.in_(batch),
+                )
+            )
+        )
+    return active
+
+
+async def open_backfill(
+    db: AsyncSession,
+    course_id: uuid.UUID | None = None,
+    thinker_id: uuid.UUID | None = None,
+) -> BackfillRun:
+    """Start a backfill, or resume the unfinished one with the same filters.
+
+    Lectures that newly match the filters join a resumed run. Every lecture of
+    the run that still lacks audio and has no audio job in flight is queued.
+    """
+    run = await db.scalar(
+        select(BackfillRun)
+        .where(
+            BackfillRun.status == "running",
+            BackfillRun.course_id.is_(None) if course_id is None
+            else BackfillRun.course_id == course_id,
+            BackfillRun.thinker_id.is_(None) if thinker_id is None
+            else BackfillRun.thinker_id == thinker_id,
+        )
+        .order_by(BackfillRun.created_at.desc())
+        .limit(1)
+    )
+    if run is None:
+        run = BackfillRun(course_id=course_id, thinker_id=thinker_id, total=0, total_chars=0)
+        db.add(run)
+        await db.flush()
+        await db.refresh(run)
+
+    missing = await find_lectures_missing_audio(db, course_id, thinker_id)
+    known = set(
+        await db.scalars(
+            select(BackfillRunLecture.lecture_id).where(BackfillRunLecture.backfill_id == run.id)
+        )
+    )
+    joining = [(lecture_id, chars) for lecture_id, chars in missing if lecture_id not in known]
+    db.add_all(BackfillRunLecture(backfill_id=run.id, lecture_id=i) for i, _ in joining)
+    run.total = len(known) + len(joining)
+    run.total_chars += sum(chars for _, chars in joining)
+
+    pending = [lecture_id for lecture_id, _ in missing]
+    active = await _active_audio_jobs(db, pending)
+    payload = {"backfill_id": str(run.id)}
+    for lecture_id in pending:
+        if lecture_id not in active:
+            await enqueue_job(db, JOB_AUDIO, lecture_id, payload)
+
+    await refresh_backfill(db, run)
+    return run
+
+
+async def refresh_backfill(db: AsyncSession, run: BackfillRun) -> BackfillRun:
+    """Recount a run's progress from its lectures and jobs; finish it when nothing is left."""
+    completed = completed_chars = 0
+    pending: list[uuid.UUID] = []
+    rows = await db.execute(
+        select(Lecture.id, Lecture.audio_url, func.length(Lecture.transcript))
+        .join(BackfillRunLecture, BackfillRunLecture.lecture_id == Lecture.id)
+        .where(BackfillRunLecture.backfill_id == run.id)
+    )
+    for lecture_id, audio_url, chars in rows:
+        if audio_url:
+            completed += 1
+            completed_chars += chars
+        else:
+            pending.append(lecture_id)
+
+    # A pending lecture has failed once its jobs from this run all failed. The run's
+    # start is compared in SQL so both sides use the database's timestamp format.
+    active = await _active_audio_jobs(db, pending)
+    started = select(BackfillRun.created_at).where(BackfillRun.id == run.id).scalar_subquery()
+    failed = 0
+    for batch in _batches([lecture_id for lecture_id in pending if lecture_id not in active]):
+        failed += await db.scalar(
+            select(func.count(func.distinct(GenerationJob.lecture_id))).where(
+                GenerationJob.kind == JOB_AUDIO,
+                GenerationJob.status == "failed",
+                GenerationJob.lecture_id.in_(batch),
+                GenerationJob.created_at >= started,
+            )
+        )
+
+    run.completed = completed
+    run.completed_chars = completed_chars
+    run.failed = failed
+    if not active and run.status == "running":
+        run.status = "finished"
+        run.finished_at = datetime.now(timezone.utc)
+    await db.flush()
+    return run
+
+
+def backfill_throughput(run: BackfillRun, now: datetime | None = None) -> BackfillThroughput:
+    """Lectures and characters synthesized per minute since the run was created."""
+    end = run.finished_at or now or datetime.now(timezone.utc)
+    elapsed = max((_aware(end) - _aware(run.created_at)).total_seconds(), 1e-9)
+    minutes = elapsed / 60
+    return BackfillThroughput(
+        elapsed_seconds=elapsed,
+        lectures_per_minute=run.completed / minutes,
+        chars_per_minute=run.completed_chars / minutes,
+    )
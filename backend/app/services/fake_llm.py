@@ -0,0 +1,154 @@
+"""Offline stand-in for the GitHub Models chat-completions API.
+
+``create_app()`` returns an ASGI app that answers any ``POST`` like the real
+endpoint: a JSON completion with ``usage.completion_tokens``, or, with
+``"stream": true``, server-sent-event deltas ending in ``data: [DONE]``. The
+first token arrives after ``ttft`` seconds and the rest at
+``tokens_per_second``; one delta is one token, as the client counts them.
+The lecture text is deterministic for a given prompt, markdown-flavoured
+(headings, bold, italics) so the normalizer has real work to do.
+
+Run it with ``python scripts/fake_llm_server.py`` and point
+``GITHUB_MODELS_ENDPOINT`` at it.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+TOKENS_PER_WORD = 1.3  # completion tokens per English word, for max_tokens
+
+_WORDS = (
+    "the of and to a in that is it as was for on with be by this which not are from "
+    "or have an they but what all were when we there can more one would their if has "
+    "so no about into than its only time other these two may then first any like our "
+    "over such even most after also many before must through where much should well "
+    "because each just those how both between under never life world still own while "
+    "idea reason nature truth question answer mind thought theory experiment evidence "
+    "argument problem principle law energy light space matter motion number proof "
+    "language meaning knowledge experience freedom history science philosophy order "
+    "structure system pattern measure observation model universe society moral value "
+    "consider notice imagine suppose explain follows suggests appears remains becomes"
+).split()
+_OPENERS = (
+    "Now,", "But", "And yet,", "Consider this:", "Here is the point:", "Of course,",
+    "In other words,", "So", "Think about it:", "Still,",
+)
+
+
+def fake_lecture_text(rng: random.Random, words: int) -> str:
+    """About ``words`` words of lecture-like markdown, driven by ``rng``."""
+    paragraphs: list[str] = []
+    total = 0
+    while total < words:
+        if paragraphs and rng.random() < 0.12:
+            paragraphs.append("## " + " ".join(rng.choices(_WORDS, k=rng.randint(2, 5))).title())
+        sentences = []
+        for _ in range(rng.randint(3, 6)):
+            body = rng.choices(_WORDS, k=rng.randint(8, 22))
+            if rng.random() < 0.2:
+                i = rng.randrange(len(body))
+                body[i] = f"**{body[i]}**" if rng.random() < 0.5 else f"*{body[i]}*"
+            if rng.random() < 0.3:
+                body.insert(0, rng.choice(_OPENERS))
+            sentence = " ".join(body)
+            sentences.append(sentence[0].upper() + sentence[1:] + rng.choice(".....?!"))
+            total += len(body)
+        paragraphs.append(" ".join(sentences))
+    return "\n\n".join(paragraphs)
+
+
+def _pieces(text: str) -> list[str]:
+    """Split into one-token deltas: each word with its trailing whitespace."""
+    pieces: list[str] = []
+    start = 0
+    for i in range(1, len(text)):
+        if not text[i].isspace() and text[i - 1].isspace():
+            pieces.append(text[start:i])
+            start = i
+    if text:
+        pieces.append(text[start:])
+    return pieces
+
+
+def _sse(payload: dict) -> str:
+    return f"data: {json.dumps(payload, separators=(',', ':'))}\n\n"
+
+
+def create_app(
+    ttft: float = 0.5,
+    tokens_per_second: float = 80.0,
+    words: int = 2500,
+    failure_rate: float = 0.0,
+) -> Starlette:
+    """A fake chat-completions server with the given latency profile."""
+
+    async def completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake-model")
+        seed = hashlib.sha256(json.dumps(body.get("messages"), sort_keys=True).encode()).digest()
+        rng = random.Random(seed)
+        limit = int(body.get("max_tokens") or 0)
+        target = min(words, int(limit / TOKENS_PER_WORD)) if limit else words
+        pieces = _pieces(fake_lecture_text(rng, target))
+        prompt_tokens = sum(
+            len(str(m.get("content", "")).split()) for m in body.get("messages") or []
+        )
+
+        if random.random() < failure_rate:
+            return JSONResponse({"error": {"message": "Fake upstream failure"}}, status_code=503)
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        if not body.get("stream"):
+            await asyncio.sleep(ttft + len(pieces) / tokens_per_second)
+            return JSONResponse({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(pieces)},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": len(pieces),
+                    "total_tokens": prompt_tokens + len(pieces),
+                },
+            })
+
+        async def events():
+            def chunk(delta: dict, finish_reason: str | None = None) -> str:
+                return _sse({
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                })
+
+            loop = asyncio.get_running_loop()
+            start = loop.time() + ttft
+            yield chunk({"role": "assistant", "content": ""})
+            for i, piece in enumerate(pieces):
+                # Pace against a schedule so sleep overshoot doesn't accumulate
+                delay = start + i / tokens_per_second - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                yield chunk({"content": piece})
+            yield chunk({}, "stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return Starlette(routes=[Route("/{path:path}", completions, methods=["POST"])])
@@ -0,0 +1,310 @@
+"""Offline text-to-speech provider for benchmarks and local development.
+
+Behaves like one of the real providers (``fake_tts_profile``: ``edge-tts``,
+``azure`` or ``openai``) without network access: the same chunk sizes and
+parallelism, a per-chunk latency before the first audio, a synthesis rate in
+characters per second, and, for OpenAI, a Whisper alignment pass after each
+chunk. The output is real: a playable mp3 of silent frames in the profile's
+format, and WordBoundary events at a ~150 words/min speaking pace, written
+through the same ``AudioFileWriter``/``write_timings`` path as production.
+
+Select it with ``TTS_PROVIDER=fake``.
+"""
+
+import asyncio
+import os
+import random
+import time
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+from app.config import settings
+from app.services.audio_writer import AudioFileWriter, write_timings
+from app.services.metrics import TTS_CHUNK_SECONDS
+from app.services.text_normalizer import normalize_transcript
+from app.services.tracing import span
+from app.services.word_timings import ParagraphLocator, WordTimings
+
+AUDIO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "audio")
+
+PROVIDER_NAME = "fake"
+TICKS_PER_MS = 10_000  # WordBoundary offsets use edge-tts/Azure 100 ns ticks
+
+# Speaking pace: ~400 ms per average word plus gaps, i.e. about 150 words/min
+MS_PER_CHAR = 62
+MIN_WORD_MS = 120
+WORD_GAP_MS = 90
+SENTENCE_PAUSE_MS = 300
+PARAGRAPH_PAUSE_MS = 600
+AUDIO_EVENT_MS = 500  # audio delivered in pieces of about this much playback
+
+
+@dataclass(frozen=True)
+class Mp3Format:
+    """A constant-bitrate mono MPEG-2 Layer III stream (16/22.05/24 kHz)."""
+
+    sample_rate: int
+    bitrate_kbps: int
+
+    _BITRATE_INDEX = {8: 1, 16: 2, 24: 3, 32: 4, 40: 5, 48: 6, 56: 7, 64: 8, 80: 9, 96: 10,
+                      112: 11, 128: 12, 144: 13, 160: 14}
+    _RATE_INDEX = {22050: 0, 24000: 1, 16000: 2}
+
+    @property
+    def frame_bytes(self) -> int:
+        return 72 * self.bitrate_kbps * 1000 // self.sample_rate
+
+    @property
+    def frame_ms(self) -> float:
+        return 576 * 1000 / self.sample_rate
+
+    def silent_frame(self) -> bytes:
+        # Sync word, MPEG-2, Layer III, no CRC; bitrate/rate indexes; mono
+        header = bytes([
+            0xFF,
+            0xF3,
+            self._BITRATE_INDEX[self.bitrate_kbps] << 4 | self._RATE_INDEX[self.sample_rate] << 2,
+            0xC0,
+        ])
+        return header + bytes(self.frame_bytes - len(header))
+
+
+@dataclass(frozen=True)
+class FakeProfile:
+    """How a real provider splits and paces a lecture."""
+
+    output_format: str
+    mp3: Mp3Format
+    chunk_chars: int | None  # None: the whole lecture in one stream
+    concurrency: Callable[[], int]
+    align_seconds: float = 0.0  # per-chunk alignment pass after synthesis
+
+
+PROFILES: dict[str, FakeProfile] = {
+    "edge-tts": FakeProfile(
+        "audio-24khz-48kbitrate-mono-mp3", Mp3Format(24000, 48), None, lambda: 1
+    ),
+    "azure": FakeProfile(
+        "Audio16Khz128KBitRateMonoMp3",
+        Mp3Format(16000, 128),
+        5000,
+        lambda: settings.azure_tts_concurrency,
+    ),
+    "openai": FakeProfile(
+        "tts-1/mp3",
+        Mp3Format(24000, 64),
+        4000,
+        lambda: settings.openai_tts_concurrency,
+        align_seconds=0.4,
+    ),
+}
+
+
+def _profile() -> FakeProfile:
+    try:
+        return PROFILES[settings.fake_tts_profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown FAKE_TTS_PROFILE {settings.fake_tts_profile!r} "
+            f"(expected one of {', '.join(PROFILES)})"
+        ) from None
+
+
+def __getattr__(name: str) -> str:
+    # OUTPUT_FORMAT (part of the audio cache key) follows the profile in use
+    # when it is read, and an unknown profile fails synthesis, not this import
+    if name == "OUTPUT_FORMAT":
+        return f"fake/{_profile().output_format}"
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass
+class AudioResult:
+    url: str
+    duration_seconds: int
+
+
+def get_voice_for_thinker(thinker_name: str) -> str:
+    return f"fake-{settings.fake_tts_profile}"
+
+
+def _chunk_paragraphs(paragraphs: list[str], max_chars: int | None) -> list[list[int]]:
+    """Group paragraph indices into chunks that stay under max_chars."""
+    if max_chars is None:
+        return [list(range(len(paragraphs)))] if paragraphs else []
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    current_len = 0
+    for i, para in enumerate(paragraphs):
+        plen = len(para) + 2  # +2 for \n\n separator
+        if current and current_len + plen > max_chars:
+            chunks.append(current)
+            current = [i]
+            current_len = plen
+        else:
+            current.append(i)
+            current_len += plen
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class FakeCommunicate:
+    """Stand-in for ``edge_tts.Communicate``: audio and WordBoundary events for ``text``.
+
+    Events arrive paced so the whole stream takes ``fake_tts_latency`` plus
+    ``len(text) / fake_tts_chars_per_second`` seconds. ``duration_ms`` holds
+    the audio's playback length once the stream is exhausted.
+    """
+
+    def __init__(self, text: str, mp3: Mp3Format) -> None:
+        self.text = text
+        self.mp3 = mp3
+        self.duration_ms = 0.0
+
+    def _words(self) -> list[tuple[int, int]]:
+        """(offset_ms, duration_ms) for every whitespace-separated word."""
+        words = []
+        cursor = 0
+        for p, para in enumerate(self.text.split("\n\n")):
+            if p:
+                cursor += PARAGRAPH_PAUSE_MS
+            for word in para.split():
+                duration = max(MIN_WORD_MS, MS_PER_CHAR * len(word))
+                words.append((cursor, duration))
+                cursor += duration + WORD_GAP_MS
+                if word[-1] in ".!?":
+                    cursor += SENTENCE_PAUSE_MS
+        return words
+
+    async def stream(self) -> AsyncIterator[dict]:
+        words = self._words()
+        total_ms = (words[-1][0] + words[-1][1] + WORD_GAP_MS) if words else 0
+        frames = max(1, round(total_ms / self.mp3.frame_ms))
+        self.duration_ms = frames * self.mp3.frame_ms
+
+        frame = self.mp3.silent_frame()
+        frames_per_event = max(1, round(AUDIO_EVENT_MS / self.mp3.frame_ms))
+        pieces = -(-frames // frames_per_event)
+        synth_seconds = len(self.text) / settings.fake_tts_chars_per_second
+        loop = asyncio.get_running_loop()
+        started = loop.time() + settings.fake_tts_latency
+
+        next_word = 0
+        for piece in range(pieces):
+            await asyncio.sleep(max(0.0, started + synth_seconds * piece / pieces - loop.time()))
+            count = min(frames_per_event, frames - piece * frames_per_event)
+            yield {"type": "audio", "data": frame * count}
+            # Boundaries for the words that start within the audio sent so far
+            sent_ms = (piece * frames_per_event + count) * self.mp3.frame_ms
+            while next_word < len(words) and words[next_word][0] < sent_ms:
+                offset, duration = words[next_word]
+                yield {
+                    "type": "WordBoundary",
+                    "offset": offset * TICKS_PER_MS,
+                    "duration": duration * TICKS_PER_MS,
+                }
+                next_word += 1
+        for offset, duration in words[next_word:]:
+            yield {
+                "type": "WordBoundary",
+                "offset": offset * TICKS_PER_MS,
+                "duration": duration * TICKS_PER_MS,
+            }
+
+
+async def _stream_chunk(
+    profile: FakeProfile, text: str, first_para: int, paragraphs: list[str], sink: asyncio.Queue
+) -> tuple[WordTimings, float]:
+    """Stream one chunk's audio into ``sink``, ending with a ``None`` sentinel.
+
+    Returns the chunk's word timings (relative to the chunk start, with
+    lecture-wide paragraph indices) and its duration in ms.
+    """
+    locator = ParagraphLocator.from_paragraphs(paragraphs)
+    word_timings = WordTimings("d")
+    started = time.perf_counter()
+    try:
+        with span("tts.fake.chunk", characters=len(text)):
+            if random.random() < settings.fake_tts_failure_rate:
+                raise RuntimeError("Fake TTS chunk failed (fake_tts_failure_rate)")
+            communicate = FakeCommunicate(text, profile.mp3)
+            async for event in communicate.stream():
+                if event["type"] == "audio":
+                    await sink.put(event["data"])
+                else:
+                    offset_ms = event["offset"] // TICKS_PER_MS
+                    duration_ms = event["duration"] // TICKS_PER_MS
+                    para_idx = first_para + locator.for_word(len(word_timings))
+                    word_timings.append(offset_ms, offset_ms + duration_ms, para_idx)
+        TTS_CHUNK_SECONDS.labels(PROVIDER_NAME).observe(time.perf_counter() - started)
+    finally:
+        await sink.put(None)
+    if profile.align_seconds:
+        with span("tts.fake.align"):
+            await asyncio.sleep(profile.align_seconds)
+    return word_timings, communicate.duration_ms
+
+
+async def generate_audio(
+    transcript: str,
+    thinker_name: str,
+    lecture_id: str | uuid.UUID,
+) -> AudioResult:
+    """Generate a silent mp3 and word timings shaped like the profile's provider.
+
+    Chunks are synthesized ``concurrency`` at a time and streamed into the
+    output file in order, as the Azure and OpenAI providers do.
+    """
+    os.makedirs(AUDIO_DIR, exist_ok=True)
+
+    profile = _profile()
+    with span("text.normalize"):
+        normalized = normalize_transcript(transcript)
+    paragraphs = list(normalized.paragraphs)
+    chunks = _chunk_paragraphs(paragraphs, profile.chunk_chars)
+
+    filepath = os.path.join(AUDIO_DIR, f"{lecture_id}.mp3")
+    window = max(1, profile.concurrency())
+    pending: deque[tuple[asyncio.Task, asyncio.Queue]] = deque()
+    remaining = iter(chunks)
+
+    def start_next() -> None:
+        indices = next(remaining, None)
+        if indices is not None:
+            chunk_paras = [paragraphs[i] for i in indices]
+            sink: asyncio.Queue = asyncio.Queue()
+            task = asyncio.create_task(_stream_chunk(
+                profile, "\n\n".join(chunk_paras), indices[0], chunk_paras, sink
+            ))
+            pending.append((task, sink))
+
+    for _ in range(window):
+        start_next()
+
+    word_timings = WordTimings()
+    offset_ms = 0.0
+    try:
+        async with AudioFileWriter(filepath) as out:
+            while pending:
+                task, sink = pending[0]
+                while (data := await sink.get()) is not None:
+                    await out.write(data)
+                chunk_timings, chunk_duration_ms = await task  # re-raise if the chunk failed
+                pending.popleft()
+                start_next()
+                word_timings.extend_shifted(chunk_timings, offset_ms)
+                offset_ms += chunk_duration_ms
+    finally:
+        leftovers = [task for task, _ in pending]
+        for task in leftovers:
+            task.cancel()
+        await asyncio.gather(*leftovers, return_exceptions=True)
+
+    timings_path = os.path.join(AUDIO_DIR, f"{lecture_id}.json")
+    with span("timings.write"):
+        await write_timings(timings_path, paragraphs, word_timings)
+
+    return AudioResult(url=f"/audio/{lecture_id}.mp3", duration_seconds=int(offset_ms // 1000))
@@ -0,0 +1,120 @@
+"""Persisted per-job stage timings, and their summary across a backfill.
+
+Every generation job attempt stores one ``generation_timings`` row: its total
+time and the ``StageTimings`` breakdown of the spans it ran (see
+``app.services.tracing``). A backfill's rows are summarized per stage, so a
+stage that is slow across hundreds of lectures stands out, and the slowest
+lectures can be opened in the exported trace by ``trace_id``. A stage's
+share is its wall-clock time over the jobs' total, so concurrent spans do
+not push it past 1; shares still do not add up to 1, since nested stages
+overlap their parents.
+"""
+
+import json
+import logging
+import math
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import async_session
+from app.models.generation_timing import GenerationTiming
+from app.models.job import GenerationJob
+from app.schemas.generation_timing import (
+    BackfillTimingsResponse,
+    GenerationTimingResponse,
+    StageSummary,
+)
+from app.services.tracing import Span, StageTimings
+
+logger = logging.getLogger(__name__)
+
+SLOWEST_LECTURES = 10
+
+
+async def save_job_timings(
+    job: GenerationJob, root: Span, stages: StageTimings, succeeded: bool
+) -> None:
+    """Store a finished job attempt's breakdown (failures are logged, not raised)."""
+    backfill_id = json.loads(job.payload or "{}").get("backfill_id")
+    try:
+        async with async_session() as session:
+            session.add(
+                GenerationTiming(
+                    lecture_id=job.lecture_id,
+                    job_id=job.id,
+                    backfill_id=uuid.UUID(backfill_id) if backfill_id else None,
+                    kind=job.kind,
+                    status="succeeded" if succeeded else "failed",
+                    trace_id=root.trace_id,
+                    total_ms=round(root.duration_ms, 1),
+                    stages=json.dumps(stages.to_dict()),
+                )
+            )
+            await session.commit()
+    except Exception:
+        logger.warning("Could not store timings for job %s", job.id, exc_info=True)
+
+
+async def lecture_generation_timings(
+    db: AsyncSession, lecture_id: uuid.UUID, limit: int
+) -> list[GenerationTiming]:
+    result = await db.execute(
+        select(GenerationTiming)
+        .where(GenerationTiming.lecture_id == lecture_id)
+        .order_by(GenerationTiming.created_at.desc())
+        .limit(limit)
+    )
+    return list(result.scalars())
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+async def backfill_timings(db: AsyncSession, backfill_id: uuid.UUID) -> BackfillTimingsResponse:
+    """Per-stage totals over a backfill's audio jobs, and its slowest lectures."""
+    result = await db.execute(
+        select(GenerationTiming)
+        .where(GenerationTiming.backfill_id == backfill_id)
+        .order_by(GenerationTiming.total_ms.desc())
+    )
+    rows = list(result.scalars())
+
+    per_stage: dict[str, list[dict]] = {}
+    for row in rows:
+        for name, stage in json.loads(row.stages).items():
+            # Rows stored before wall_ms was recorded: the job's time bounds it
+            stage.setdefault("wall_ms", min(stage["total_ms"], row.total_ms))
+            per_stage.setdefault(name, []).append(stage)
+
+    total_ms = sum(row.total_ms for row in rows)
+    stages = []
+    for name, entries in per_stage.items():
+        totals = [entry["total_ms"] for entry in entries]
+        stage_total = sum(totals)
+        stage_wall = sum(entry["wall_ms"] for entry in entries)
+        stages.append(
+            StageSummary(
+                name=name,
+                lectures=len(entries),
+                count=sum(entry["count"] for entry in entries),
+                total_ms=round(stage_total, 1),
+                wall_ms=round(stage_wall, 1),
+                mean_ms=round(stage_total / len(entries), 1),
+                p95_ms=round(_percentile(totals, 0.95), 1),
+                max_ms=max(entry["max_ms"] for entry in entries),
+                share=round(min(stage_wall / total_ms, 1.0), 4) if total_ms else 0.0,
+            )
+        )
+    stages.sort(key=lambda stage: stage.total_ms, reverse=True)
+
+    return BackfillTimingsResponse(
+        backfill_id=backfill_id,
+        jobs=len(rows),
+        total_ms=round(total_ms, 1),
+        stages=stages,
+        slowest=[GenerationTimingResponse.model_validate(row) for row in rows[:SLOWEST_LECTURES]],
+    )
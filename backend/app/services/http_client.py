@@ -0,0 +1,69 @@
+"""Shared, pooled HTTP client for upstream model and TTS APIs.
+
+One ``httpx.AsyncClient`` is created per process (in the API lifespan or the
+worker entry point) so lectures reuse warm TCP/TLS connections instead of
+paying a handshake per call.
+"""
+
+import logging
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """Create a client with the configured pool limits, keep-alive and timeouts."""
+    http2 = settings.http2
+    if http2 and not _http2_available():
+        logger.warning("HTTP2=true but the 'h2' package is not installed; using HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.http_connect_timeout,
+            read=settings.http_read_timeout,
+            write=settings.http_write_timeout,
+            pool=settings.http_pool_timeout,
+        ),
+    )
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = build_http_client()
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use outside the app lifespan."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = build_http_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,216 @@
+"""Durable generation job queue backed by the generation_jobs table.
+
+Jobs are claimed with a conditional UPDATE (``status = 'queued'`` in the WHERE
+clause), so any number of worker processes — on one node or many — can poll
+the same database and each job is handed to exactly one of them. Running jobs
+carry a heartbeat; a job whose worker stops heartbeating is put back on the
+queue (or failed once it runs out of attempts). Every later write a worker
+makes is conditional on still holding the job (its ``worker_id`` and
+``status = 'running'``), so a worker that stalled past its lease can't
+overwrite the results of the worker the job was handed to next.
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.session import async_session
+from app.models.job import GenerationJob
+from app.models.lecture import Lecture
+from app.services.response_cache import invalidate_catalog
+
+JOB_TRANSCRIPT = "transcript"
+JOB_AUDIO = "audio"
+
+ACTIVE_STATUSES = ("queued", "running")
+LEASE_EXPIRED = "Worker lost (lease expired)"
+
+
+class LeaseLost(Exception):
+    """The job was handed to another worker; stop working on it."""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _held_by(job_id: uuid.UUID, worker_id: str) -> tuple:
+    return (
+        GenerationJob.id == job_id,
+        GenerationJob.worker_id == worker_id,
+        GenerationJob.status == "running",
+    )
+
+
+async def enqueue_job(
+    db: AsyncSession,
+    kind: str,
+    lecture_id: uuid.UUID,
+    payload: dict | None = None,
+) -> GenerationJob:
+    """Add a job to the queue using the caller's session (committed with the request)."""
+    job = GenerationJob(
+        kind=kind,
+        lecture_id=lecture_id,
+        payload=json.dumps(payload or {}),
+        status="queued",
+    )
+    db.add(job)
+    await db.flush()
+    await db.refresh(job)
+    return job
+
+
+async def find_active_job(
+    db: AsyncSession, kind: str, lecture_id: uuid.UUID
+) -> GenerationJob | None:
+    """Return a queued or running job of this kind for the lecture, if any."""
+    result = await db.execute(
+        select(GenerationJob)
+        .where(
+            GenerationJob.kind == kind,
+            GenerationJob.lecture_id == lecture_id,
+            GenerationJob.status.in_(ACTIVE_STATUSES),
+        )
+        .order_by(GenerationJob.created_at)
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _requeue_stale_jobs(session: AsyncSession) -> bool:
+    """Release jobs whose worker stopped heartbeating.
+
+    A transcript job that has run out of attempts also marks its lecture as
+    failed, as the worker does when the job raises. Returns True if any
+    lecture changed.
+    """
+    cutoff = _now() - timedelta(seconds=settings.job_lease_seconds)
+    stale = (GenerationJob.status == "running", GenerationJob.heartbeat_at < cutoff)
+    exhausted = (*stale, GenerationJob.attempts >= settings.job_max_attempts)
+    lost_transcripts = select(GenerationJob.lecture_id).where(
+        *exhausted, GenerationJob.kind == JOB_TRANSCRIPT
+    )
+    lectures = await session.execute(
+        update(Lecture)
+        .where(Lecture.id.in_(lost_transcripts), Lecture.status == "generating")
+        .values(status="error", transcript=f"Generation failed: {LEASE_EXPIRED}")
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(
+        update(GenerationJob)
+        .where(*exhausted)
+        .values(status="failed", error=LEASE_EXPIRED, finished_at=_now())
+    )
+    await session.execute(
+        update(GenerationJob)
+        .where(*stale, GenerationJob.attempts < settings.job_max_attempts)
+        .values(status="queued", worker_id=None, stage="requeued")
+    )
+    return lectures.rowcount > 0
+
+
+async def claim_job(
+    worker_id: str, max_tries: int = 5, kinds: tuple[str, ...] | None = None
+) -> GenerationJob | None:
+    """Atomically claim the oldest queued job (of one of ``kinds``, if given) for ``worker_id``.
+
+    Returns the claimed job (detached from any session) or None if the queue is empty.
+    """
+    async with async_session() as session:
+        lectures_failed = await _requeue_stale_jobs(session)
+        await session.commit()
+        if lectures_failed:
+            await invalidate_catalog()
+
+        for _ in range(max_tries):
+            # FOR UPDATE SKIP LOCKED keeps PostgreSQL workers off each other's rows;
+            # SQLite ignores it and serializes the UPDATE below instead.
+            query = select(GenerationJob.id).where(GenerationJob.status == "queued")
+            if kinds:
+                query = query.where(GenerationJob.kind.in_(kinds))
+            candidate = await session.scalar(
+                query.order_by(GenerationJob.created_at).limit(1).with_for_update(skip_locked=True)
+            )
+            if candidate is None:
+                await session.commit()
+                return None
+
+            now = _now()
+            result = await session.execute(
+                update(GenerationJob)
+                .where(GenerationJob.id == candidate, GenerationJob.status == "queued")
+                .values(
+                    status="running",
+                    worker_id=worker_id,
+                    attempts=GenerationJob.attempts + 1,
+                    started_at=now,
+                    heartbeat_at=now,
+                    error=None,
+                )
+            )
+            await session.commit()
+            if result.rowcount == 1:
+                return await session.get(GenerationJob, candidate)
+            # Another worker won the race — try the next job
+        return None
+
+
+async def hold_lease(db: AsyncSession, job_id: uuid.UUID, worker_id: str) -> None:
+    """Refresh the heartbeat in the caller's transaction, or raise :class:`LeaseLost`.
+
+    Call it before committing a job's results: the job row stays locked until
+    that commit, so the lease can't be taken over between the check and the write.
+    """
+    result = await db.execute(
+        update(GenerationJob).where(*_held_by(job_id, worker_id)).values(heartbeat_at=_now())
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        raise LeaseLost(f"Job {job_id} is no longer held by {worker_id}")
+
+
+async def _update_held(job_id: uuid.UUID, worker_id: str, values: dict) -> bool:
+    async with async_session() as session:
+        result = await session.execute(
+            update(GenerationJob).where(*_held_by(job_id, worker_id)).values(**values)
+        )
+        await session.commit()
+        return result.rowcount > 0
+
+
+async def update_progress(
+    job_id: uuid.UUID, worker_id: str, progress: float, stage: str
+) -> None:
+    """Record progress (0.0–1.0) and a short stage label; also refreshes the heartbeat.
+
+    Raises :class:`LeaseLost` if ``worker_id`` no longer holds the job.
+    """
+    progress = min(max(progress, 0.0), 1.0)
+    values = {"progress": progress, "stage": stage, "heartbeat_at": _now()}
+    if not await _update_held(job_id, worker_id, values):
+        raise LeaseLost(f"Job {job_id} is no longer held by {worker_id}")
+
+
+async def heartbeat(job_id: uuid.UUID, worker_id: str) -> bool:
+    """Refresh the lease; False if the job was handed to another worker."""
+    return await _update_held(job_id, worker_id, {"heartbeat_at": _now()})
+
+
+async def complete_job(job_id: uuid.UUID, worker_id: str) -> bool:
+    values = {"status": "succeeded", "progress": 1.0, "stage": "done", "finished_at": _now()}
+    return await _update_held(job_id, worker_id, values)
+
+
+async def fail_job(job_id: uuid.UUID, worker_id: str, error: str, retry: bool) -> bool:
+    """Mark a job failed, or put it back on the queue if ``retry`` is set."""
+    values: dict = {"error": error, "worker_id": None}
+    if retry:
+        values.update(status="queued", stage="retrying")
+    else:
+        values.update(status="failed", finished_at=_now())
+    return await _update_held(job_id, worker_id, values)
@@ -1,16 +1,23 @@
-import httpx
+import json
+import re
+import time
+from collections.abc import AsyncIterator
 
 from app.config import settings
+from app.services.http_client import get_http_client
+from app.services.metrics import LLM_FIRST_TOKEN_SECONDS, record_llm_call
+from app.services.tracing import span
 
+_SENTENCE_END = re.compile(r"[.!?][\"')\]]*\s*$")
 
-async def generate_lecture_transcript(
+
+def _build_messages(
     thinker_name: str,
     system_prompt: str,
     topic: str,
     speaking_style: str = "",
-) -> str:
-    """Generate a lecture transcript using the GitHub Models API."""
-
+) -> list[dict]:
+    """Build the chat-completions messages for a lecture."""
     if not system_prompt:
         system_prompt = (
             f"You are {thinker_name}. You are giving a talk to a friend. "
@@ -37,23 +44,123 @@ async def generate_lecture_transcript(
         f"but don't make it feel like a formal outline."
     )
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.post(
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_message},
+    ]
+
+
+def _request_headers() -> dict:
+    return {
+        "Authorization": f"Bearer {settings.github_token}",
+        "Content-Type": "application/json",
+    }
+
+
+async def generate_lecture_transcript(
+    thinker_name: str,
+    system_prompt: str,
+    topic: str,
+    speaking_style: str = "",
+) -> str:
+    """Generate a lecture transcript using the GitHub Models API."""
+    messages = _build_messages(thinker_name, system_prompt, topic, speaking_style)
+
+    model = settings.default_model
+    client = get_http_client()
+    started = time.perf_counter()
+    with span("llm.request", model=model) as request_span:
+        try:
+            response = await client.post(
+                settings.github_models_endpoint,
+                headers=_request_headers(),
+                json={
+                    "model": model,
+                    "messages": messages,
+                    "temperature": 0.8,
+                    "max_tokens": 8192,
+                },
+            )
+            response.raise_for_status()
+        except Exception:
+            record_llm_call(model, "complete", 0.0, None, failed=True)
+            raise
+        data = response.json()
+        tokens = (data.get("usage") or {}).get("completion_tokens")
+        if tokens:
+            request_span.set("completion_tokens", tokens)
+    record_llm_call(model, "complete", time.perf_counter() - started, tokens)
+    return data["choices"][0]["message"]["content"]
+
+
+async def stream_lecture_transcript(
+    thinker_name: str,
+    system_prompt: str,
+    topic: str,
+    speaking_style: str = "",
+    stop_at_words: int | None = None,
+) -> AsyncIterator[str]:
+    """Stream a lecture transcript from the GitHub Models API as text deltas.
+
+    Uses the chat-completions ``stream: true`` server-sent-events response. If
+    ``stop_at_words`` is set, the stream is closed at the first sentence end
+    after that many words have arrived.
+
+    Each content delta carries about one token, so the deltas are counted as
+    the completion tokens reported to the metrics.
+    """
+    messages = _build_messages(thinker_name, system_prompt, topic, speaking_style)
+    word_count = 0
+    # Tracks whether the previous delta ended mid-word so split words aren't double-counted
+    mid_word = False
+    model = settings.default_model
+    tokens = 0
+    failed = False
+
+    client = get_http_client()
+    started = time.perf_counter()
+    try:
+        async with client.stream(
+            "POST",
             settings.github_models_endpoint,
-            headers={
-                "Authorization": f"Bearer {settings.github_token}",
-                "Content-Type": "application/json",
-            },
+            headers={**_request_headers(), "Accept": "text/event-stream"},
             json={
-                "model": settings.default_model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message},
-                ],
+                "model": model,
+                "messages": messages,
                 "temperature": 0.8,
                 "max_tokens": 8192,
+                "stream": True,
             },
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    return
+                choices = json.loads(data).get("choices") or []
+                if not choices:
+                    continue
+                delta = (choices[0].get("delta") or {}).get("content")
+                if not delta:
+                    continue
+                if not tokens:
+                    LLM_FIRST_TOKEN_SECONDS.labels(model).observe(time.perf_counter() - started)
+                tokens += 1
+                yield delta
+
+                if stop_at_words:
+                    words = len(delta.split())
+                    if mid_word and delta[:1].isalnum():
+                        words -= 1
+                    word_count += max(words, 0)
+                    mid_word = not delta[-1:].isspace()
+                    if word_count >= stop_at_words and _SENTENCE_END.search(delta):
+                        return
+    except Exception:
+        failed = True
+        raise
+    finally:
+        # Also reached when the consumer stops early (GeneratorExit is not a failure)
+        record_llm_call(model, "stream", time.perf_counter() - started, tokens, failed)
@@ -0,0 +1,531 @@
+"""In-process metrics, served in the Prometheus text format at ``/metrics``.
+
+Counters, gauges and histograms are plain floats behind a per-metric lock,
+so recording one costs under a microsecond and nothing leaves the process
+until a scrape. Instrumented here or at the call sites:
+
+* HTTP: latency histogram per route template and status, requests in
+  flight (``MetricsMiddleware``)
+* database: query count, duration and errors per statement kind
+  (``instrument_engine``, applied by ``build_engine``)
+* LLM: call latency, time to first token, completion tokens and tokens/sec
+  from ``generate_lecture_transcript`` and ``stream_lecture_transcript``
+* TTS: characters, characters/sec, chunk latency and failures per provider
+
+Each process only sees its own numbers, and generation runs in the worker,
+not the API. When ``metrics_multiproc_dir`` is set, every process (uvicorn
+workers, ``python -m app.worker``, the backfill CLI) writes a snapshot of its
+metrics there every ``metrics_flush_interval`` seconds, and a scrape of any
+API process sums the snapshots. Snapshots are named by pid and process start
+time, so a reused pid never inherits another process's numbers. Counters and
+histograms of processes that have exited keep counting and their gauges are
+dropped, until the next process to start removes their snapshots; Prometheus
+sees that as a counter reset, which ``rate()`` and ``increase()`` handle.
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SLOW_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+RATE_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_SNAPSHOT_PREFIX = "metrics-"
+
+
+class _Child:
+    """The value of one metric for one combination of label values."""
+
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_buckets", "counts", "sum")
+
+    def __init__(self, lock: threading.Lock, buckets: tuple[float, ...]) -> None:
+        self._lock = lock
+        self._buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], Any] = {}
+        REGISTRY.register(self)
+
+    def _new_child(self) -> Any:
+        return _Child(self._lock)
+
+    def labels(self, *values: str) -> Any:
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} takes labels {self.label_names}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def samples(self) -> list[list]:
+        with self._lock:
+            return [[list(k), c.value] for k, c in self._children.items()]
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "type": self.kind,
+            "help": self.documentation,
+            "labels": list(self.label_names),
+            "samples": self.samples(),
+        }
+
+
+class Counter(Metric):
+    kind = "counter"
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labels)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._lock, self.buckets)
+
+    def samples(self) -> list[list]:
+        with self._lock:
+            return [[list(k), [list(c.counts), c.sum]] for k, c in self._children.items()]
+
+    def describe(self) -> dict[str, Any]:
+        return {**super().describe(), "buckets": list(self.buckets)}
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._callbacks: list[Callable[[], dict[str, dict[str, Any]]]] = []
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def register_callback(self, callback: Callable[[], dict[str, dict[str, Any]]]) -> None:
+        """Add metrics read at scrape time (e.g. a service's stats dataclass).
+
+        ``callback`` returns ``{name: {"type", "help", "labels", "samples"}}``
+        in the same shape as ``Metric.describe``.
+        """
+        self._callbacks.append(callback)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        families = {name: metric.describe() for name, metric in self._metrics.items()}
+        for callback in self._callbacks:
+            try:
+                families.update(callback())
+            except Exception:
+                logger.warning("Metrics callback %r failed", callback, exc_info=True)
+        return families
+
+
+REGISTRY = Registry()
+
+
+def stats_callback(prefix: str, documentation: str, stats: Any) -> dict[str, dict[str, Any]]:
+    """Export each field of a stats dataclass as a ``<prefix>_<field>_total`` counter."""
+    return {
+        f"{prefix}_{field}_total": {
+            "type": "counter",
+            "help": f"{documentation}: {field.replace('_', ' ')}",
+            "labels": [],
+            "samples": [[[], float(value)]],
+        }
+        for field, value in vars(stats).items()
+    }
+
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time to send the full HTTP response",
+    ("method", "route", "status"),
+)
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests being handled", ("method",)
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds", "Database statement execution time", ("operation",), DB_BUCKETS
+)
+DB_QUERY_ERRORS = Counter(
+    "db_query_errors_total", "Database statements that raised", ("operation",)
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_request_duration_seconds",
+    "Time to receive a complete LLM response",
+    ("model", "mode"),
+    SLOW_BUCKETS,
+)
+LLM_FIRST_TOKEN_SECONDS = Histogram(
+    "llm_time_to_first_token_seconds", "Time until the first streamed token", ("model",)
+)
+LLM_COMPLETION_TOKENS = Counter(
+    "llm_completion_tokens_total", "Tokens generated by the LLM", ("model",)
+)
+LLM_TOKENS_PER_SECOND = Histogram(
+    "llm_tokens_per_second", "Generation throughput per LLM call", ("model",), RATE_BUCKETS
+)
+LLM_FAILURES = Counter("llm_failures_total", "LLM calls that raised", ("model", "mode"))
+TTS_CHARACTERS = Counter(
+    "tts_characters_total", "Transcript characters synthesized", ("provider",)
+)
+TTS_CHARACTERS_PER_SECOND = Histogram(
+    "tts_characters_per_second",
+    "Synthesis throughput per lecture",
+    ("provider",),
+    RATE_BUCKETS,
+)
+TTS_CHUNK_SECONDS = Histogram(
+    "tts_chunk_duration_seconds", "Time to synthesize one chunk", ("provider",), SLOW_BUCKETS
+)
+TTS_FAILURES = Counter("tts_failures_total", "Lecture syntheses that raised", ("provider",))
+
+
+def record_llm_call(
+    model: str, mode: str, seconds: float, tokens: int | None, failed: bool = False
+) -> None:
+    if failed:
+        LLM_FAILURES.labels(model, mode).inc()
+        return
+    LLM_REQUEST_SECONDS.labels(model, mode).observe(seconds)
+    if tokens:
+        LLM_COMPLETION_TOKENS.labels(model).inc(tokens)
+        if seconds > 0:
+            LLM_TOKENS_PER_SECOND.labels(model).observe(tokens / seconds)
+
+
+def record_tts_synthesis(provider: str, characters: int, seconds: float) -> None:
+    TTS_CHARACTERS.labels(provider).inc(characters)
+    if seconds > 0:
+        TTS_CHARACTERS_PER_SECOND.labels(provider).observe(characters / seconds)
+
+
+_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+def _route_template(scope) -> str:
+    # The router records the matched route in the scope. Label by its path
+    # template so /api/lectures/{lecture_id} is one series, not one per lecture
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency per route and requests in flight.
+
+    The route is only known once the router has run, so the in-flight gauge
+    is per method and the latency histogram per method, route and status.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in _METHODS else "OTHER"
+        status = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = HTTP_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            HTTP_REQUEST_SECONDS.labels(method, _route_template(scope), str(status)).observe(
+                time.perf_counter() - start
+            )
+
+
+_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+_QUERY_START = "metrics_query_start"
+
+
+def _operation(statement: str) -> str:
+    word = statement.lstrip()[:6].upper()
+    return word if word in _OPERATIONS else "OTHER"
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_QUERY_START, []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start = conn.info[_QUERY_START].pop()
+    DB_QUERY_SECONDS.labels(_operation(statement)).observe(time.perf_counter() - start)
+
+
+def _on_error(context) -> None:
+    starts = context.connection.info.get(_QUERY_START) if context.connection else None
+    if starts:
+        starts.pop()
+    DB_QUERY_ERRORS.labels(_operation(context.statement or "")).inc()
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    """Time every statement ``sync_engine`` executes (idempotent)."""
+    if event.contains(sync_engine, "before_cursor_execute", _before_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_execute)
+    event.listen(sync_engine, "handle_error", _on_error)
+
+
+_identity: tuple[int, int] | None = None
+
+
+def _snapshot_path(directory: str) -> str:
+    """``metrics-<pid>-<start ns>.json`` for this process (re-keyed after a fork)."""
+    global _identity
+    pid = os.getpid()
+    if _identity is None or _identity[0] != pid:
+        _identity = (pid, time.time_ns())
+    return os.path.join(directory, f"{_SNAPSHOT_PREFIX}{pid}-{_identity[1]}.json")
+
+
+def _snapshot_pid(name: str) -> int | None:
+    """The pid in a snapshot's file name, or None if it is not one of ours."""
+    if not (name.startswith(_SNAPSHOT_PREFIX) and name.endswith(".json")):
+        return None
+    pid, _, start = name[len(_SNAPSHOT_PREFIX):-len(".json")].partition("-")
+    if not (pid.isdigit() and start.isdigit()):
+        return None
+    return int(pid)
+
+
+def write_snapshot(directory: str | None = None) -> None:
+    """Write this process's metrics to ``metrics_multiproc_dir`` (atomically)."""
+    directory = directory or settings.metrics_multiproc_dir
+    if not directory:
+        return
+    os.makedirs(directory, exist_ok=True)
+    path = _snapshot_path(directory)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(REGISTRY.snapshot(), f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+async def write_snapshots(stop: asyncio.Event) -> None:
+    """Write a snapshot every ``metrics_flush_interval`` seconds, and once more on ``stop``."""
+    if not settings.metrics_multiproc_dir:
+        return
+    try:
+        await asyncio.to_thread(clear_stale_snapshots)
+    except OSError:
+        logger.warning("Could not clear stale metrics snapshots", exc_info=True)
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=settings.metrics_flush_interval)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await asyncio.to_thread(write_snapshot)
+        except OSError:
+            logger.warning("Could not write the metrics snapshot", exc_info=True)
+
+
+def _alive(pid: int, written_at: float) -> bool:
+    """Whether the process that wrote a snapshot at ``written_at`` is still running.
+
+    A live process rewrites its snapshot every ``metrics_flush_interval``
+    seconds, so an old one belongs to an exited process even if its pid has
+    since been reused.
+    """
+    if time.time() - written_at > max(3 * settings.metrics_flush_interval, 30.0):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def clear_stale_snapshots(directory: str | None = None) -> int:
+    """Delete the snapshots of exited processes; returns how many were removed.
+
+    Every process calls this when it starts writing snapshots, so the
+    directory holds one file per running process plus those that exited
+    since the last start. Legacy ``metrics-<pid>.json`` files go too.
+    """
+    directory = directory or settings.metrics_multiproc_dir
+    if not directory or not os.path.isdir(directory):
+        return 0
+    removed = 0
+    for entry in os.scandir(directory):
+        # Not ``.json.tmp``: another process may be about to rename it
+        if not (entry.name.startswith(_SNAPSHOT_PREFIX) and entry.name.endswith(".json")):
+            continue
+        pid = _snapshot_pid(entry.name)
+        try:
+            if pid is not None and _alive(pid, entry.stat().st_mtime):
+                continue
+            os.remove(entry.path)
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
+
+
+def _read_snapshots(directory: str) -> list[tuple[dict[str, dict[str, Any]], bool]]:
+    snapshots = []
+    for entry in os.scandir(directory):
+        pid = _snapshot_pid(entry.name)
+        if pid is None:
+            continue
+        try:
+            with open(entry.path, encoding="utf-8") as f:
+                families = json.load(f)
+            snapshots.append((families, _alive(pid, entry.stat().st_mtime)))
+        except (ValueError, OSError):
+            continue
+    return snapshots
+
+
+def merge_snapshots(
+    snapshots: Iterable[tuple[dict[str, dict[str, Any]], bool]],
+) -> dict[str, dict[str, Any]]:
+    """Sum samples across processes; gauges only count processes still alive."""
+    merged: dict[str, dict[str, Any]] = {}
+    for families, alive in snapshots:
+        for name, family in families.items():
+            target = merged.setdefault(name, {**family, "samples": {}})
+            if family["type"] == "gauge" and not alive:
+                continue
+            samples = target["samples"]
+            histogram = family["type"] == "histogram"
+            for labels, value in family["samples"]:
+                key = tuple(labels)
+                current = samples.get(key)
+                if current is None:
+                    samples[key] = [list(value[0]), value[1]] if histogram else value
+                elif histogram:
+                    current[0] = [a + b for a, b in zip(current[0], value[0])]
+                    current[1] += value[1]
+                else:
+                    samples[key] = current + value
+    for family in merged.values():
+        family["samples"] = [[list(k), v] for k, v in family["samples"].items()]
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render(families: dict[str, dict[str, Any]]) -> str:
+    """Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    for name in sorted(families):
+        family = families[name]
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        label_names = family["labels"]
+        for values, value in sorted(family["samples"]):
+            if family["type"] != "histogram":
+                lines.append(f"{name}{_labels(label_names, values)} {_number(value)}")
+                continue
+            counts, total = value
+            cumulative = 0
+            for bound, count in zip([*family["buckets"], "+Inf"], counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == "+Inf" else f'le="{_number(bound)}"'
+                lines.append(f"{name}_bucket{_labels(label_names, values, le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(label_names, values)} {_number(total)}")
+            lines.append(f"{name}_count{_labels(label_names, values)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def exposition() -> str:
+    """This process's metrics, summed with the other processes' snapshots if shared."""
+    directory = settings.metrics_multiproc_dir
+    if not directory:
+        return render(REGISTRY.snapshot())
+    write_snapshot(directory)
+    return render(merge_snapshots(_read_snapshots(directory)))
@@ -1,14 +1,23 @@
 """Text-to-speech service using OpenAI TTS + Whisper alignment."""
 
-import json
+import asyncio
 import os
 import re
+import time
 import uuid
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from app.config import settings
+from app.services.audio_writer import AudioFileWriter, write_timings
+from app.services.http_client import get_http_client
+from app.services.metrics import TTS_CHUNK_SECONDS
+from app.services.text_normalizer import normalize_transcript
+from app.services.tracing import span
+from app.services.word_timings import WordTimings
 
 AUDIO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "audio")
 
@@ -31,20 +40,13 @@ OPENAI_VOICE_MAP: dict[str, str] = {
 
 DEFAULT_VOICE = "alloy"
 
+PROVIDER_NAME = "openai"
+TTS_MODEL = "tts-1"
+RESPONSE_FORMAT = "mp3"
+OUTPUT_FORMAT = f"{TTS_MODEL}/{RESPONSE_FORMAT}"
 
-def strip_markdown(text: str) -> str:
-    """Remove markdown formatting so TTS reads clean text."""
-    text = re.sub(r"#{1,6}\s*", "", text)
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"\*(.+?)\*", r"\1", text)
-    text = re.sub(r"_(.+?)_", r"\1", text)
-    text = re.sub(r"`(.+?)`", r"\1", text)
-    text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)
-    text = re.sub(r"^[-*+]\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\d+\.\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"---+", "", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
+MAX_CHUNK_CHARS = 4000  # OpenAI TTS input limit is 4096 characters
+STREAM_READ_BYTES = 64 * 1024
 
 
 @dataclass
@@ -57,40 +59,41 @@ def get_voice_for_thinker(thinker_name: str) -> str:
     return OPENAI_VOICE_MAP.get(thinker_name, DEFAULT_VOICE)
 
 
-async def generate_audio(
-    transcript: str,
-    thinker_name: str,
-    lecture_id: str | uuid.UUID,
-) -> AudioResult:
-    """Generate audio via OpenAI TTS, then align with Whisper for word timestamps."""
-    os.makedirs(AUDIO_DIR, exist_ok=True)
+@dataclass
+class TextChunk:
+    text: str
+    first_para: int  # index of the first paragraph this chunk covers
+    last_para: int   # index of the last paragraph this chunk covers
 
-    voice = get_voice_for_thinker(thinker_name)
-    clean_text = strip_markdown(transcript)
 
-    # Determine paragraph boundaries
-    paragraphs = [p.strip() for p in clean_text.split("\n\n") if p.strip()]
+def _chunk_text(paragraphs: list[str], max_chars: int = MAX_CHUNK_CHARS) -> list[TextChunk]:
+    """Chunk text into <=max_chars segments, splitting on sentence boundaries
+    so no chunk ends mid-sentence (avoids unnatural cuts in audio)."""
+    chunks: list[TextChunk] = []
+    current_chunk = ""
+    first = last = 0
 
-    client = OpenAI(api_key=settings.openai_api_key)
+    def flush() -> None:
+        chunks.append(TextChunk(current_chunk, first, last))
 
-    # 1. Chunk text into <=4000 char segments, splitting on sentence boundaries
-    #    so no chunk ends mid-sentence (avoids unnatural cuts in audio).
-    chunks: list[str] = []
-    current_chunk = ""
-    for para in paragraphs:
+    for pi, para in enumerate(paragraphs):
         # If adding this paragraph stays under limit, append it
         candidate = (current_chunk + "\n\n" + para).strip() if current_chunk else para
-        if len(candidate) <= 4000:
+        if len(candidate) <= max_chars:
+            if not current_chunk:
+                first = pi
             current_chunk = candidate
+            last = pi
             continue
 
         # Flush current chunk if it has content
         if current_chunk:
-            chunks.append(current_chunk)
+            flush()
             current_chunk = ""
 
+        first = last = pi
         # If a single paragraph fits, use it as-is
-        if len(para) <= 4000:
+        if len(para) <= max_chars:
             current_chunk = para
             continue
 
@@ -98,116 +101,226 @@ async def generate_audio(
         sentences = re.split(r'(?<=[.!?])\s+', para)
         for sentence in sentences:
             candidate = (current_chunk + " " + sentence).strip() if current_chunk else sentence
-            if len(candidate) <= 4000:
+            if len(candidate) <= max_chars:
                 current_chunk = candidate
             else:
                 if current_chunk:
-                    chunks.append(current_chunk)
+                    flush()
                 current_chunk = sentence
     if current_chunk:
-        chunks.append(current_chunk)
+        flush()
+    return chunks
 
-    # 2. Generate audio for each chunk with the SAME voice and concatenate
-    filepath = os.path.join(AUDIO_DIR, f"{lecture_id}.mp3")
-    if len(chunks) == 1:
-        response = client.audio.speech.create(
-            model="tts-1", voice=voice, input=chunks[0], response_format="mp3",
-        )
-        response.stream_to_file(filepath)
-    else:
-        # Generate each chunk with identical model+voice for consistent sound
-        chunk_files = []
-        for i, chunk in enumerate(chunks):
-            chunk_path = os.path.join(AUDIO_DIR, f"{lecture_id}_chunk{i}.mp3")
-            response = client.audio.speech.create(
-                model="tts-1", voice=voice, input=chunk, response_format="mp3",
-            )
-            response.stream_to_file(chunk_path)
-            chunk_files.append(chunk_path)
-
-        # Concatenate MP3 files (same codec/bitrate from same model = seamless)
-        with open(filepath, "wb") as outfile:
-            for cf in chunk_files:
-                with open(cf, "rb") as infile:
-                    outfile.write(infile.read())
-                os.remove(cf)
-
-    # 3. Get word-level timestamps via Whisper (also request segments for paragraph mapping)
-    with open(filepath, "rb") as audio_file:
-        whisper_response = client.audio.transcriptions.create(
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def _tokens(text: str) -> list[str]:
+    return _NON_WORD.sub("", text).lower().split()
+
+
+def _field(obj, name: str, default=0):
+    """Read a field from a Whisper segment, which may be a dict or an object."""
+    return obj.get(name, default) if isinstance(obj, dict) else getattr(obj, name, default)
+
+
+def _get_client() -> AsyncOpenAI:
+    # Cheap to construct; connections come from the shared pooled HTTP client
+    return AsyncOpenAI(api_key=settings.openai_api_key, http_client=get_http_client())
+
+
+def _align_chunk(
+    whisper_response, chunk: TextChunk, para_tokens: list[frozenset[str]]
+) -> tuple[WordTimings, float]:
+    """Map a chunk's Whisper words to paragraphs.
+
+    Returns (word_timings, duration_ms), with timings relative to the start of
+    the chunk and paragraphs limited to those the chunk covers.
+    """
+    # Map Whisper segments to our paragraphs by sequential text matching
+    segments = whisper_response.segments or []
+    seg_lo: list[float] = []    # segment start minus tolerance
+    seg_hi: list[float] = []    # segment end plus tolerance (non-decreasing)
+    seg_para: list[int] = []
+    para_cursor = chunk.first_para
+
+    for seg in segments:
+        seg_text = _tokens(_field(seg, "text", ""))
+        if seg_text:
+            # Find which of the next few paragraphs this segment best aligns with
+            best_para = para_cursor
+            best_overlap = 0
+            for pi in range(para_cursor, min(para_cursor + 3, chunk.last_para + 1)):
+                overlap = sum(1 for w in seg_text if w in para_tokens[pi])
+                if overlap > best_overlap:
+                    best_overlap = overlap
+                    best_para = pi
+            para_cursor = best_para
+
+        seg_lo.append(_field(seg, "start") - 0.05)
+        seg_hi.append(max(_field(seg, "end") + 0.05, seg_hi[-1] if seg_hi else 0.0))
+        seg_para.append(para_cursor)
+
+    # Assign each word the paragraph of the first segment containing it
+    word_timings = WordTimings("d")
+    words = getattr(whisper_response, "words", None) or []
+    last_para_idx = chunk.first_para
+    for word_info in words:
+        para_idx = last_para_idx
+        j = bisect_left(seg_hi, word_info.start)
+        if j < len(seg_hi) and seg_lo[j] <= word_info.start:
+            para_idx = seg_para[j]
+        # Never go backwards within a chunk
+        para_idx = max(para_idx, last_para_idx)
+        last_para_idx = para_idx
+        word_timings.append(word_info.start * 1000, word_info.end * 1000, para_idx)
+
+    duration_s = getattr(whisper_response, "duration", None)
+    if not duration_s:
+        duration_s = max(seg_hi[-1] - 0.05 if seg_hi else 0.0, word_timings.end_ms / 1000)
+    return word_timings, float(duration_s) * 1000
+
+
+async def _transcribe_chunk(
+    client: AsyncOpenAI,
+    audio: bytes,
+    index: int,
+    chunk: TextChunk,
+    para_tokens: list[frozenset[str]],
+) -> tuple[WordTimings, float]:
+    with span("tts.openai.whisper", chunk=index):
+        whisper_response = await client.audio.transcriptions.create(
             model="whisper-1",
-            file=audio_file,
+            file=(f"chunk{index}.mp3", audio),
             response_format="verbose_json",
             timestamp_granularities=["word", "segment"],
         )
+    with span("tts.openai.align", chunk=index):
+        return _align_chunk(whisper_response, chunk, para_tokens)
+
+
+async def _stream_chunk(
+    client: AsyncOpenAI, voice: str, text: str, sink: asyncio.Queue
+) -> bytes:
+    """Stream one chunk's mp3 bytes into ``sink``, ending with a ``None`` sentinel.
+
+    Returns the chunk's complete audio for Whisper alignment.
+    """
+    audio = bytearray()
+    started = time.perf_counter()
+    try:
+        with span("tts.openai.chunk", characters=len(text)):
+            async with client.audio.speech.with_streaming_response.create(
+                model=TTS_MODEL, voice=voice, input=text, response_format=RESPONSE_FORMAT,
+            ) as response:
+                async for data in response.iter_bytes(STREAM_READ_BYTES):
+                    audio.extend(data)
+                    await sink.put(data)
+        TTS_CHUNK_SECONDS.labels(PROVIDER_NAME).observe(time.perf_counter() - started)
+    finally:
+        await sink.put(None)
+    return bytes(audio)
 
-    # 4. Map Whisper segments to our paragraphs by text similarity,
-    #    then assign each word's paragraph based on its segment's time range.
 
-    # Build segment→paragraph mapping using sequential text matching
-    segments = whisper_response.segments or []
-    seg_to_para: dict[int, int] = {}  # segment_index → paragraph_index
-    para_cursor = 0
+async def generate_audio(
+    transcript: str,
+    thinker_name: str,
+    lecture_id: str | uuid.UUID,
+) -> AudioResult:
+    """Generate audio via OpenAI TTS, aligning each chunk with Whisper for word timestamps.
 
-    for si, seg in enumerate(segments):
-        seg_text = re.sub(r'[^\w\s]', '', (seg.get("text", "") if isinstance(seg, dict) else getattr(seg, "text", ""))).lower().split()
-        if not seg_text:
-            seg_to_para[si] = para_cursor
-            continue
+    Chunks are requested concurrently (up to ``openai_tts_concurrency`` at a
+    time) and streamed into the output file in order. Each chunk is sent to
+    Whisper as soon as it is synthesized, while later chunks are still being
+    generated; chunk-relative timings are shifted into place at the end.
+    """
+    os.makedirs(AUDIO_DIR, exist_ok=True)
+
+    voice = get_voice_for_thinker(thinker_name)
+    with span("text.normalize"):
+        normalized = normalize_transcript(transcript)
+    clean_text = normalized.text
 
-        # Find which paragraph this segment best aligns with
-        best_para = para_cursor
-        best_overlap = 0
-        for pi in range(para_cursor, min(para_cursor + 3, len(paragraphs))):
-            para_text = set(re.sub(r'[^\w\s]', '', paragraphs[pi]).lower().split())
-            overlap = sum(1 for w in seg_text if w in para_text)
-            if overlap > best_overlap:
-                best_overlap = overlap
-                best_para = pi
-
-        seg_to_para[si] = best_para
-        para_cursor = best_para
-
-    # Build time→paragraph lookup from segments
-    seg_ranges: list[tuple[float, float, int]] = []
-    for si, seg in enumerate(segments):
-        s = seg.get("start", 0) if isinstance(seg, dict) else getattr(seg, "start", 0)
-        e = seg.get("end", 0) if isinstance(seg, dict) else getattr(seg, "end", 0)
-        seg_ranges.append((s, e, seg_to_para.get(si, 0)))
-
-    # Assign each Whisper word to a paragraph based on which segment it falls in
-    word_timings: list[dict] = []
-    last_para_idx = 0  # paragraph index should only increase (monotonic)
-
-    if hasattr(whisper_response, "words") and whisper_response.words:
-        for word_info in whisper_response.words:
-            start_ms = int(word_info.start * 1000)
-            end_ms = int(word_info.end * 1000)
-            word_time = word_info.start
-
-            # Find which segment this word belongs to
-            para_idx = last_para_idx
-            for seg_start, seg_end, seg_para in seg_ranges:
-                if word_time >= seg_start - 0.05 and word_time <= seg_end + 0.05:
-                    para_idx = seg_para
-                    break
-
-            # Never go backwards — prevents chunk-boundary resets
-            if para_idx < last_para_idx:
-                para_idx = last_para_idx
-            last_para_idx = para_idx
-
-            word_timings.append({"s": start_ms, "e": end_ms, "p": para_idx})
+    # Determine paragraph boundaries
+    paragraphs = list(normalized.paragraphs)
+    para_tokens = [frozenset(_tokens(p)) for p in paragraphs]
+
+    client = _get_client()
+
+    # 1. Chunk text into <=4000 char segments on sentence boundaries
+    chunks = _chunk_text(paragraphs)
+
+    # 2. Generate audio for each chunk with the SAME voice (consistent sound) and
+    #    concatenate (same codec/bitrate from same model = seamless). The head
+    #    chunk streams straight to disk; the next few download concurrently and
+    #    buffer until their turn. A chunk slot is only refilled once the head is
+    #    written, so at most openai_tts_concurrency chunks are being synthesized.
+    filepath = os.path.join(AUDIO_DIR, f"{lecture_id}.mp3")
+    window = max(1, settings.openai_tts_concurrency)
+    pending: deque[tuple[asyncio.Task, asyncio.Queue]] = deque()
+    aligning: deque[asyncio.Task] = deque()  # alignments still holding their chunk's audio
+    alignments: list[asyncio.Task] = []
+    remaining = iter(chunks)
+
+    def start_next() -> None:
+        chunk = next(remaining, None)
+        if chunk is not None:
+            sink: asyncio.Queue = asyncio.Queue()
+            task = asyncio.create_task(_stream_chunk(client, voice, chunk.text, sink))
+            pending.append((task, sink))
+
+    for _ in range(window):
+        start_next()
+
+    try:
+        async with AudioFileWriter(filepath) as out:
+            while pending:
+                task, sink = pending[0]
+                while (data := await sink.get()) is not None:
+                    await out.write(data)
+                audio = await task  # re-raise if the request failed
+                pending.popleft()
+                start_next()
+
+                # 3. Word-level timestamps via Whisper, overlapping later synthesis.
+                #    At most openai_tts_concurrency chunks wait on alignment; past
+                #    that, the oldest is awaited first, so a Whisper slower than
+                #    synthesis holds back the writer instead of piling up the
+                #    lecture's audio in memory (2 x window chunks at most).
+                while aligning and aligning[0].done():
+                    aligning.popleft()
+                while len(aligning) >= window:
+                    await aligning.popleft()
+                index = len(alignments)
+                alignment = asyncio.create_task(
+                    _transcribe_chunk(client, audio, index, chunks[index], para_tokens)
+                )
+                alignments.append(alignment)
+                aligning.append(alignment)
+                del audio
+        results = await asyncio.gather(*alignments)
+    finally:
+        leftovers = [task for task, _ in pending] + alignments
+        for task in leftovers:
+            task.cancel()
+        await asyncio.gather(*leftovers, return_exceptions=True)
+
+    # 4. Merge chunk timings, offsetting each by the duration of the chunks before it
+    word_timings = WordTimings()
+    offset_ms = 0.0
+    for chunk_timings, chunk_duration_ms in results:
+        word_timings.extend_shifted(chunk_timings, offset_ms)
+        offset_ms += chunk_duration_ms
 
     # 5. Write word timings JSON
     timings_path = os.path.join(AUDIO_DIR, f"{lecture_id}.json")
-    with open(timings_path, "w", encoding="utf-8") as f:
-        json.dump({"p": paragraphs, "w": word_timings}, f, ensure_ascii=False)
+    with span("timings.write"):
+        await write_timings(timings_path, paragraphs, word_timings)
 
     # Calculate duration from last word timing
     duration = 0
-    if word_timings:
-        duration = word_timings[-1]["e"] // 1000 + 1
+    if len(word_timings):
+        duration = word_timings.end_ms // 1000 + 1
     else:
         duration = int(len(clean_text.split()) / 150 * 60)
 
@@ -0,0 +1,86 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+Pages are ordered by the endpoint's existing sort key plus ``id`` as a
+tiebreaker, and the next page starts strictly after the last row of the
+previous one: ``WHERE (sort_key, id) > (:last_key, :last_id)``. With an index
+on ``(sort_key, id)`` every page costs the same no matter how deep it is,
+unlike ``OFFSET``, which reads and discards every row before the page.
+
+Cursors are opaque to clients (base64 of the scope and the last row's sort
+values). A page's response body is unchanged (a JSON list); when there is
+a next page its cursor is sent in the ``X-Next-Cursor`` header.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import Select, bindparam, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page:
+    items: list
+    next_cursor: str | None = None
+    headers: dict[str, str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.headers = {NEXT_CURSOR_HEADER: self.next_cursor} if self.next_cursor else {}
+
+
+def encode_cursor(scope: str, values: tuple) -> str:
+    raw = json.dumps([scope, *(str(v) if not isinstance(v, int) else v for v in values)])
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, scope: str, sort: tuple[InstrumentedAttribute, ...]) -> tuple:
+    """Sort values encoded in ``cursor``, converted to the sort columns' Python types."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_scope, *values = json.loads(raw)
+        if cursor_scope != scope or len(values) != len(sort):
+            raise ValueError(cursor_scope)
+        return tuple(col.type.python_type(v) for col, v in zip(sort, values))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _sort_values(row: Any, sort: tuple[InstrumentedAttribute, ...]) -> tuple:
+    return tuple(getattr(row, col.key) for col in sort)
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    sort: tuple[InstrumentedAttribute, ...],
+    limit: int,
+    cursor: str | None,
+    scope: str,
+    scalars: bool = True,
+) -> Page:
+    """Run ``query`` for one page of ``limit`` rows ordered by ``sort``.
+
+    ``sort`` must end with a unique column (the primary key) so the order is
+    total, and those columns must be loaded on the returned entities (or
+    selected, for a Core select of columns with ``scalars=False``).
+    """
+    if cursor:
+        after = decode_cursor(cursor, scope, sort)
+        query = query.where(
+            tuple_(*sort) > tuple_(*(bindparam(None, v, col.type) for col, v in zip(sort, after)))
+        )
+    result = await db.execute(query.order_by(*sort).limit(limit + 1))
+    rows = list(result.scalars().all() if scalars else result.all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(scope, _sort_values(rows[-1], sort))
+    return Page(rows, next_cursor)
@@ -0,0 +1,293 @@
+"""Read-through cache of serialized catalog responses.
+
+Thinkers, courses and finished lectures change only when an admin edits them
+or a worker finishes generating, but every page view used to query them and
+run Pydantic validation again. Cached routes store the final JSON bytes
+under a key built from the route name and its parameters, so a hit skips
+both the database and serialization.
+
+Entries live in an in-process LRU with a TTL. When ``response_cache_url``
+points at Redis (the ``cache`` extra), entries are also shared between
+processes, and so is invalidation. Writes don't delete keys; they bump a
+catalog *generation* that is part of every key. A read that started before
+the write stores its result under the old generation, so a stale response
+can't be cached after the invalidation. Without a shared backend the
+generation is the ``catalog_generation`` row, read at most every
+``response_cache_generation_poll`` seconds, so changes committed by another
+process (a standalone worker, a backfill) reach this one within that delay.
+"""
+
+import json
+import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.db.session import async_session
+from app.models.catalog_generation import CatalogGeneration
+from app.services.pagination import Page
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # optional: pip install -e ".[cache]"
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+_GENERATION_KEY = "symposium:catalog:generation"
+_ENTRY_PREFIX = "symposium:catalog:"
+_HEADERS_LEN = struct.Struct("<I")
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    invalidations: int = 0
+    shared_errors: int = 0
+
+
+stats = ResponseCacheStats()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: dict[str, str]
+
+    def pack(self) -> bytes:
+        headers = json.dumps(self.headers).encode()
+        return _HEADERS_LEN.pack(len(headers)) + headers + self.body
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "CachedResponse":
+        (size,) = _HEADERS_LEN.unpack_from(data)
+        start = _HEADERS_LEN.size
+        return cls(data[start + size:], json.loads(data[start:start + size]))
+
+    def to_response(self) -> Response:
+        return Response(self.body, media_type="application/json", headers=self.headers)
+
+
+def cache_key(route: str, **params: Any) -> str:
+    """``route?a=1&b=2`` with parameters sorted and unset ones left out."""
+    query = "&".join(f"{k}={v}" for k, v in sorted(params.items()) if v is not None)
+    return f"{route}?{query}"
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int, ttl: float, shared_url: str = ""):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._generation_read_at = float("-inf")
+        self._shared = None
+        if shared_url:
+            if aioredis is None:
+                logger.warning(
+                    "RESPONSE_CACHE_URL is set but the 'redis' package is not installed; "
+                    "using the in-process cache only"
+                )
+            else:
+                self._shared = aioredis.from_url(shared_url)
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def _set_generation(self, generation: int) -> None:
+        if generation != self._generation:
+            self._generation = generation
+            with self._lock:
+                self._entries.clear()
+
+    async def _current_generation(self) -> int:
+        if self._shared is not None:
+            try:
+                generation = int(await self._shared.get(_GENERATION_KEY) or 0)
+            except Exception:
+                stats.shared_errors += 1
+                logger.warning("Shared response cache unavailable", exc_info=True)
+                return self._generation
+        else:
+            now = time.monotonic()
+            if now - self._generation_read_at < settings.response_cache_generation_poll:
+                return self._generation
+            self._generation_read_at = now
+            try:
+                async with async_session() as session:
+                    generation = await session.scalar(
+                        select(CatalogGeneration.generation).where(CatalogGeneration.id == 1)
+                    ) or 0
+            except Exception:
+                stats.shared_errors += 1
+                logger.warning("Could not read the catalog generation", exc_info=True)
+                return self._generation
+        # Changed when another process invalidated the catalog
+        self._set_generation(generation)
+        return self._generation
+
+    async def get(self, key: str) -> tuple[int, CachedResponse | None]:
+        """Return the current generation and the cached response for ``key``, if any."""
+        generation = await self._current_generation()
+        entry_key = f"{generation}:{key}"
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(entry_key)
+                stats.hits += 1
+                return generation, entry[1]
+
+        if self._shared is not None:
+            try:
+                packed = await self._shared.get(_ENTRY_PREFIX + entry_key)
+            except Exception:
+                stats.shared_errors += 1
+                packed = None
+            if packed is not None:
+                stats.shared_hits += 1
+                cached = CachedResponse.unpack(packed)
+                self._put(entry_key, cached, now)
+                return generation, cached
+
+        stats.misses += 1
+        return generation, None
+
+    def _put(self, entry_key: str, cached: CachedResponse, now: float) -> None:
+        with self._lock:
+            self._entries[entry_key] = (now + self.ttl, cached)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def set(self, key: str, generation: int, cached: CachedResponse) -> None:
+        entry_key = f"{generation}:{key}"
+        self._put(entry_key, cached, time.monotonic())
+        stats.stores += 1
+        if self._shared is not None:
+            try:
+                await self._shared.set(
+                    _ENTRY_PREFIX + entry_key, cached.pack(), ex=max(int(self.ttl), 1)
+                )
+            except Exception:
+                stats.shared_errors += 1
+
+    async def invalidate(self) -> None:
+        """Make every cached response stale, in this process and (if shared) all others."""
+        stats.invalidations += 1
+        try:
+            if self._shared is not None:
+                generation = int(await self._shared.incr(_GENERATION_KEY))
+            else:
+                generation = await _increment_catalog_generation()
+        except Exception:
+            stats.shared_errors += 1
+            logger.warning("Could not invalidate the shared response cache", exc_info=True)
+            generation = self._generation + 1
+        self._generation = generation
+        self._generation_read_at = time.monotonic()
+        with self._lock:
+            self._entries.clear()
+
+    async def close(self) -> None:
+        if self._shared is not None:
+            await self._shared.aclose()
+
+
+async def _increment_catalog_generation() -> int:
+    async with async_session() as session:
+        bumped = await session.execute(
+            update(CatalogGeneration)
+            .where(CatalogGeneration.id == 1)
+            .values(generation=CatalogGeneration.generation + 1)
+        )
+        if not bumped.rowcount:  # a create_all database has the table but not the row
+            session.add(CatalogGeneration(id=1, generation=1))
+        await session.commit()
+        return await session.scalar(
+            select(CatalogGeneration.generation).where(CatalogGeneration.id == 1)
+        )
+
+
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(
+            settings.response_cache_max_entries,
+            settings.response_cache_ttl,
+            settings.response_cache_url,
+        )
+    return _cache
+
+
+async def _build(
+    adapter: TypeAdapter, load: Callable[[], Awaitable[Any]]
+) -> tuple[Any, CachedResponse]:
+    loaded = await load()
+    headers: dict[str, str] = {}
+    if isinstance(loaded, Page):
+        headers = loaded.headers
+        loaded = loaded.items
+    value = adapter.validate_python(loaded, from_attributes=True)
+    return value, CachedResponse(adapter.dump_json(value), headers)
+
+
+async def read_through(
+    key: str,
+    adapter: TypeAdapter,
+    load: Callable[[], Awaitable[Any]],
+    cacheable: Callable[[Any], bool] | None = None,
+) -> Response:
+    """Serve ``key`` from the cache, or ``load()`` it, serialize it with ``adapter`` and store it.
+
+    ``load`` may return ORM objects; they are validated through ``adapter``
+    exactly as ``response_model`` would. It may also return a
+    :class:`~app.services.pagination.Page`, whose items are serialized and whose
+    headers (the next-page cursor) are cached with them. Results for which
+    ``cacheable`` returns False are served but not stored.
+    """
+    if not settings.response_cache_enabled:
+        return (await _build(adapter, load))[1].to_response()
+
+    cache = get_response_cache()
+    generation, cached = await cache.get(key)
+    if cached is None:
+        value, cached = await _build(adapter, load)
+        if cacheable is None or cacheable(value):
+            await cache.set(key, generation, cached)
+    return cached.to_response()
+
+
+def cache_size() -> int:
+    """Entries in this process's cache, without creating it."""
+    return _cache.size if _cache is not None else 0
+
+
+async def invalidate_catalog() -> None:
+    """Call after committing a change to thinkers, courses or lectures."""
+    if settings.response_cache_enabled:
+        await get_response_cache().invalidate()
+
+
+async def close_response_cache() -> None:
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
@@ -0,0 +1,51 @@
+"""Compiled markdown normalizer shared by all TTS providers.
+
+Replaces the per-provider ``strip_markdown`` copies with one module that
+returns the clean text and the paragraph list together. It is not a single
+pass: the ten substitutions still run in the legacy order (headings, bold,
+italics, underscores, code, links, list markers, rules, blank-line runs)
+because each one sees what the earlier ones left. ``_..._`` can pair across
+a link's URL, and stripping ``#`` turns ``## - x`` into a bullet, for
+instance, and a one-pass tokenizer would change the spoken text in those
+cases. What is saved is the recompilation and every pass whose marker text
+does not occur in the transcript.
+"""
+
+import re
+from dataclasses import dataclass
+
+# (marker that must occur for the pass to match, pattern, replacement), in order
+_PASSES: tuple[tuple[str, re.Pattern, str], ...] = (
+    ("#", re.compile(r"#{1,6}\s*"), ""),
+    ("**", re.compile(r"\*\*(.+?)\*\*"), r"\1"),
+    ("*", re.compile(r"\*(.+?)\*"), r"\1"),
+    ("_", re.compile(r"_(.+?)_"), r"\1"),
+    ("`", re.compile(r"`(.+?)`"), r"\1"),
+    ("](", re.compile(r"\[(.+?)\]\(.+?\)"), r"\1"),
+    ("", re.compile(r"^[-*+]\s+", re.MULTILINE), ""),
+    ("", re.compile(r"^\d+\.\s+", re.MULTILINE), ""),
+    ("---", re.compile(r"---+"), ""),
+    ("\n\n\n", re.compile(r"\n{3,}"), "\n\n"),
+)
+
+
+@dataclass(frozen=True)
+class NormalizedTranscript:
+    text: str
+    paragraphs: tuple[str, ...]
+
+
+def normalize_transcript(transcript: str) -> NormalizedTranscript:
+    """Strip markdown and split the result into paragraphs."""
+    text = transcript
+    for marker, pattern, replacement in _PASSES:
+        if marker in text:
+            text = pattern.sub(replacement, text)
+    clean_text = text.strip()
+    paragraphs = tuple(filter(None, (p.strip() for p in clean_text.split("\n\n"))))
+    return NormalizedTranscript(text=clean_text, paragraphs=paragraphs)
+
+
+def strip_markdown(text: str) -> str:
+    """Remove markdown formatting so TTS reads clean text."""
+    return normalize_transcript(text).text
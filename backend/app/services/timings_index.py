@@ -0,0 +1,123 @@
+"""Per-lecture index for time-windowed word timing lookups.
+
+Multi-hour lectures have tens of thousands of words, and the player only
+needs the ones near the playhead. A :class:`TimingsIndex` is built once from
+the timings file next to a lecture's audio and answers "which words and
+paragraphs overlap ``[from_ms, to_ms)``" in O(log n):
+
+* word starts are non-decreasing, so the last candidate is a bisect on them;
+* ends need not be (a long word can outlast the next one's start), so every
+  ``SEEK_STRIDE`` words a seek point records the largest end so far. Bisecting
+  the seek points finds the block holding the first word that ends after
+  ``from_ms``, and at most one block is scanned linearly.
+
+Indexes are cached per lecture and rebuilt when the timings file changes.
+"""
+
+import os
+import threading
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.services.audio_assets import lecture_audio_path
+from app.services.word_timings import WordTimings
+
+SEEK_STRIDE = 64
+_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class TimingsWindow:
+    first_word: int
+    starts: array
+    ends: array
+    paras: array
+    paragraphs: dict[int, str]
+
+
+class TimingsIndex:
+    __slots__ = ("paragraphs", "timings", "_seek_ends")
+
+    def __init__(self, paragraphs: list[str], timings: WordTimings):
+        self.paragraphs = paragraphs
+        self.timings = timings
+        self._seek_ends = array("i")
+        running = 0
+        for i, end in enumerate(timings.ends):
+            running = max(running, end)
+            if i % SEEK_STRIDE == SEEK_STRIDE - 1:
+                self._seek_ends.append(running)
+        if len(timings) % SEEK_STRIDE:
+            self._seek_ends.append(running)
+
+    @property
+    def duration_ms(self) -> int:
+        return self.timings.end_ms
+
+    def __len__(self) -> int:
+        return len(self.timings)
+
+    def _first_ending_after(self, ms: int) -> int:
+        block = bisect_right(self._seek_ends, ms)
+        ends = self.timings.ends
+        i = min(block * SEEK_STRIDE, len(ends))  # past the last word: len(ends)
+        stop = min(i + SEEK_STRIDE, len(ends))
+        while i < stop and ends[i] <= ms:
+            i += 1
+        return i
+
+    def word_start_ms(self, paragraph: int, word: int) -> int | None:
+        """Start of the ``word``-th word of ``paragraph`` (clamped to the paragraph)."""
+        paras = self.timings.paras
+        first = bisect_left(paras, paragraph)
+        if first == len(paras) or paras[first] != paragraph:
+            return None
+        last = bisect_right(paras, paragraph, first) - 1
+        return self.timings.starts[min(first + word, last)]
+
+    def window(self, from_ms: int, to_ms: int) -> TimingsWindow:
+        """Words with ``end > from_ms`` and ``start < to_ms``, plus their paragraphs."""
+        t = self.timings
+        lo = self._first_ending_after(from_ms)
+        hi = max(bisect_left(t.starts, to_ms, lo), lo)
+
+        starts, ends, paras = array("i"), array("i"), array("i")
+        for i in range(lo, hi):
+            # Words after ``lo`` that ended before the window are skipped
+            if t.ends[i] > from_ms:
+                starts.append(t.starts[i])
+                ends.append(t.ends[i])
+                paras.append(t.paras[i])
+        paragraphs = {
+            p: self.paragraphs[p] for p in dict.fromkeys(paras) if p < len(self.paragraphs)
+        }
+        return TimingsWindow(lo, starts, ends, paras, paragraphs)
+
+
+_cache: OrderedDict[str, tuple[tuple[int, int, int], TimingsIndex]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load_timings_index(lecture_id: str | uuid.UUID) -> TimingsIndex:
+    """The cached index for a lecture's timings (FileNotFoundError if it has none)."""
+    path = lecture_audio_path(lecture_id, "json")
+    st = os.stat(path)
+    stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            _cache.move_to_end(path)
+            return cached[1]
+
+    with open(path, "rb") as f:
+        index = TimingsIndex(*WordTimings.loads(f.read()))
+
+    with _cache_lock:
+        _cache[path] = (stamp, index)
+        _cache.move_to_end(path)
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
@@ -0,0 +1,301 @@
+"""Span tracing for the generation pipeline.
+
+``span("tts.azure.chunk", index=3)`` times a block and nests under the span
+that is current in the calling context (contextvars carry it across
+``await``, into tasks, and into executor threads started with
+``in_context``). The worker opens a root span per job, so one trace shows
+where a lecture's minutes went: the LLM request, markdown stripping, each
+synthesis chunk, Whisper alignment, file writes.
+
+Finished spans go two places:
+
+* ``StageTimings``: while ``recording(stages)`` is active, every span adds
+  its duration to a per-name total and wall-clock time. The worker persists
+  this compact breakdown per job (see ``app.services.generation_timings``).
+* an exporter, when ``tracing_exporter`` is set: ``file`` appends each
+  finished trace as one OTLP/JSON line to ``tracing_file`` (the format the
+  OpenTelemetry Collector's ``otlpjsonfile`` receiver reads), ``otlp`` posts
+  it to an OTLP/HTTP collector at ``tracing_otlp_endpoint``. Exports run on a
+  background thread and never block the pipeline; a full queue drops traces.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+EXPORT_QUEUE_SIZE = 256
+
+_STATUS_OK, _STATUS_ERROR = 1, 2  # OTLP status codes
+_SPAN_KIND_INTERNAL = 1
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    duration_ns: int = 0
+    error: str | None = None
+    children: list["Span"] = field(default_factory=list, repr=False)
+    _started: int = field(default_factory=time.perf_counter_ns, repr=False)
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def elapsed_ms(self) -> float:
+        """Time since the span started (it may still be open)."""
+        return (time.perf_counter_ns() - self._started) / 1e6
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+
+class StageTimings:
+    """Count, total, slowest and wall-clock duration per span name.
+
+    ``total_ms`` sums every span of a stage, so stages that run concurrently
+    (synthesis chunks, say) can add up to more than the job took; ``wall_ms``
+    is the time at least one of them was running.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stages: dict[str, list[float]] = {}  # name -> [count, total_ms, max_ms]
+        self._intervals: dict[str, list[tuple[int, int]]] = {}  # name -> perf_counter_ns
+
+    def add(self, name: str, start_ns: int, end_ns: int) -> None:
+        ms = (end_ns - start_ns) / 1e6
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                self.stages[name] = [1, ms, ms]
+                self._intervals[name] = [(start_ns, end_ns)]
+            else:
+                stage[0] += 1
+                stage[1] += ms
+                stage[2] = max(stage[2], ms)
+                self._intervals[name].append((start_ns, end_ns))
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                name: {
+                    "count": int(count),
+                    "total_ms": round(total, 1),
+                    "max_ms": round(peak, 1),
+                    "wall_ms": round(_union_ms(self._intervals[name]), 1),
+                }
+                for name, (count, total, peak) in self.stages.items()
+            }
+
+
+def _union_ms(intervals: list[tuple[int, int]]) -> float:
+    """Length of the union of ``(start_ns, end_ns)`` intervals, in ms."""
+    covered = 0
+    reached = None
+    for start, end in sorted(intervals):
+        if reached is None or start > reached:
+            covered += end - start
+            reached = end
+        elif end > reached:
+            covered += end - reached
+            reached = end
+    return covered / 1e6
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "current_span", default=None
+)
+_current_stages: contextvars.ContextVar[StageTimings | None] = contextvars.ContextVar(
+    "current_stages", default=None
+)
+
+
+@contextmanager
+def recording(stages: StageTimings) -> Iterator[StageTimings]:
+    """Add every span finished in this context to ``stages``."""
+    token = _current_stages.set(stages)
+    try:
+        yield stages
+    finally:
+        _current_stages.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Time the enclosed block as a child of the current span (or a new trace)."""
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else secrets.token_hex(16),
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent else None,
+        start_ns=time.time_ns(),
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration_ns = time.perf_counter_ns() - current._started
+        _current_span.reset(token)
+        _finish(current, parent)
+
+
+def in_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Bind ``fn`` to a copy of the caller's context, for ``loop.run_in_executor``."""
+    context = contextvars.copy_context()
+
+    def run(*args: Any) -> Any:
+        return context.run(fn, *args)
+
+    return run
+
+
+def _finish(finished: Span, parent: Span | None) -> None:
+    stages = _current_stages.get()
+    if stages is not None:
+        stages.add(finished.name, finished._started, finished._started + finished.duration_ns)
+    if not settings.tracing_exporter:
+        return
+    if parent is not None:
+        # list.append is atomic, so spans finishing in executor threads are safe
+        parent.children.append(finished)
+    else:
+        _exporter().submit(finished)
+
+
+def _flatten(root: Span) -> list[Span]:
+    spans, pending = [], [root]
+    while pending:
+        current = pending.pop()
+        spans.append(current)
+        pending.extend(current.children)
+    return spans
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def _otlp_span(s: Span) -> dict[str, Any]:
+    encoded = {
+        "traceId": s.trace_id,
+        "spanId": s.span_id,
+        "name": s.name,
+        "kind": _SPAN_KIND_INTERNAL,
+        "startTimeUnixNano": str(s.start_ns),
+        "endTimeUnixNano": str(s.start_ns + s.duration_ns),
+        "attributes": [_attribute(k, v) for k, v in s.attributes.items()],
+        "status": {"code": _STATUS_ERROR, "message": s.error} if s.error
+        else {"code": _STATUS_OK},
+    }
+    if s.parent_id:
+        encoded["parentSpanId"] = s.parent_id
+    return encoded
+
+
+def to_otlp_json(root: Span) -> dict[str, Any]:
+    """An OTLP ``ExportTraceServiceRequest`` (JSON encoding) for a finished trace."""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                _attribute("service.name", settings.tracing_service_name),
+                _attribute("process.pid", os.getpid()),
+            ]},
+            "scopeSpans": [{
+                "scope": {"name": "app.services.tracing"},
+                "spans": [_otlp_span(s) for s in _flatten(root)],
+            }],
+        }]
+    }
+
+
+class _Exporter:
+    def __init__(self, kind: str) -> None:
+        if kind not in ("file", "otlp"):
+            raise ValueError(f"Unknown TRACING_EXPORTER {kind!r} (expected 'file' or 'otlp')")
+        self.kind = kind
+        self._queue: queue.Queue[Span | None] = queue.Queue(EXPORT_QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, root: Span) -> None:
+        try:
+            self._queue.put_nowait(root)
+        except queue.Full:
+            logger.warning("Trace export queue is full; dropping trace %s", root.trace_id)
+
+    def close(self, timeout: float = 5.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        client = httpx.Client(timeout=10.0) if self.kind == "otlp" else None
+        path = settings.tracing_file or os.path.join(BACKEND_DIR, "traces.jsonl")
+        while (root := self._queue.get()) is not None:
+            body = to_otlp_json(root)
+            try:
+                if client is not None:
+                    client.post(settings.tracing_otlp_endpoint, json=body).raise_for_status()
+                else:
+                    with open(path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(body, separators=(",", ":")) + "\n")
+            except (OSError, httpx.HTTPError):
+                logger.warning("Could not export trace %s", root.trace_id, exc_info=True)
+        if client is not None:
+            client.close()
+
+
+_exporter_instance: _Exporter | None = None
+_exporter_lock = threading.Lock()
+
+
+def _exporter() -> _Exporter:
+    global _exporter_instance
+    if _exporter_instance is None:
+        with _exporter_lock:
+            if _exporter_instance is None:
+                _exporter_instance = _Exporter(settings.tracing_exporter)
+    return _exporter_instance
+
+
+def shutdown_tracing() -> None:
+    """Export the traces still queued (call at process shutdown)."""
+    global _exporter_instance
+    if _exporter_instance is not None:
+        _exporter_instance.close()
+        _exporter_instance = None
@@ -0,0 +1,211 @@
+"""Full-text search over lecture transcripts.
+
+The index lives in the database and is maintained there (see migration
+0004 and 0007): an FTS5 table kept in sync by triggers on SQLite, a generated
+``tsvector`` column on PostgreSQL. Only ready lectures are indexed. A query
+returns the best-ranked lectures with a highlighted snippet. Each hit is then
+placed in the lecture: the first paragraph (as split for narration) that
+contains a query term, and, when the lecture has word timings, the
+millisecond offset of that word, so the player can seek straight to it.
+
+Ranking scores every matching lecture, which for a word found in most of a
+large catalog costs far more than finding the matches. So at most
+``SEARCH_CANDIDATES`` matches are ranked: on SQLite the most recently added
+ones (a cheap rowid bound the FTS5 table applies itself), on PostgreSQL the
+first ones the GIN index yields. Queries with fewer matches, and searches
+within one course, are ranked exactly on SQLite. When matches were left
+unranked the results say so: the ``X-Search-Truncated`` header is set.
+"""
+
+import asyncio
+import re
+import uuid
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+from sqlalchemy import Uuid, bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.pagination import Page
+from app.services.text_normalizer import normalize_transcript, strip_markdown
+from app.services.timings_index import load_timings_index
+
+MAX_TERMS = 16
+SEARCH_CANDIDATES = 2000
+SEARCH_TRUNCATED_HEADER = "X-Search-Truncated"
+SNIPPET_WORDS = 24
+HIGHLIGHT = "**"  # snippets are rendered as markdown, like transcripts
+# The database marks matches with these; the transcript's own markdown is
+# stripped from the snippet before they become HIGHLIGHT
+_START, _STOP = "\x02", "\x03"
+
+_TERM = re.compile(r"\w+")
+
+# Rowid of the newest match older than the SEARCH_CANDIDATES newest ones, or
+# nothing if there are no more
+_SQLITE_CANDIDATE_BOUND = """
+SELECT rowid FROM lecture_search WHERE lecture_search MATCH :query
+ORDER BY rowid DESC LIMIT 1 OFFSET :offset
+"""
+
+_SQLITE_SEARCH = """
+SELECT lectures.id, lectures.title, lectures.course_id, lectures.transcript,
+       lectures.audio_url,
+       snippet(lecture_search, 1, :start, :stop, '…', :words) AS snippet,
+       -bm25(lecture_search, 4.0, 1.0) AS score
+FROM lecture_search
+JOIN lecture_search_ids ON lecture_search_ids.id = lecture_search.rowid
+JOIN lectures ON lectures.id = lecture_search_ids.lecture_id
+WHERE lecture_search MATCH :query AND lecture_search.rowid > :bound {course_filter}
+ORDER BY bm25(lecture_search, 4.0, 1.0)
+LIMIT :limit
+"""
+
+# ts_headline re-parses the document, so it runs only on the page of hits.
+# One match beyond the candidates is fetched to tell whether any were left out
+_POSTGRES_SEARCH = """
+SELECT hits.id, hits.title, hits.course_id, hits.transcript, hits.audio_url,
+       ts_headline('english', hits.transcript, hits.query, :options) AS snippet,
+       hits.score, hits.matched
+FROM (
+    SELECT candidates.*, ts_rank_cd(candidates.search_vector, candidates.query) AS score
+    FROM (
+        SELECT matches.*, count(*) OVER () AS matched
+        FROM (
+            SELECT lectures.id, lectures.title, lectures.course_id, lectures.transcript,
+                   lectures.audio_url, lectures.search_vector, query
+            FROM lectures, plainto_tsquery('english', :query) AS query
+            WHERE lectures.search_vector @@ query {course_filter}
+            LIMIT :candidates + 1
+        ) AS matches
+        LIMIT :candidates
+    ) AS candidates
+    ORDER BY score DESC
+    LIMIT :limit
+) AS hits
+ORDER BY hits.score DESC
+"""
+
+
+@dataclass
+class SearchHit:
+    lecture_id: uuid.UUID
+    title: str
+    course_id: uuid.UUID
+    snippet: str
+    score: float
+    paragraph_index: int | None = None
+    offset_ms: int | None = None
+
+
+def query_terms(q: str) -> list[str]:
+    """Lowercased word terms of a user query; punctuation and operators are ignored."""
+    return list(dict.fromkeys(_TERM.findall(q.lower())))[:MAX_TERMS]
+
+
+def _matches(word: str, term: str) -> bool:
+    # The index stems words ("lectures" finds "lecture"); a shared prefix that
+    # covers most of the shorter word is a close enough stand-in here
+    if word == term:
+        return True
+    shorter = min(len(word), len(term))
+    if shorter < 3:
+        return False
+    common = 0
+    for a, b in zip(word, term):
+        if a != b:
+            break
+        common += 1
+    return common >= max(3, shorter - 2)
+
+
+def locate_first_match(transcript: str, terms: list[str]) -> tuple[int, int] | None:
+    """(paragraph index, word index in it) of the first word matching a query term."""
+    for p, paragraph in enumerate(normalize_transcript(transcript).paragraphs):
+        for w, raw in enumerate(paragraph.split()):
+            word = "".join(_TERM.findall(raw.lower()))
+            if word and any(_matches(word, term) for term in terms):
+                return p, w
+    return None
+
+
+def _clean_snippet(raw: str) -> str:
+    text = " ".join(strip_markdown(raw).split())
+    return text.replace(_START, HIGHLIGHT).replace(_STOP, HIGHLIGHT)
+
+
+def _offset_ms(lecture_id: uuid.UUID, paragraph: int, word: int) -> int | None:
+    try:
+        return load_timings_index(lecture_id).word_start_ms(paragraph, word)
+    except FileNotFoundError:
+        return None
+
+
+async def search_transcripts(
+    db: AsyncSession, q: str, limit: int, course_id: uuid.UUID | None = None
+) -> Page:
+    """The ``limit`` best :class:`SearchHit` for ``q``, flagged if not every match was ranked."""
+    terms = query_terms(q)
+    if not terms:
+        raise HTTPException(status_code=400, detail="Search query has no words")
+
+    dialect = db.bind.dialect.name
+    if dialect == "sqlite":
+        sql = _SQLITE_SEARCH
+        # Quoted, each term is a plain token (no FTS5 operators) and all must match
+        match = " ".join(f'"{term}"' for term in terms)
+        bound = None
+        if course_id is None:
+            # A course filter already limits what gets ranked
+            bound = await db.scalar(
+                text(_SQLITE_CANDIDATE_BOUND),
+                {"query": match, "offset": SEARCH_CANDIDATES},
+            )
+        params = {
+            "query": match,
+            "bound": bound or 0,
+            "start": _START,
+            "stop": _STOP,
+            "words": SNIPPET_WORDS,
+        }
+    elif dialect == "postgresql":
+        sql = _POSTGRES_SEARCH
+        params = {
+            "query": " ".join(terms),
+            "candidates": SEARCH_CANDIDATES,
+            "options": f"StartSel={_START}, StopSel={_STOP}, MaxFragments=1, "
+            f"MinWords=8, MaxWords={SNIPPET_WORDS}",
+        }
+    else:
+        raise HTTPException(status_code=501, detail="Search is not available on this database")
+
+    params["limit"] = limit
+    course_filter = ""
+    if course_id:
+        course_filter = "AND lectures.course_id = :course_id"
+        params["course_id"] = course_id
+    statement = text(sql.format(course_filter=course_filter))
+    if course_id:
+        statement = statement.bindparams(bindparam("course_id", type_=Uuid()))
+    statement = statement.columns(id=Uuid(), course_id=Uuid())
+    rows = (await db.execute(statement, params)).all()
+    if dialect == "sqlite":
+        truncated = bound is not None
+    else:
+        truncated = bool(rows) and rows[0].matched > SEARCH_CANDIDATES
+
+    hits = []
+    for row in rows:
+        hit = SearchHit(
+            row.id, row.title, row.course_id, _clean_snippet(row.snippet), float(row.score)
+        )
+        located = locate_first_match(row.transcript, terms)
+        if located is not None:
+            hit.paragraph_index = located[0]
+            if row.audio_url:
+                hit.offset_ms = await asyncio.to_thread(_offset_ms, row.id, *located)
+        hits.append(hit)
+    page = Page(hits)
+    if truncated:
+        page.headers[SEARCH_TRUNCATED_HEADER] = "true"
+    return page
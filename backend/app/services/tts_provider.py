@@ -0,0 +1,72 @@
+"""Dispatch audio generation to the configured TTS provider."""
+
+import importlib
+import logging
+import time
+import uuid
+
+from app.config import settings
+from app.services import audio_cache
+from app.services.audio_assets import fingerprinted_audio_url
+from app.services.metrics import TTS_FAILURES, record_tts_synthesis
+from app.services.text_normalizer import normalize_transcript
+from app.services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_MODULES = {
+    "azure": "app.services.azure_tts_service",
+    "openai": "app.services.openai_tts_service",
+    "edge-tts": "app.services.tts_service",
+    "fake": "app.services.fake_tts_service",
+}
+
+
+def get_provider_module():
+    """Import the module for the configured provider (edge-tts by default)."""
+    name = PROVIDER_MODULES.get(settings.tts_provider, PROVIDER_MODULES["edge-tts"])
+    return importlib.import_module(name)
+
+
+async def generate_audio_for_lecture(
+    transcript: str,
+    thinker_name: str,
+    lecture_id: str | uuid.UUID,
+):
+    """Dispatch to the configured TTS provider, reusing cached audio when possible."""
+    provider = get_provider_module()
+    with span("text.normalize"):
+        text = normalize_transcript(transcript).text
+
+    key = None
+    if settings.audio_cache_enabled:
+        key = audio_cache.cache_key(
+            text,
+            provider.PROVIDER_NAME,
+            provider.get_voice_for_thinker(thinker_name),
+            provider.OUTPUT_FORMAT,
+        )
+        with span("audio_cache.lookup") as lookup_span:
+            cached = await audio_cache.lookup(key, lecture_id)
+            lookup_span.set("hit", cached is not None)
+        if cached is not None:
+            logger.info("Audio cache hit for lecture %s (%s)", lecture_id, audio_cache.stats)
+            cached.url = await fingerprinted_audio_url(lecture_id)
+            return cached
+
+    audio_cache.release_lecture_files(lecture_id)
+    started = time.perf_counter()
+    try:
+        with span("tts.synthesize", provider=provider.PROVIDER_NAME, characters=len(text)):
+            result = await provider.generate_audio(transcript, thinker_name, lecture_id)
+    except Exception:
+        TTS_FAILURES.labels(provider.PROVIDER_NAME).inc()
+        raise
+    record_tts_synthesis(provider.PROVIDER_NAME, len(text), time.perf_counter() - started)
+
+    if key is not None:
+        with span("audio_cache.store"):
+            await audio_cache.store(key, lecture_id, result.duration_seconds)
+    with span("audio.fingerprint"):
+        result.url = await fingerprinted_audio_url(lecture_id)
+    return result
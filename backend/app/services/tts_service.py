@@ -1,13 +1,18 @@
 """Text-to-speech service using edge-tts (Microsoft Edge TTS engine)."""
 
-import json
 import os
-import re
+import time
 import uuid
 from dataclasses import dataclass
 
 import edge_tts
 
+from app.services.audio_writer import AudioFileWriter, write_timings
+from app.services.metrics import TTS_CHUNK_SECONDS
+from app.services.text_normalizer import normalize_transcript
+from app.services.tracing import span
+from app.services.word_timings import ParagraphLocator, WordTimings
+
 AUDIO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "audio")
 
 # Voice mapping: thinker name → edge-tts voice ID
@@ -28,22 +33,10 @@ VOICE_MAP: dict[str, str] = {
 
 DEFAULT_VOICE = "en-US-GuyNeural"
 
-TICKS_PER_MS = 10_000  # 1 tick = 100 nanoseconds
-
+PROVIDER_NAME = "edge-tts"
+OUTPUT_FORMAT = "audio-24khz-48kbitrate-mono-mp3"  # edge-tts' fixed output format
 
-def strip_markdown(text: str) -> str:
-    """Remove markdown formatting so TTS reads clean text."""
-    text = re.sub(r"#{1,6}\s*", "", text)          # headings
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)   # bold
-    text = re.sub(r"\*(.+?)\*", r"\1", text)       # italic
-    text = re.sub(r"_(.+?)_", r"\1", text)         # italic underscores
-    text = re.sub(r"`(.+?)`", r"\1", text)         # inline code
-    text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)  # links
-    text = re.sub(r"^[-*+]\s+", "", text, flags=re.MULTILINE)  # list bullets
-    text = re.sub(r"^\d+\.\s+", "", text, flags=re.MULTILINE)  # numbered lists
-    text = re.sub(r"---+", "", text)               # horizontal rules
-    text = re.sub(r"\n{3,}", "\n\n", text)         # excess newlines
-    return text.strip()
+TICKS_PER_MS = 10_000  # 1 tick = 100 nanoseconds
 
 
 def estimate_duration_seconds(text: str) -> int:
@@ -76,51 +69,42 @@ async def generate_audio(
     os.makedirs(AUDIO_DIR, exist_ok=True)
 
     voice = get_voice_for_thinker(thinker_name)
-    clean_text = strip_markdown(transcript)
+    with span("text.normalize"):
+        normalized = normalize_transcript(transcript)
+    clean_text = normalized.text
 
     # Determine paragraph boundaries for word-to-paragraph mapping
-    paragraphs = [p.strip() for p in clean_text.split("\n\n") if p.strip()]
-    para_word_counts = [len(p.split()) for p in paragraphs]
+    paragraphs = list(normalized.paragraphs)
+    locator = ParagraphLocator.from_paragraphs(paragraphs)
 
     communicate = edge_tts.Communicate(clean_text, voice, boundary="WordBoundary")
 
-    audio_chunks: list[bytes] = []
-    word_timings: list[dict] = []
+    word_timings = WordTimings()
     global_word_idx = 0
 
-    async for chunk in communicate.stream():
-        if chunk["type"] == "audio":
-            audio_chunks.append(chunk["data"])
-        elif chunk["type"] == "WordBoundary":
-            offset_ms = chunk["offset"] // TICKS_PER_MS
-            duration_ms = chunk["duration"] // TICKS_PER_MS
-
-            # Determine paragraph index from cumulative word count
-            para_idx = 0
-            cumulative = 0
-            for i, count in enumerate(para_word_counts):
-                cumulative += count
-                if global_word_idx < cumulative:
-                    para_idx = i
-                    break
-
-            word_timings.append({
-                "s": offset_ms,
-                "e": offset_ms + duration_ms,
-                "p": para_idx,
-            })
-            global_word_idx += 1
-
-    # Write audio file
+    # Stream audio straight to disk as it arrives
     filepath = os.path.join(AUDIO_DIR, f"{lecture_id}.mp3")
-    with open(filepath, "wb") as f:
-        for audio_data in audio_chunks:
-            f.write(audio_data)
+    # edge-tts synthesizes the lecture in one stream, which counts as one chunk
+    started = time.perf_counter()
+    with span("tts.edge.stream", characters=len(clean_text)):
+        async with AudioFileWriter(filepath) as out:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    await out.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    offset_ms = chunk["offset"] // TICKS_PER_MS
+                    duration_ms = chunk["duration"] // TICKS_PER_MS
+
+                    # Determine paragraph index from cumulative word count
+                    para_idx = locator.for_word(global_word_idx)
+                    word_timings.append(offset_ms, offset_ms + duration_ms, para_idx)
+                    global_word_idx += 1
+    TTS_CHUNK_SECONDS.labels(PROVIDER_NAME).observe(time.perf_counter() - started)
 
     # Write word timings JSON (includes paragraph text for punctuation)
     timings_path = os.path.join(AUDIO_DIR, f"{lecture_id}.json")
-    with open(timings_path, "w", encoding="utf-8") as f:
-        json.dump({"p": paragraphs, "w": word_timings}, f, ensure_ascii=False)
+    with span("timings.write"):
+        await write_timings(timings_path, paragraphs, word_timings)
 
     duration = estimate_duration_seconds(clean_text)
 
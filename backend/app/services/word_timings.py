@@ -0,0 +1,211 @@
+"""Compact word-timing storage shared by all TTS providers.
+
+Timings are kept as three parallel ``array`` columns (start ms, end ms,
+paragraph index) instead of one dict per word, paragraph lookups use prefix
+sums and binary search, and serialization writes the existing
+``{"p": [...], "w": [{"s", "e", "p"}, ...]}`` schema directly.
+
+They can also be serialized to a versioned binary encoding for clients that
+ask for it (see ``COMPACT_MEDIA_TYPE``)::
+
+    magic "SSWT" | version u8 | 3 reserved bytes
+    varint paragraph count, then per paragraph: varint byte length + UTF-8
+    varint word count, then three columns of zigzag varints:
+        gap      start minus the previous word's end (first word: its start)
+        duration end minus start
+        para     paragraph index minus the previous word's (first: its index)
+
+Consecutive words are close together and mostly share a paragraph, so the
+columns are one or two bytes per value and compress further with gzip/brotli.
+"""
+
+import json
+import struct
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+
+COMPACT_MAGIC = b"SSWT"
+COMPACT_VERSION = 1
+COMPACT_MEDIA_TYPE = "application/vnd.symposium.word-timings"
+_COMPACT_HEADER = struct.Struct("<4sB3x")
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    """Append ``value`` as a zigzag LEB128 varint."""
+    value = value << 1 if value >= 0 else (-value << 1) - 1
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Read a zigzag LEB128 varint at ``pos``; returns (value, next position)."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+    return (value >> 1) ^ -(value & 1), pos
+
+
+class WordTimings:
+    """Append-only columnar word timings.
+
+    ``typecode`` is ``"i"`` for final millisecond offsets; providers that need
+    sub-millisecond precision before stitching chunks together use ``"d"``.
+    """
+
+    __slots__ = ("starts", "ends", "paras")
+
+    def __init__(self, typecode: str = "i"):
+        self.starts = array(typecode)
+        self.ends = array(typecode)
+        self.paras = array("i")
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return zip(self.starts, self.ends, self.paras)
+
+    def append(self, start_ms: float, end_ms: float, para_idx: int) -> None:
+        self.starts.append(start_ms)
+        self.ends.append(end_ms)
+        self.paras.append(para_idx)
+
+    def extend_shifted(self, other: "WordTimings", offset_ms: float) -> None:
+        """Append ``other``'s timings shifted by ``offset_ms`` (rounded to whole ms)."""
+        self.starts.extend(round(s + offset_ms) for s in other.starts)
+        self.ends.extend(round(e + offset_ms) for e in other.ends)
+        self.paras.extend(other.paras)
+
+    @property
+    def end_ms(self) -> int:
+        """End of the last word, or 0 if there are none."""
+        return int(self.ends[-1]) if self.ends else 0
+
+    def to_payload(self, paragraphs: list[str]) -> dict:
+        return {
+            "p": paragraphs,
+            "w": [{"s": s, "e": e, "p": p} for s, e, p in self],
+        }
+
+    def dumps(self, paragraphs: list[str]) -> str:
+        """Serialize to the ``{"p", "w"}`` JSON schema without building per-word dicts."""
+        words = ",".join(f'{{"s":{s},"e":{e},"p":{p}}}' for s, e, p in self)
+        return f'{{"p":{json.dumps(paragraphs, ensure_ascii=False)},"w":[{words}]}}'
+
+    @classmethod
+    def loads(cls, data: str | bytes) -> tuple[list[str], "WordTimings"]:
+        """Parse a ``{"p", "w"}`` JSON document into (paragraphs, timings)."""
+        payload = json.loads(data)
+        timings = cls()
+        for word in payload["w"]:
+            # Files written before timings were stored as whole ms may hold floats
+            timings.append(round(word["s"]), round(word["e"]), word["p"])
+        return payload["p"], timings
+
+    def dumps_compact(self, paragraphs: list[str]) -> bytes:
+        """Serialize to the versioned binary encoding described in the module docstring."""
+        out = bytearray(_COMPACT_HEADER.pack(COMPACT_MAGIC, COMPACT_VERSION))
+        _put_varint(out, len(paragraphs))
+        for para in paragraphs:
+            encoded = para.encode("utf-8")
+            _put_varint(out, len(encoded))
+            out += encoded
+
+        _put_varint(out, len(self))
+        prev_end = 0
+        for start, end in zip(self.starts, self.ends):
+            _put_varint(out, int(start) - prev_end)
+            prev_end = int(end)
+        for start, end in zip(self.starts, self.ends):
+            _put_varint(out, int(end) - int(start))
+        prev_para = 0
+        for para in self.paras:
+            _put_varint(out, para - prev_para)
+            prev_para = para
+        return bytes(out)
+
+    @classmethod
+    def loads_compact(cls, data: bytes) -> tuple[list[str], "WordTimings"]:
+        """Parse :meth:`dumps_compact` output back into (paragraphs, timings)."""
+        magic, version = _COMPACT_HEADER.unpack_from(data)
+        if magic != COMPACT_MAGIC or version != COMPACT_VERSION:
+            raise ValueError(f"Unsupported word-timings encoding {magic!r} v{version}")
+        pos = _COMPACT_HEADER.size
+
+        count, pos = _get_varint(data, pos)
+        paragraphs = []
+        for _ in range(count):
+            length, pos = _get_varint(data, pos)
+            paragraphs.append(data[pos:pos + length].decode("utf-8"))
+            pos += length
+
+        count, pos = _get_varint(data, pos)
+        gaps, durations, paras = [], [], []
+        for column in (gaps, durations, paras):
+            for _ in range(count):
+                value, pos = _get_varint(data, pos)
+                column.append(value)
+
+        timings = cls()
+        end = para = 0
+        for gap, duration, para_delta in zip(gaps, durations, paras):
+            start = end + gap
+            end = start + duration
+            para += para_delta
+            timings.append(start, end, para)
+        return paragraphs, timings
+
+
+class ParagraphLocator:
+    """Map a word (by ordinal or by character offset) to its paragraph in O(log n)."""
+
+    __slots__ = ("_bounds", "_ends", "_para_ids", "_default")
+
+    def __init__(self, bounds: list[int], ends: list[int] | None, para_ids: list[int], default):
+        self._bounds = bounds
+        self._ends = ends
+        self._para_ids = para_ids
+        self._default = default
+
+    @classmethod
+    def from_paragraphs(cls, paragraphs: list[str]) -> "ParagraphLocator":
+        """Locate by word ordinal, using cumulative word counts per paragraph."""
+        cumulative: list[int] = []
+        total = 0
+        for para in paragraphs:
+            total += len(para.split())
+            cumulative.append(total)
+        last = max(len(paragraphs) - 1, 0)
+        return cls(cumulative, None, list(range(len(paragraphs))), last)
+
+    @classmethod
+    def from_char_ranges(
+        cls, ranges: list[tuple[int, int, int]], default: int
+    ) -> "ParagraphLocator":
+        """Locate by character offset within sorted ``(start, end, paragraph)`` ranges."""
+        return cls(
+            [start for start, _, _ in ranges],
+            [end for _, end, _ in ranges],
+            [idx for _, _, idx in ranges],
+            default,
+        )
+
+    def for_word(self, word_idx: int) -> int:
+        """Paragraph containing the ``word_idx``-th word (extra words go to the last one)."""
+        i = bisect_right(self._bounds, word_idx)
+        return self._para_ids[i] if i < len(self._para_ids) else self._default
+
+    def for_offset(self, char_offset: int) -> int:
+        """Paragraph whose character range contains ``char_offset``, else the default."""
+        i = bisect_right(self._bounds, char_offset) - 1
+        if i >= 0 and char_offset < self._ends[i]:
+            return self._para_ids[i]
+        return self._default
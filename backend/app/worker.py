@@ -0,0 +1,292 @@
+"""Standalone worker process for lecture generation jobs.
+
+Run one or more alongside the API (on the same node or others sharing the database):
+
+    python -m app.worker                 # poll forever, one job at a time
+    python -m app.worker --concurrency 4 # up to four jobs in this process
+    python -m app.worker --once          # drain the queue and exit
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.config import settings
+from app.db.migrations import upgrade_database
+from app.db.session import async_session, engine
+from app.models import Course, GenerationJob, Lecture
+from app.services import job_queue, metrics, tracing
+from app.services.generation_timings import save_job_timings
+from app.services.http_client import close_http_client, init_http_client
+from app.services.job_queue import JOB_AUDIO, JOB_TRANSCRIPT
+from app.services.lecture_generator import (
+    generate_lecture_transcript,
+    stream_lecture_transcript,
+)
+from app.services.response_cache import close_response_cache, invalidate_catalog
+from app.services.tts_provider import generate_audio_for_lecture
+
+logger = logging.getLogger("app.worker")
+
+
+async def _load_lecture(session, lecture_id: uuid.UUID) -> Lecture | None:
+    result = await session.execute(
+        select(Lecture)
+        .options(selectinload(Lecture.course).selectinload(Course.thinker))
+        .where(Lecture.id == lecture_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _stream_transcript(job: GenerationJob, session, lecture: Lecture, **kwargs) -> str:
+    """Stream the transcript into the lecture row, flushing partial text periodically."""
+    stop_at = settings.llm_stop_at_words or None
+    target_words = stop_at or 2500
+    parts: list[str] = []
+    last_flush = 0.0
+    flushed_len = 0
+    loop = asyncio.get_running_loop()
+
+    # The span wraps the loop, not the generator: a generator's context can't
+    # be restored once the consumer stops iterating it
+    with tracing.span("llm.stream", model=settings.default_model) as stream_span:
+        async for delta in stream_lecture_transcript(stop_at_words=stop_at, **kwargs):
+            if not parts:
+                stream_span.set("first_token_ms", round(stream_span.elapsed_ms(), 1))
+            parts.append(delta)
+            now = loop.time()
+            # Flush the first words immediately, then at most once per interval
+            if flushed_len == 0 or now - last_flush >= settings.transcript_flush_interval:
+                with tracing.span("transcript.flush"):
+                    text = "".join(parts)
+                    lecture.transcript = text
+                    await job_queue.hold_lease(session, job.id, job.worker_id)
+                    await session.commit()
+                    flushed_len = len(text)
+                    last_flush = now
+                    words = len(text.split())
+                    await job_queue.update_progress(
+                        job.id,
+                        job.worker_id,
+                        0.1 + 0.85 * min(words / target_words, 1.0),
+                        "streaming transcript",
+                    )
+        stream_span.set("deltas", len(parts))
+    return "".join(parts)
+
+
+async def _run_transcript_job(job: GenerationJob, final_attempt: bool) -> None:
+    payload = json.loads(job.payload or "{}")
+    async with async_session() as session:
+        with tracing.span("db.load_lecture"):
+            lecture = await _load_lecture(session, job.lecture_id)
+        if lecture is None:
+            raise LookupError(f"Lecture {job.lecture_id} no longer exists")
+        thinker = lecture.course.thinker
+
+        # Start clean (a retry may follow a partially streamed attempt)
+        lecture.transcript = ""
+        lecture.status = "generating"
+        await job_queue.hold_lease(session, job.id, job.worker_id)
+        await session.commit()
+        await invalidate_catalog()
+
+        await job_queue.update_progress(job.id, job.worker_id, 0.1, "generating transcript")
+        kwargs = dict(
+            thinker_name=thinker.name,
+            system_prompt=thinker.system_prompt,
+            topic=payload["topic"],
+            speaking_style=thinker.speaking_style,
+        )
+        try:
+            if settings.llm_stream:
+                transcript = await _stream_transcript(job, session, lecture, **kwargs)
+            else:
+                transcript = await generate_lecture_transcript(**kwargs)
+        except job_queue.LeaseLost:
+            raise
+        except Exception as e:
+            if final_attempt:
+                lecture.status = "error"
+                lecture.transcript = f"Generation failed: {str(e)}"
+                await job_queue.hold_lease(session, job.id, job.worker_id)
+                await session.commit()
+                await invalidate_catalog()
+            raise
+
+        lecture.transcript = transcript
+        lecture.status = "ready"
+        with tracing.span("db.save_lecture"):
+            await job_queue.hold_lease(session, job.id, job.worker_id)
+            await session.commit()
+    await invalidate_catalog()
+
+
+async def _run_audio_job(job: GenerationJob, final_attempt: bool) -> None:
+    async with async_session() as session:
+        with tracing.span("db.load_lecture"):
+            lecture = await _load_lecture(session, job.lecture_id)
+        if lecture is None:
+            raise LookupError(f"Lecture {job.lecture_id} no longer exists")
+        if lecture.status != "ready" or not lecture.transcript:
+            raise ValueError("Lecture transcript not ready")
+
+        await job_queue.update_progress(job.id, job.worker_id, 0.1, "synthesizing audio")
+        result = await generate_audio_for_lecture(
+            transcript=lecture.transcript,
+            thinker_name=lecture.course.thinker.name,
+            lecture_id=lecture.id,
+        )
+        lecture.audio_url = result.url
+        lecture.duration_seconds = result.duration_seconds
+        with tracing.span("db.save_lecture"):
+            await job_queue.hold_lease(session, job.id, job.worker_id)
+            await session.commit()
+    await invalidate_catalog()
+
+
+JOB_HANDLERS = {
+    JOB_TRANSCRIPT: _run_transcript_job,
+    JOB_AUDIO: _run_audio_job,
+}
+
+
+async def _heartbeat_loop(job: GenerationJob, lost: asyncio.Event, work: asyncio.Task) -> None:
+    while True:
+        await asyncio.sleep(settings.job_heartbeat_interval)
+        if not await job_queue.heartbeat(job.id, job.worker_id):
+            # Another worker holds the job now; stop generating for it
+            lost.set()
+            work.cancel()
+            return
+
+
+async def _run_handler(handler, job: GenerationJob, final_attempt: bool) -> None:
+    """Run ``handler`` while heartbeating; raise LeaseLost if the lease is taken over."""
+    work = asyncio.create_task(handler(job, final_attempt))
+    lost = asyncio.Event()
+    beat = asyncio.create_task(_heartbeat_loop(job, lost, work))
+    try:
+        await work
+    except asyncio.CancelledError:
+        if lost.is_set():
+            raise job_queue.LeaseLost(f"Job {job.id} is no longer held by {job.worker_id}")
+        raise
+    finally:
+        beat.cancel()
+        work.cancel()
+
+
+async def run_job(job: GenerationJob) -> None:
+    """Run a claimed job, recording its outcome on the job row and its stage timings."""
+    handler = JOB_HANDLERS.get(job.kind)
+    final_attempt = job.attempts >= settings.job_max_attempts
+    if handler is None:
+        await job_queue.fail_job(
+            job.id, job.worker_id, f"Unknown job kind: {job.kind}", retry=False
+        )
+        return
+
+    stages = tracing.StageTimings()
+    succeeded = False
+    attributes = {
+        "job.id": str(job.id),
+        "lecture.id": str(job.lecture_id),
+        "job.attempt": job.attempts,
+    }
+    try:
+        with tracing.recording(stages), tracing.span(f"job.{job.kind}", **attributes) as root:
+            await _run_handler(handler, job, final_attempt)
+    except job_queue.LeaseLost:
+        logger.warning("Job %s (%s) was handed to another worker; dropped it", job.id, job.kind)
+    except Exception as e:
+        logger.exception("Job %s (%s) failed on attempt %d", job.id, job.kind, job.attempts)
+        await job_queue.fail_job(job.id, job.worker_id, str(e), retry=not final_attempt)
+    else:
+        succeeded = await job_queue.complete_job(job.id, job.worker_id)
+        if succeeded:
+            logger.info(
+                "Job %s (%s) succeeded in %.1f s", job.id, job.kind, root.duration_ms / 1000
+            )
+        else:
+            logger.warning("Job %s (%s) finished after another worker took it", job.id, job.kind)
+    await save_job_timings(job, root, stages, succeeded)
+
+
+async def worker_loop(
+    worker_id: str,
+    stop: asyncio.Event,
+    once: bool = False,
+    kinds: tuple[str, ...] | None = None,
+) -> None:
+    """Claim and run jobs until ``stop`` is set (or the queue is empty with ``once``).
+
+    ``kinds`` restricts the loop to those job kinds (all kinds by default).
+    """
+    while not stop.is_set():
+        job = await job_queue.claim_job(worker_id, kinds=kinds)
+        if job is None:
+            if once:
+                return
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.worker_poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        logger.info("Worker %s claimed job %s (%s)", worker_id, job.id, job.kind)
+        await run_job(job)
+
+
+async def run_worker(concurrency: int, once: bool = False) -> None:
+    if settings.db_auto_migrate:
+        await upgrade_database()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    await init_http_client()
+    base_id = f"{socket.gethostname()}:{os.getpid()}"
+    try:
+        snapshots = asyncio.create_task(metrics.write_snapshots(stop))
+        await asyncio.gather(
+            *(worker_loop(f"{base_id}:{i}", stop, once) for i in range(concurrency))
+        )
+        stop.set()
+        await snapshots
+    finally:
+        await close_http_client()
+        await close_response_cache()
+        await asyncio.to_thread(tracing.shutdown_tracing)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run lecture generation workers.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.worker_concurrency,
+        help="Jobs to run concurrently in this process",
+    )
+    parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(run_worker(args.concurrency, once=args.once))
+
+
+if __name__ == "__main__":
+    main()
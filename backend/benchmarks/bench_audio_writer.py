@@ -0,0 +1,131 @@
+"""Benchmark: peak RSS and event-loop stalls when writing long lecture audio.
+
+Each run happens in a fresh subprocess that streams N MB of fake mp3 frames
+(4 KB each, like edge-tts) and reports its peak RSS and the worst event-loop
+lag seen by a 5 ms ticker running alongside:
+
+* ``accumulate`` — the old approach: collect every chunk in a list, then a
+  synchronous ``open().write()`` inside the coroutine.
+* ``writer`` — ``app.services.audio_writer.AudioFileWriter``.
+
+    python benchmarks/bench_audio_writer.py --sizes 50 200 400
+
+Exits non-zero if the writer's peak RSS grows by more than ``--max-growth-mb``
+between the smallest and largest lecture.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+FRAME = b"\xff\xfb" + b"\x00" * 4094
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+async def _frames(total_bytes: int):
+    sent = 0
+    while sent < total_bytes:
+        yield FRAME[:-1] + bytes((sent // len(FRAME) % 256,))  # a fresh buffer per frame
+        sent += len(FRAME)
+        if sent % (64 * len(FRAME)) == 0:
+            await asyncio.sleep(0)  # let other tasks run, as a network stream would
+
+
+async def _accumulate(path: str, total_bytes: int) -> None:
+    chunks: list[bytes] = []
+    async for frame in _frames(total_bytes):
+        chunks.append(frame)
+    with open(path, "wb") as f:
+        for data in chunks:
+            f.write(data)
+
+
+async def _writer(path: str, total_bytes: int) -> None:
+    from app.services.audio_writer import AudioFileWriter
+
+    async with AudioFileWriter(path) as out:
+        async for frame in _frames(total_bytes):
+            await out.write(frame)
+
+
+async def _child(mode: str, size_mb: int) -> dict:
+    max_lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal max_lag
+        while not done:
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.005)
+            max_lag = max(max_lag, time.perf_counter() - t0 - 0.005)
+
+    tick = asyncio.create_task(ticker())
+    baseline = _peak_rss_mb()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lecture.mp3")
+        start = time.perf_counter()
+        await (_accumulate if mode == "accumulate" else _writer)(path, size_mb * 1024 * 1024)
+        elapsed = time.perf_counter() - start
+    done = True
+    await tick
+    return {
+        "peak_rss_mb": _peak_rss_mb(),
+        "growth_mb": _peak_rss_mb() - baseline,
+        "max_loop_lag_ms": max_lag * 1000,
+        "seconds": elapsed,
+    }
+
+
+def _run_child(mode: str, size_mb: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(size_mb)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 400])
+    parser.add_argument("--max-growth-mb", type=float, default=16.0)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "SIZE_MB"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, size = args.child
+        print(json.dumps(asyncio.run(_child(mode, int(size)))))
+        return 0
+
+    print(f"{'mode':<11} {'size MB':>8} {'peak RSS MB':>12} {'growth MB':>10} "
+          f"{'max lag ms':>11} {'seconds':>8}")
+    growth: dict[str, list[float]] = {"accumulate": [], "writer": []}
+    for mode in ("accumulate", "writer"):
+        for size in args.sizes:
+            r = _run_child(mode, size)
+            growth[mode].append(r["growth_mb"])
+            print(f"{mode:<11} {size:>8} {r['peak_rss_mb']:>12.1f} {r['growth_mb']:>10.1f} "
+                  f"{r['max_loop_lag_ms']:>11.1f} {r['seconds']:>8.2f}")
+
+    spread = max(growth["writer"]) - min(growth["writer"])
+    if spread > args.max_growth_mb:
+        print(f"\nFAIL: writer peak RSS varies by {spread:.1f} MB across lecture sizes")
+        return 1
+    print(f"\nOK: writer peak RSS varies by {spread:.1f} MB across lecture sizes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Benchmark: ORM entity loading vs. joined Core selects for catalog reads.
+
+``get_lecture``, ``get_course`` and ``list_courses`` used to load ORM
+entities with ``selectinload`` chains (one query per relationship level,
+full rows including long transcripts and descriptions, identity-map
+bookkeeping) and copy related fields onto the response by hand. They now
+run one joined Core select of just the response columns and validate the
+rows straight into the response schema.
+
+This builds a throwaway SQLite catalog, runs the previous ORM loaders and
+the current router loaders side by side, checks that both produce the same
+responses, and prints the median latency of each per endpoint.
+
+    python benchmarks/bench_core_reads.py --courses 200 --lectures 12
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+_DB = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB}"
+os.environ["APP_DEBUG"] = "false"
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import async_session, engine  # noqa: E402
+from app.models import Course, Lecture, Thinker  # noqa: E402
+from app.routers import courses, lectures  # noqa: E402
+from app.schemas.course import CourseResponse  # noqa: E402
+from app.schemas.lecture import LectureResponse  # noqa: E402
+from app.services.pagination import fetch_page  # noqa: E402
+from app.services.sparse_fields import list_adapter  # noqa: E402
+
+
+async def _populate(num_courses: int, per_course: int) -> tuple[list, list]:
+    course_ids, lecture_ids = [], []
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        thinkers = [
+            {"id": uuid.uuid4(), "name": f"Thinker {i}", "era": "Modern",
+             "bio": "bio " * 300, "image_url": f"/img/{i}.png"}
+            for i in range(max(num_courses // 4, 1))
+        ]
+        await conn.execute(insert(Thinker), thinkers)
+        for i in range(num_courses):
+            course_id = uuid.uuid4()
+            course_ids.append(course_id)
+            await conn.execute(
+                insert(Course),
+                [{"id": course_id, "title": f"Course {i:05d}", "description": "desc " * 200,
+                  "thinker_id": thinkers[i % len(thinkers)]["id"]}],
+            )
+            rows = [
+                {"id": uuid.uuid4(), "title": f"Lecture {j}", "sequence_number": j,
+                 "course_id": course_id, "status": "ready", "transcript": "word " * 2000}
+                for j in range(per_course)
+            ]
+            lecture_ids.extend(row["id"] for row in rows)
+            await conn.execute(insert(Lecture), rows)
+    return course_ids, lecture_ids
+
+
+# The loaders as they were before the Core rewrite
+
+async def _orm_lecture(db, lecture_id) -> LectureResponse:
+    result = await db.execute(
+        select(Lecture)
+        .options(selectinload(Lecture.course).selectinload(Course.thinker))
+        .where(Lecture.id == lecture_id)
+    )
+    lecture = result.scalar_one()
+    resp = LectureResponse.model_validate(lecture)
+    if lecture.course:
+        resp.course_title = lecture.course.title
+        if lecture.course.thinker:
+            resp.thinker_name = lecture.course.thinker.name
+            resp.thinker_image_url = lecture.course.thinker.image_url
+    return resp
+
+
+async def _orm_course(db, course_id) -> CourseResponse:
+    result = await db.execute(
+        select(Course)
+        .options(selectinload(Course.thinker), selectinload(Course.lectures))
+        .where(Course.id == course_id)
+    )
+    course = result.scalar_one()
+    data = CourseResponse.model_validate(course)
+    if course.thinker:
+        data.thinker_name = course.thinker.name
+    return data
+
+
+async def _orm_courses(db, limit: int) -> list[CourseResponse]:
+    page = await fetch_page(
+        db,
+        select(Course).options(selectinload(Course.thinker)),
+        (Course.title, Course.id),
+        limit,
+        None,
+        "courses",
+    )
+    response = []
+    for c in page.items:
+        data = CourseResponse.model_validate(c)
+        if c.thinker:
+            data.thinker_name = c.thinker.name
+        response.append(data)
+    return response
+
+
+async def _core_courses(db, limit: int) -> list[CourseResponse]:
+    page = await courses._load_courses(db, CourseResponse, limit)
+    return list_adapter(CourseResponse).validate_python(page.items, from_attributes=True)
+
+
+async def _time(load, args: list, repeat: int) -> tuple[float, list]:
+    samples, results = [], []
+    for _ in range(repeat):
+        for arg in args:
+            # A fresh session per request, as the app gets from get_db
+            async with async_session() as db:
+                t0 = time.perf_counter()
+                results.append(await load(db, arg))
+                samples.append(time.perf_counter() - t0)
+    return statistics.median(samples), results
+
+
+async def run(num_courses: int, per_course: int, limit: int, repeat: int) -> None:
+    course_ids, lecture_ids = await _populate(num_courses, per_course)
+    print(f"{num_courses} courses, {len(lecture_ids)} lectures")
+
+    cases = [
+        ("get_lecture", _orm_lecture, lectures._load_lecture, lecture_ids[::per_course]),
+        ("get_course", _orm_course, courses._load_course, course_ids),
+        ("list_courses", _orm_courses, _core_courses, [limit]),
+    ]
+    print(f"{'endpoint':<14}{'ORM':>12}{'Core':>12}{'speedup':>10}")
+    for name, orm_load, core_load, args in cases:
+        orm_s, orm_out = await _time(orm_load, args, repeat)
+        core_s, core_out = await _time(core_load, args, repeat)
+        assert orm_out == core_out, f"{name}: ORM and Core responses differ"
+        print(
+            f"{name:<14}{orm_s * 1000:10.3f}ms{core_s * 1000:10.3f}ms{orm_s / core_s:9.1f}x"
+        )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--lectures", type=int, default=12, help="lectures per course")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.courses, args.lectures, args.limit, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Benchmark: concurrent reads and writes under the default and tuned DB profiles.
+
+Models the API serving page views while generation workers stream
+transcripts into the lecture table: ``--readers`` tasks fetch lectures by
+id while ``--writers`` tasks in a separate process (as the standalone
+worker is) append text to lectures and commit, for ``--seconds`` each.
+The same workload runs against a fresh SQLite file with
+``DB_PROFILE=default`` (rollback journal, ``synchronous=FULL``) and with
+``DB_PROFILE=tuned`` (WAL, ``synchronous=NORMAL``, mmap, larger page cache,
+busy timeout). In rollback-journal mode a commit locks readers out of the
+whole file; in WAL mode they keep reading the last committed snapshot.
+
+    python benchmarks/bench_db_profile.py --readers 16 --writers 2 --seconds 5
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+
+os.environ["APP_DEBUG"] = "false"
+
+from sqlalchemy import insert, select, update  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import build_engine  # noqa: E402
+from app.models import Course, Lecture, Thinker  # noqa: E402
+
+LECTURES = 500
+
+
+async def _populate(engine) -> list[uuid.UUID]:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        thinker_id, course_id = uuid.uuid4(), uuid.uuid4()
+        await conn.execute(insert(Thinker), [{"id": thinker_id, "name": "T", "era": "Modern"}])
+        await conn.execute(
+            insert(Course), [{"id": course_id, "title": "C", "thinker_id": thinker_id}]
+        )
+        ids = [uuid.uuid4() for _ in range(LECTURES)]
+        await conn.execute(
+            insert(Lecture),
+            [
+                {"id": lecture_id, "title": f"Lecture {i}", "sequence_number": i,
+                 "course_id": course_id, "status": "ready", "transcript": "word " * 1500}
+                for i, lecture_id in enumerate(ids)
+            ],
+        )
+    return ids
+
+
+async def _reader(engine, ids, deadline, latencies, errors) -> None:
+    query = select(Lecture.id, Lecture.title, Lecture.transcript, Lecture.status)
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        try:
+            async with engine.connect() as conn:
+                (await conn.execute(query.where(Lecture.id == random.choice(ids)))).one()
+        except OperationalError:
+            errors.append("read")
+            continue
+        latencies.append(time.perf_counter() - t0)
+
+
+async def _writer(engine, ids, deadline, latencies, errors) -> None:
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    update(Lecture)
+                    .where(Lecture.id == random.choice(ids))
+                    .values(transcript=Lecture.transcript + " more words")
+                )
+        except OperationalError:
+            errors.append("write")
+            continue
+        latencies.append(time.perf_counter() - t0)
+        # A worker flushes partial transcripts on an interval, not back to back
+        await asyncio.sleep(0.005)
+
+
+def _writer_process(url, profile, ids, seconds, writers, out) -> None:
+    """Writers run in their own process, like ``python -m app.worker`` next to the API."""
+
+    async def main() -> None:
+        engine = build_engine(url, profile)
+        latencies, errors = [], []
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(
+            *(_writer(engine, ids, deadline, latencies, errors) for _ in range(writers))
+        )
+        await engine.dispose()
+        out.put((latencies, errors))
+
+    asyncio.run(main())
+
+
+def _p95(samples: list[float]) -> float:
+    return statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else float("nan")
+
+
+async def _run_profile(
+    profile: str, directory: str, readers: int, writers: int, seconds: float
+) -> dict:
+    url = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(dir=directory), 'bench.db')}"
+    engine = build_engine(url, profile)
+    ids = await _populate(engine)
+
+    out = multiprocessing.Queue()
+    writer = multiprocessing.Process(
+        target=_writer_process, args=(url, profile, ids, seconds, writers, out)
+    )
+    writer.start()
+    reads, errors = [], []
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*(_reader(engine, ids, deadline, reads, errors) for _ in range(readers)))
+    writes, write_errors = await asyncio.to_thread(out.get)
+    writer.join()
+    errors += write_errors
+    await engine.dispose()
+    return {
+        "reads/s": len(reads) / seconds,
+        "read p95 ms": _p95(reads) * 1000,
+        "writes/s": len(writes) / seconds,
+        "write p95 ms": _p95(writes) * 1000,
+        "errors": len(errors),
+    }
+
+
+async def run(directory: str, readers: int, writers: int, seconds: float) -> None:
+    results = {
+        profile: await _run_profile(profile, directory, readers, writers, seconds)
+        for profile in ("default", "tuned")
+    }
+    print(f"{readers} readers, {writers} writers, {seconds:g} s per profile")
+    print(f"{'':<14}{'default':>12}{'tuned':>12}")
+    for metric in results["default"]:
+        print(
+            f"{metric:<14}{results['default'][metric]:>12.1f}{results['tuned'][metric]:>12.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--dir", default=None, help="where to create the databases (use a real disk, not tmpfs)"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.dir, args.readers, args.writers, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
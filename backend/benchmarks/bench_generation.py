@@ -0,0 +1,221 @@
+"""Benchmark: end-to-end lecture generation throughput against offline fakes.
+
+Starts ``scripts/fake_llm_server.py`` on a free port, points the app at it
+with ``TTS_PROVIDER=fake``, seeds N lectures in a throwaway SQLite database,
+and runs them through the real job queue and worker: first every transcript
+job, then every audio job, each phase with ``--concurrency`` worker loops.
+
+Reports lectures per minute over the whole run, p50/p95 of each job kind and
+of a lecture's combined generation time (from the persisted
+``generation_timings`` rows), the slowest stages, and the process's peak RSS.
+
+    python benchmarks/bench_generation.py --lectures 20 --concurrency 8
+    python benchmarks/bench_generation.py --profile openai --ttft 1.0 --tokens-per-second 40
+
+Exits non-zero if any job fails (without ``--failure-rate``) or if
+throughput is below ``--min-lectures-per-minute``.
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TMP = tempfile.mkdtemp()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lectures", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8, help="Worker loops per phase")
+    parser.add_argument("--profile", default="azure", choices=("edge-tts", "azure", "openai"))
+    parser.add_argument("--words", type=int, default=2500, help="Words per generated lecture")
+    parser.add_argument("--ttft", type=float, default=0.5)
+    parser.add_argument("--tokens-per-second", type=float, default=80.0)
+    parser.add_argument("--tts-latency", type=float, default=0.3)
+    parser.add_argument("--tts-chars-per-second", type=float, default=250.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="LLM and TTS chunks")
+    parser.add_argument("--no-stream", action="store_true", help="Use non-streaming completions")
+    parser.add_argument("--min-lectures-per-minute", type=float, default=0.0)
+    return parser.parse_args()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_port(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise SystemExit(f"Fake LLM server did not start on port {port}")
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(int(fraction * len(ordered) + 0.5) - 1, 0)] if ordered else 0.0
+
+
+ARGS = _parse_args()
+PORT = _free_port()
+os.environ.update({
+    "DATABASE_URL": f"sqlite+aiosqlite:///{os.path.join(_TMP, 'bench.db')}",
+    "APP_DEBUG": "false",
+    "GITHUB_TOKEN": "fake",
+    "GITHUB_MODELS_ENDPOINT": f"http://127.0.0.1:{PORT}/chat/completions",
+    "LLM_STREAM": "false" if ARGS.no_stream else "true",
+    "TTS_PROVIDER": "fake",
+    "FAKE_TTS_PROFILE": ARGS.profile,
+    "FAKE_TTS_LATENCY": str(ARGS.tts_latency),
+    "FAKE_TTS_CHARS_PER_SECOND": str(ARGS.tts_chars_per_second),
+    "FAKE_TTS_FAILURE_RATE": str(ARGS.failure_rate),
+    "AUDIO_CACHE_DIR": os.path.join(_TMP, "audio_cache"),
+    "JOB_MAX_ATTEMPTS": "1",
+    "METRICS_ENABLED": "false",
+})
+
+from sqlalchemy import select  # noqa: E402
+
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import async_session, engine  # noqa: E402
+from app.models import Course, GenerationJob, GenerationTiming, Lecture, Thinker  # noqa: E402
+from app.services import job_queue  # noqa: E402
+from app.services.fake_tts_service import AUDIO_DIR  # noqa: E402
+from app.services.http_client import close_http_client, init_http_client  # noqa: E402
+from app.worker import worker_loop  # noqa: E402
+
+
+async def _seed(n: int) -> list:
+    await upgrade_database()
+    async with async_session() as session:
+        thinker = Thinker(name="Bench Thinker", era="Modern", system_prompt="")
+        session.add(thinker)
+        await session.flush()
+        course = Course(title="Bench Course", thinker_id=thinker.id)
+        session.add(course)
+        await session.flush()
+        lectures = [
+            Lecture(title=f"Lecture {i}", sequence_number=i + 1, course_id=course.id)
+            for i in range(n)
+        ]
+        session.add_all(lectures)
+        await session.commit()
+        return [lecture.id for lecture in lectures]
+
+
+async def _run_phase(kind: str, lecture_ids: list, concurrency: int) -> float:
+    async with async_session() as session:
+        for i, lecture_id in enumerate(lecture_ids):
+            await job_queue.enqueue_job(session, kind, lecture_id, {"topic": f"Topic {i}"})
+        await session.commit()
+    stop = asyncio.Event()
+    t0 = time.perf_counter()
+    await asyncio.gather(*(
+        worker_loop(f"bench:{kind}:{i}", stop, once=True, kinds=(kind,))
+        for i in range(concurrency)
+    ))
+    return time.perf_counter() - t0
+
+
+async def _report(lecture_ids: list, wall: float) -> int:
+    async with async_session() as session:
+        jobs = (await session.execute(select(GenerationJob))).scalars().all()
+        rows = (await session.execute(select(GenerationTiming))).scalars().all()
+
+    failed = sum(1 for job in jobs if job.status != "succeeded")
+    per_kind: dict[str, list[float]] = {}
+    per_lecture: dict = {}
+    stages: dict[str, float] = {}
+    voiced = {row.lecture_id for row in rows if row.kind == "audio" and row.status == "succeeded"}
+    for row in rows:
+        if row.status != "succeeded":
+            continue
+        per_kind.setdefault(row.kind, []).append(row.total_ms)
+        if row.lecture_id in voiced:
+            per_lecture[row.lecture_id] = per_lecture.get(row.lecture_id, 0.0) + row.total_ms
+        for name, stage in json.loads(row.stages).items():
+            stages[name] = stages.get(name, 0.0) + stage["total_ms"]
+    completed = len(voiced)
+    rate = completed / wall * 60 if wall else 0.0
+
+    print(f"{'lectures':<20}{completed}/{len(lecture_ids)} in {wall:.1f} s ({failed} failed jobs)")
+    print(f"{'throughput':<20}{rate:.1f} lectures/min")
+    for label, values in [*sorted(per_kind.items()), ("lecture", list(per_lecture.values()))]:
+        print(f"{label + ' latency':<20}p50 {_percentile(values, 0.5) / 1000:6.2f} s   "
+              f"p95 {_percentile(values, 0.95) / 1000:6.2f} s")
+    # Spans nest (tts.synthesize contains the chunks), so these are totals, not shares
+    slowest = sorted(
+        ((name, ms) for name, ms in stages.items() if not name.startswith("job.")),
+        key=lambda item: -item[1],
+    )[:6]
+    print(f"{'stage totals':<20}" + ", ".join(f"{name} {ms / 1000:.1f} s" for name, ms in slowest))
+    print(f"{'peak RSS':<20}{_peak_rss_mb():.0f} MB")
+
+    if failed and not ARGS.failure_rate:
+        print("FAIL: jobs failed without injected failures")
+        return 1
+    if rate < ARGS.min_lectures_per_minute:
+        print(f"FAIL: below {ARGS.min_lectures_per_minute} lectures/min")
+        return 1
+    return 0
+
+
+async def _main() -> int:
+    lecture_ids = await _seed(ARGS.lectures)
+    await init_http_client()
+    try:
+        transcript_s = await _run_phase(job_queue.JOB_TRANSCRIPT, lecture_ids, ARGS.concurrency)
+        audio_s = await _run_phase(job_queue.JOB_AUDIO, lecture_ids, ARGS.concurrency)
+        print(f"{'phases':<20}transcript {transcript_s:.1f} s, audio {audio_s:.1f} s")
+        return await _report(lecture_ids, transcript_s + audio_s)
+    finally:
+        await close_http_client()
+        await engine.dispose()
+        for lecture_id in lecture_ids:
+            for path in glob.glob(os.path.join(AUDIO_DIR, f"{lecture_id}.*")):
+                os.remove(path)
+
+
+def main() -> None:
+    server = subprocess.Popen(
+        [
+            sys.executable, os.path.join(BACKEND, "scripts", "fake_llm_server.py"),
+            "--port", str(PORT),
+            "--ttft", str(ARGS.ttft),
+            "--tokens-per-second", str(ARGS.tokens_per_second),
+            "--words", str(ARGS.words),
+            "--failure-rate", str(ARGS.failure_rate),
+        ],
+        env={**os.environ, "PYTHONPATH": BACKEND},
+    )
+    try:
+        _wait_for_port(PORT)
+        status = asyncio.run(_main())
+    finally:
+        server.terminate()
+        server.wait()
+    raise SystemExit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark: fresh httpx client per call vs. the shared pooled client.
+
+Starts a local stub chat-completions server (plain asyncio, HTTP/1.1 keep-alive)
+that counts accepted TCP connections, then issues the same requests through a
+new ``httpx.AsyncClient`` per call (the old lecture_generator behaviour) and
+through ``app.services.http_client.build_http_client()``.
+
+    python benchmarks/bench_http_client.py --requests 500 --concurrency 8
+
+The stub adds no TLS, so the measured win understates production, where every
+new connection also pays a TLS handshake to the model endpoint.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from app.services.http_client import build_http_client
+
+RESPONSE_BODY = json.dumps(
+    {"choices": [{"message": {"role": "assistant", "content": "Hello from the stub."}}]}
+).encode()
+
+
+class StubServer:
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.connections = 0
+        self.server: asyncio.base_events.Server | None = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(RESPONSE_BODY)).encode() + b"\r\n\r\n"
+                    + RESPONSE_BODY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/chat/completions"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+
+PAYLOAD = {"model": "stub", "messages": [{"role": "user", "content": "hi"}]}
+
+
+async def _fresh_client_call(url: str) -> None:
+    async with httpx.AsyncClient(timeout=120.0) as client:
+        response = await client.post(url, json=PAYLOAD)
+        response.raise_for_status()
+
+
+async def _shared_client_call(client: httpx.AsyncClient, url: str) -> None:
+    response = await client.post(url, json=PAYLOAD)
+    response.raise_for_status()
+
+
+async def _run(name: str, call, n: int, concurrency: int, server: StubServer) -> None:
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one():
+        async with sem:
+            t0 = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - t0)
+
+    server.connections = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+    print(
+        f"{name:<14} {n / elapsed:>9.0f} req/s   p50 {p50:6.2f} ms   p95 {p95:6.2f} ms   "
+        f"TCP connections {server.connections}"
+    )
+
+
+async def main(n: int, concurrency: int, latency_ms: float) -> None:
+    server = StubServer(latency_ms)
+    url = await server.start()
+    print(f"{n} requests, concurrency {concurrency}, stub latency {latency_ms} ms\n")
+    try:
+        await _run("fresh client", lambda: _fresh_client_call(url), n, concurrency, server)
+        shared = build_http_client()
+        try:
+            await _run(
+                "shared client", lambda: _shared_client_call(shared, url), n, concurrency, server
+            )
+        finally:
+            await shared.aclose()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency_ms))
@@ -0,0 +1,81 @@
+"""Benchmark: cost of recording metrics.
+
+Times the primitive operations (counter increment, histogram observation,
+label lookup) and a scrape rendering every metric, then compares
+``GET /health`` throughput through the ASGI app with and without
+``MetricsMiddleware``. The run fails if the middleware adds more than
+``--max-us`` microseconds per request.
+
+    python benchmarks/bench_metrics_overhead.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import timeit
+
+_DIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_DIR, 'bench.db')}"
+os.environ["APP_DEBUG"] = "false"
+os.environ["DB_AUTO_MIGRATE"] = "false"
+os.environ["RESPONSE_CACHE_WARM"] = "false"
+
+import httpx  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.services import metrics  # noqa: E402
+
+
+def _per_call_ns(statement, number: int = 200_000) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def primitives() -> None:
+    counter = metrics.TTS_CHARACTERS.labels("bench")
+    histogram = metrics.HTTP_REQUEST_SECONDS.labels("GET", "/bench", "200")
+    print(f"counter.inc()            {_per_call_ns(counter.inc):8.0f} ns")
+    print(f"histogram.observe()      {_per_call_ns(lambda: histogram.observe(0.003)):8.0f} ns")
+    labeled = _per_call_ns(lambda: metrics.DB_QUERY_SECONDS.labels("SELECT").observe(1e-4))
+    print(f"labels() + observe()     {labeled:8.0f} ns")
+    t0 = time.perf_counter()
+    body = metrics.exposition()
+    print(f"render /metrics          {(time.perf_counter() - t0) * 1e3:8.2f} ms "
+          f"({len(body.splitlines())} lines)")
+
+
+async def _requests_per_second(instrumented: bool, requests: int) -> float:
+    settings.metrics_enabled = instrumented
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(200):  # warm up
+            await client.get("/health")
+        t0 = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/health")
+        return requests / (time.perf_counter() - t0)
+
+
+async def run(requests: int, max_us: float) -> None:
+    primitives()
+    plain = max([await _requests_per_second(False, requests) for _ in range(3)])
+    measured = max([await _requests_per_second(True, requests) for _ in range(3)])
+    overhead_us = (1 / measured - 1 / plain) * 1e6
+    print(f"GET /health without metrics {plain:8.0f} req/s")
+    print(f"GET /health with metrics    {measured:8.0f} req/s ({overhead_us:+.1f} us/request)")
+    assert overhead_us <= max_us, f"middleware adds {overhead_us:.1f} us per request"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--max-us", type=float, default=50.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.max_us))
+
+
+if __name__ == "__main__":
+    main()
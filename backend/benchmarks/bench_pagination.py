@@ -0,0 +1,133 @@
+"""Benchmark: keyset vs. OFFSET pagination at increasing depth.
+
+Inserts a synthetic catalog (``--rows`` lectures, 100k by default) into a
+throwaway SQLite database, then fetches one page at several depths both ways:
+``LIMIT/OFFSET`` and the keyset query ``list_lectures`` runs through
+``fetch_page``. Both must return the same rows. OFFSET reads and discards
+every row before the page, so its latency grows with depth; keyset pages
+seek straight to their position through the ``(sequence_number, id)``
+index. The run fails if the deepest keyset page is more than
+``--max-ratio`` times slower than the first one.
+
+    python benchmarks/bench_pagination.py --rows 100000 --limit 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+_DB = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB}"
+os.environ["APP_DEBUG"] = "false"
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import async_session, engine  # noqa: E402
+from app.models import Course, Lecture, Thinker  # noqa: E402
+from app.schemas.lecture import LectureSummary  # noqa: E402
+from app.services.pagination import encode_cursor, fetch_page  # noqa: E402
+from app.services.sparse_fields import column_options  # noqa: E402
+
+SORT = (Lecture.sequence_number, Lecture.id)
+
+
+async def _populate(rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        thinker_id, course_id = uuid.uuid4(), uuid.uuid4()
+        await conn.execute(insert(Thinker), [{"id": thinker_id, "name": "T", "era": "Modern"}])
+        await conn.execute(
+            insert(Course), [{"id": course_id, "title": "C", "thinker_id": thinker_id}]
+        )
+        batch = 10_000
+        for start in range(0, rows, batch):
+            await conn.execute(
+                insert(Lecture),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "title": f"Lecture {i}",
+                        # Duplicate sort keys exercise the id tiebreaker
+                        "sequence_number": i // 3,
+                        "course_id": course_id,
+                        "status": "ready",
+                        "transcript": "word " * 200,
+                    }
+                    for i in range(start, min(start + batch, rows))
+                ],
+            )
+
+
+def _base_query():
+    return select(Lecture).options(
+        *column_options(Lecture, LectureSummary, extra=("sequence_number",))
+    )
+
+
+async def _time(fn, repeat: int) -> tuple[float, list]:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        rows = await fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples), rows
+
+
+async def run(rows: int, limit: int, repeat: int, max_ratio: float) -> None:
+    t0 = time.perf_counter()
+    await _populate(rows)
+    print(f"inserted {rows} lectures in {time.perf_counter() - t0:.1f} s")
+
+    depths = [0, rows // 10, rows // 2, rows - limit]
+    keyset_times = []
+    print(f"{'depth':>8}  {'OFFSET':>10}  {'keyset':>10}")
+    async with async_session() as session:
+        for depth in depths:
+            cursor = None
+            if depth:
+                # The cursor a client would hold after paging to ``depth``
+                before = await session.scalar(
+                    _base_query().order_by(*SORT).offset(depth - 1).limit(1)
+                )
+                cursor = encode_cursor("lectures", (before.sequence_number, before.id))
+
+            async def by_offset(depth=depth):
+                result = await session.execute(
+                    _base_query().order_by(*SORT).offset(depth).limit(limit)
+                )
+                return [lec.id for lec in result.scalars()]
+
+            async def by_keyset(cursor=cursor):
+                page = await fetch_page(session, _base_query(), SORT, limit, cursor, "lectures")
+                return [lec.id for lec in page.items]
+
+            offset_s, offset_ids = await _time(by_offset, repeat)
+            keyset_s, keyset_ids = await _time(by_keyset, repeat)
+            assert offset_ids == keyset_ids, f"pages differ at depth {depth}"
+            keyset_times.append(keyset_s)
+            print(f"{depth:>8}  {offset_s * 1000:8.2f}ms  {keyset_s * 1000:8.2f}ms")
+            session.expunge_all()
+
+    ratio = keyset_times[-1] / keyset_times[0]
+    print(f"deepest/first keyset page: {ratio:.2f}x")
+    assert ratio <= max_ratio, f"keyset latency grew {ratio:.1f}x with depth"
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--max-ratio", type=float, default=3.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.limit, args.repeat, args.max_ratio))
+
+
+if __name__ == "__main__":
+    main()
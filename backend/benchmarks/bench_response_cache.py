@@ -0,0 +1,96 @@
+"""Benchmark: catalog endpoints with and without the read-through response cache.
+
+Fills a throwaway SQLite database with synthetic thinkers, courses and
+lectures, then times repeated requests to the cached routes through
+FastAPI's test client, first with ``response_cache_enabled`` off and then on,
+and checks both return identical bodies.
+
+    python benchmarks/bench_response_cache.py --thinkers 50 --courses-per-thinker 6
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+_DB = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB}"
+os.environ["APP_DEBUG"] = "false"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import async_session, engine  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.models import Course, Lecture, Thinker  # noqa: E402
+
+
+async def _populate(n_thinkers: int, per_thinker: int) -> tuple[list, list]:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as session:
+        thinkers = [
+            Thinker(name=f"Thinker {i}", era="Modern", bio="A biography. " * 40)
+            for i in range(n_thinkers)
+        ]
+        session.add_all(thinkers)
+        await session.flush()
+        courses = [
+            Course(title=f"Course {t.name} {j}", description="About. " * 30, thinker_id=t.id)
+            for t in thinkers
+            for j in range(per_thinker)
+        ]
+        session.add_all(courses)
+        await session.flush()
+        lectures = [
+            Lecture(title="Lecture", course_id=c.id, status="ready", transcript="word " * 3000)
+            for c in courses
+        ]
+        session.add_all(lectures)
+        await session.commit()
+        return [c.id for c in courses], [lec.id for lec in lectures]
+
+
+def _run(client: TestClient, paths: list[str], rounds: int) -> tuple[float, list[bytes]]:
+    bodies = [client.get(p).content for p in paths]  # populate the cache
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for path in paths:
+            client.get(path)
+    return (time.perf_counter() - t0) / (rounds * len(paths)), bodies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--thinkers", type=int, default=50)
+    parser.add_argument("--courses-per-thinker", type=int, default=6)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    course_ids, lecture_ids = asyncio.run(_populate(args.thinkers, args.courses_per_thinker))
+    routes = {
+        "list_thinkers": ["/api/thinkers/"],
+        "list_courses": ["/api/courses/"],
+        "get_course": [f"/api/courses/{cid}" for cid in course_ids[:20]],
+        "get_lecture": [f"/api/lectures/{lid}" for lid in lecture_ids[:20]],
+    }
+
+    results = {}
+    for enabled in (False, True):
+        settings.response_cache_enabled = enabled
+        with TestClient(create_app()) as client:
+            results[enabled] = {
+                name: _run(client, paths, args.rounds) for name, paths in routes.items()
+            }
+
+    for name in routes:
+        (off, off_bodies), (on, on_bodies) = results[False][name], results[True][name]
+        assert off_bodies == on_bodies, f"{name}: cached body differs"
+        print(f"{name:14s} uncached {off * 1000:7.2f} ms  cached {on * 1000:7.2f} ms  "
+              f"({off / on:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
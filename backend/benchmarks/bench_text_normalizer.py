@@ -0,0 +1,149 @@
+"""Benchmark: markdown normalization of lecture transcripts.
+
+Compares the previous ten-pass ``strip_markdown`` + paragraph split that each
+TTS provider ran against ``app.services.text_normalizer``, and checks that
+both produce identical clean text and paragraphs on:
+
+* the seeded thinker bios and prompts (``scripts/seed.py``)
+* synthetic lecture-style markdown (headings, numbered headings, bullets,
+  emphasis, code, links, rules, blank-line runs)
+
+    python benchmarks/bench_text_normalizer.py --lectures 200 --paragraphs 40
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+from app.services.text_normalizer import normalize_transcript
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND, "scripts"))
+from seed import DISCIPLINES, THINKERS  # noqa: E402
+
+
+def _legacy_strip_markdown(text: str) -> str:
+    text = re.sub(r"#{1,6}\s*", "", text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
+    text = re.sub(r"\*(.+?)\*", r"\1", text)
+    text = re.sub(r"_(.+?)_", r"\1", text)
+    text = re.sub(r"`(.+?)`", r"\1", text)
+    text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)
+    text = re.sub(r"^[-*+]\s+", "", text, flags=re.MULTILINE)
+    text = re.sub(r"^\d+\.\s+", "", text, flags=re.MULTILINE)
+    text = re.sub(r"---+", "", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def _legacy(transcript: str) -> tuple[str, list[str]]:
+    clean_text = _legacy_strip_markdown(transcript)
+    return clean_text, [p.strip() for p in clean_text.split("\n\n") if p.strip()]
+
+
+def _seed_corpus() -> list[str]:
+    texts = [d["description"] for d in DISCIPLINES]
+    for thinker in THINKERS:
+        texts.extend(str(v) for v in thinker.values() if isinstance(v, str))
+    return texts
+
+
+_WORDS = (
+    "reason nature truth the of and a motion energy light machine soul will "
+    "number question universe mind we must consider how why is it"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 18))]
+    for i in rng.sample(range(len(words)), rng.choice([0, 0, 0, 1, 1, 2])):
+        words[i] = rng.choice([
+            f"**{words[i]}**", f"*{words[i]}*", f"_{words[i]}_", f"`{words[i]}`",
+            f"[{words[i]}](https://example.org/{words[i]})",
+            f"***{words[i]}***", f"**{words[i]} *{rng.choice(_WORDS)}***",
+            f"*{words[i]} **{rng.choice(_WORDS)}** {rng.choice(_WORDS)}*",
+        ])
+    return " ".join(words).capitalize() + rng.choice([".", ".", "?", "!"])
+
+
+def _synthetic_lecture(rng: random.Random, n_paragraphs: int) -> str:
+    blocks = [f"# {rng.choice(_WORDS).title()} and {rng.choice(_WORDS).title()}"]
+    for i in range(n_paragraphs):
+        kind = rng.random()
+        if kind < 0.1:
+            blocks.append(f"## {i}. {rng.choice(_WORDS).title()}")
+        elif kind < 0.15:
+            blocks.append("---")
+        elif kind < 0.3:
+            marker = rng.choice(["-", "+", "*"])
+            blocks.append("\n".join(
+                f"{marker} {_sentence(rng)}" for _ in range(rng.randint(2, 4))
+            ))
+        elif kind < 0.4:
+            blocks.append("\n".join(
+                f"{n}. {_sentence(rng)}" for n in range(1, rng.randint(3, 5))
+            ))
+        else:
+            blocks.append(" ".join(_sentence(rng) for _ in range(rng.randint(3, 8))))
+    return "".join(block + "\n" * rng.choice([1, 2, 2, 2, 3, 4]) for block in blocks)
+
+
+# Constructs where the old passes interacted with each other
+_EDGE_CASES = [
+    "## 1. Introduction\n\nText.",
+    "### - Bulleted heading",
+    "Languages like C#\n- Java\n- Go",
+    "***Bold italic*** and **bold *italic***.",
+    "* A bullet with **bold** inside\n* Another *one*",
+    "*Italic with **bold** inside* here.",
+    "See [the *Notes*](https://example.org/notes_a_b) and `a_b`.",
+    "Text\n\n---\n\n\n\nMore text\n\n\n",
+    "snake_case_names and 3.14 and 1. not a list",
+]
+
+
+def _check(corpus: list[str], label: str) -> None:
+    for transcript in corpus:
+        text, paragraphs = _legacy(transcript)
+        result = normalize_transcript(transcript)
+        assert result.text == text, f"{label}: text differs for {transcript[:80]!r}"
+        assert list(result.paragraphs) == paragraphs, f"{label}: paragraphs differ"
+    print(f"{label:<22} {len(corpus):5d} transcripts identical")
+
+
+def _timed(fn, corpus: list[str], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for transcript in corpus:
+            fn(transcript)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lectures", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=40)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    seed_corpus = _seed_corpus()
+    lectures = [_synthetic_lecture(rng, args.paragraphs) for _ in range(args.lectures)]
+    size_kb = sum(len(t) for t in lectures) / 1024
+
+    _check(_EDGE_CASES, "edge cases")
+    _check(seed_corpus, "seed texts")
+    _check(lectures, "synthetic lectures")
+
+    print(f"\n{args.lectures} lectures, {size_kb:.0f} KB of markdown")
+    t_legacy = _timed(_legacy, lectures)
+    t_new = _timed(normalize_transcript, lectures)
+    print(f"normalize + split   legacy {t_legacy:8.1f} ms   new {t_new:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: time-windowed word timing lookups on a multi-hour lecture.
+
+Compares a linear scan over every word against ``TimingsIndex.window`` for
+random windows, asserting both return the same words, and reports how long
+building the index takes and how large a window payload is next to the full
+timings document.
+
+    python benchmarks/bench_timings_index.py --words 60000 --window-ms 60000
+"""
+
+import argparse
+import json
+import random
+import time
+
+from app.services.timings_index import TimingsIndex
+from app.services.word_timings import WordTimings
+
+
+def _make_timings(n_words: int, rng: random.Random) -> tuple[list[str], WordTimings]:
+    timings = WordTimings()
+    start = 0
+    para = 0
+    for i in range(n_words):
+        # Occasional long words outlast the next word's start, so ends are not sorted
+        duration = rng.choice((180, 220, 260, 300, 900))
+        timings.append(start, start + duration, para)
+        start += rng.choice((150, 200, 250, 300))
+        if i % 60 == 59:
+            para += 1
+    paragraphs = [f"Paragraph {i} " + "words " * 60 for i in range(para + 1)]
+    return paragraphs, timings
+
+
+def _linear_window(timings: WordTimings, from_ms: int, to_ms: int) -> list[tuple]:
+    return [(s, e, p) for s, e, p in timings if e > from_ms and s < to_ms]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=60000)
+    parser.add_argument("--window-ms", type=int, default=60000)
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    paragraphs, timings = _make_timings(args.words, rng)
+    duration = timings.end_ms
+    print(f"{args.words} words, {duration / 3_600_000:.2f} h of audio")
+
+    t0 = time.perf_counter()
+    index = TimingsIndex(paragraphs, timings)
+    print(f"build index:    {(time.perf_counter() - t0) * 1000:8.2f} ms")
+
+    windows = [
+        (f, f + rng.randint(1, args.window_ms))
+        for f in (rng.randint(0, duration) for _ in range(args.lookups))
+    ]
+    windows += [(0, 1), (0, duration + 1), (duration, duration + 1000)]
+
+    t0 = time.perf_counter()
+    expected = [_linear_window(timings, f, t) for f, t in windows]
+    linear = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    got = [index.window(f, t) for f, t in windows]
+    indexed = time.perf_counter() - t0
+
+    for (f, t), want, window in zip(windows, expected, got):
+        words = list(zip(window.starts, window.ends, window.paras))
+        assert words == want, f"window {f}-{t} differs"
+        assert set(window.paragraphs) == {p for _, _, p in want}
+    print(f"linear scan:    {linear / len(windows) * 1000:8.3f} ms/lookup")
+    print(f"indexed:        {indexed / len(windows) * 1000:8.3f} ms/lookup "
+          f"({linear / indexed:.0f}x)")
+
+    full = len(timings.dumps(paragraphs))
+    window = index.window(duration // 2, duration // 2 + args.window_ms)
+    part = WordTimings()
+    for s, e, p in zip(window.starts, window.ends, window.paras):
+        part.append(s, e, p)
+    partial = len(json.dumps(list(window.paragraphs.values()))) + len(part.dumps([]))
+    print(f"payload:        {full / 1024:8.1f} KB full, "
+          f"{partial / 1024:.1f} KB for one {args.window_ms / 1000:.0f} s window")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark: transcript search latency on a large corpus.
+
+Migrates a throwaway SQLite database (which creates the FTS5 index and its
+triggers), inserts ``--lectures`` ready lectures whose transcripts are drawn
+from a Zipf-distributed vocabulary, then times ``search_transcripts`` for
+rare, mid-frequency, common and multi-word queries. For comparison it
+times the alternative the endpoint replaces once: reading every transcript
+and scanning it in Python. The run fails if a query's median latency
+exceeds ``--max-ms``.
+
+    python benchmarks/bench_transcript_search.py --lectures 100000 --words 300
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+
+_DB = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB}"
+os.environ["APP_DEBUG"] = "false"
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import async_session, engine  # noqa: E402
+from app.models import Course, Lecture, Thinker  # noqa: E402
+from app.services.transcript_search import search_transcripts  # noqa: E402
+
+VOCABULARY = 20_000
+PARAGRAPH_WORDS = 60
+
+
+def _vocabulary(rng: random.Random) -> list[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < VOCABULARY:
+        words.add("".join(rng.choices(letters, k=rng.randint(4, 10))))
+    return sorted(words, key=lambda w: (len(w), w))
+
+
+async def _populate(lectures: int, words: int, rng: random.Random) -> list[str]:
+    vocab = _vocabulary(rng)
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    await upgrade_database()
+    async with engine.begin() as conn:
+        thinker_id, course_id = uuid.uuid4(), uuid.uuid4()
+        await conn.execute(insert(Thinker), [{"id": thinker_id, "name": "T", "era": "Modern"}])
+        await conn.execute(
+            insert(Course), [{"id": course_id, "title": "C", "thinker_id": thinker_id}]
+        )
+        batch = 2_000
+        for start in range(0, lectures, batch):
+            rows = []
+            for i in range(start, min(start + batch, lectures)):
+                text = rng.choices(vocab, weights, k=words)
+                paragraphs = [
+                    " ".join(text[p:p + PARAGRAPH_WORDS]) + "."
+                    for p in range(0, words, PARAGRAPH_WORDS)
+                ]
+                rows.append(
+                    {"id": uuid.uuid4(), "title": f"Lecture {i}", "sequence_number": i,
+                     "course_id": course_id, "status": "ready", "audio_url": None,
+                     "transcript": "\n\n".join(paragraphs)}
+                )
+            await conn.execute(insert(Lecture), rows)
+    return vocab
+
+
+async def _time_query(q: str, limit: int, repeat: int) -> tuple[float, int]:
+    samples, hits = [], []
+    for _ in range(repeat):
+        async with async_session() as db:
+            t0 = time.perf_counter()
+            hits = (await search_transcripts(db, q, limit)).items
+            samples.append(time.perf_counter() - t0)
+    return statistics.median(samples), len(hits)
+
+
+async def _python_scan(term: str) -> tuple[float, int]:
+    t0 = time.perf_counter()
+    matches = 0
+    async with async_session() as db:
+        result = await db.stream(select(Lecture.transcript).where(Lecture.status == "ready"))
+        async for (transcript,) in result:
+            matches += term in transcript.split()
+    return time.perf_counter() - t0, matches
+
+
+async def run(lectures: int, words: int, limit: int, repeat: int, max_ms: float) -> None:
+    rng = random.Random(7)
+    t0 = time.perf_counter()
+    vocab = await _populate(lectures, words, rng)
+    print(f"inserted and indexed {lectures} lectures ({words} words) "
+          f"in {time.perf_counter() - t0:.1f} s, db {os.path.getsize(_DB) / 1e6:.0f} MB")
+
+    queries = {
+        "rare": vocab[-1],
+        "mid": vocab[VOCABULARY // 20],
+        "common": vocab[0],
+        "two words": f"{vocab[10]} {vocab[500]}",
+        "three words": f"{vocab[3]} {vocab[200]} {vocab[5000]}",
+    }
+    print(f"{'query':<12}{'median':>10}{'hits':>6}")
+    worst = 0.0
+    for label, q in queries.items():
+        seconds, hits = await _time_query(q, limit, repeat)
+        worst = max(worst, seconds)
+        print(f"{label:<12}{seconds * 1000:8.2f}ms{hits:>6}")
+
+    scan_s, matches = await _python_scan(queries["mid"])
+    print(f"python scan of every transcript: {scan_s * 1000:.0f}ms ({matches} matches)")
+    await engine.dispose()
+    assert worst * 1000 <= max_ms, f"slowest query took {worst * 1000:.1f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lectures", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=300, help="words per transcript")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument("--max-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.lectures, args.words, args.limit, args.repeat, args.max_ms))
+
+
+if __name__ == "__main__":
+    main()
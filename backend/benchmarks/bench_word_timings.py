@@ -0,0 +1,158 @@
+"""Benchmark: building and serializing word timings for a long transcript.
+
+Compares the previous list-of-dicts code paths against
+``app.services.word_timings`` on a synthetic transcript:
+
+* edge-tts paragraph assignment (cumulative word-count rescan vs. prefix
+  sums + bisect)
+* Azure paragraph assignment (linear char-range scan vs. bisect)
+* serialization to the ``{"p", "w"}`` schema, and retained memory
+* payload size of the JSON vs. the compact binary encoding, raw and
+  precompressed as they are written next to each lecture's audio
+
+    python benchmarks/bench_word_timings.py --words 20000 --paragraphs 400
+"""
+
+import argparse
+import gzip
+import json
+import random
+import time
+import tracemalloc
+
+from app.services.audio_writer import brotli
+from app.services.word_timings import ParagraphLocator, WordTimings
+
+
+def _make_transcript(n_words: int, n_paragraphs: int) -> list[str]:
+    rng = random.Random(42)
+    vocab = ["the", "nature", "of", "thought", "is", "curious", "indeed", "we", "must", "ask"]
+    per_para = max(n_words // n_paragraphs, 1)
+    return [
+        " ".join(rng.choice(vocab) for _ in range(per_para)) + "."
+        for _ in range(n_paragraphs)
+    ]
+
+
+def _legacy_edge(paragraphs: list[str], n_words: int) -> list[dict]:
+    para_word_counts = [len(p.split()) for p in paragraphs]
+    word_timings: list[dict] = []
+    for global_word_idx in range(n_words):
+        para_idx = 0
+        cumulative = 0
+        for i, count in enumerate(para_word_counts):
+            cumulative += count
+            if global_word_idx < cumulative:
+                para_idx = i
+                break
+        offset = global_word_idx * 300
+        word_timings.append({"s": offset, "e": offset + 250, "p": para_idx})
+    return word_timings
+
+
+def _new_edge(paragraphs: list[str], n_words: int) -> WordTimings:
+    locator = ParagraphLocator.from_paragraphs(paragraphs)
+    timings = WordTimings()
+    for global_word_idx in range(n_words):
+        offset = global_word_idx * 300
+        timings.append(offset, offset + 250, locator.for_word(global_word_idx))
+    return timings
+
+
+def _char_ranges(paragraphs: list[str]) -> tuple[list[tuple[int, int, int]], list[int]]:
+    ranges, offsets, pos = [], [], 0
+    for idx, para in enumerate(paragraphs):
+        ranges.append((pos, pos + len(para), idx))
+        word_pos = pos
+        for word in para.split():
+            offsets.append(word_pos)
+            word_pos += len(word) + 1
+        pos += len(para) + 2
+    return ranges, offsets
+
+
+def _legacy_azure(ranges, offsets, default: int) -> list[dict]:
+    word_timings = []
+    for i, text_offset in enumerate(offsets):
+        para_idx = default
+        for pstart, pend, gidx in ranges:
+            if pstart <= text_offset < pend:
+                para_idx = gidx
+                break
+        word_timings.append({"s": i * 300, "e": i * 300 + 250, "p": para_idx})
+    return word_timings
+
+
+def _new_azure(ranges, offsets, default: int) -> WordTimings:
+    locator = ParagraphLocator.from_char_ranges(ranges, default)
+    timings = WordTimings()
+    for i, text_offset in enumerate(offsets):
+        timings.append(i * 300, i * 300 + 250, locator.for_offset(text_offset))
+    return timings
+
+
+def _timed(fn, *args, repeat: int = 3):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def _retained_kb(fn, *args) -> float:
+    tracemalloc.start()
+    result = fn(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=20_000)
+    parser.add_argument("--paragraphs", type=int, default=400)
+    args = parser.parse_args()
+
+    paragraphs = _make_transcript(args.words, args.paragraphs)
+    n_words = sum(len(p.split()) for p in paragraphs)
+    ranges, offsets = _char_ranges(paragraphs)
+    print(f"{n_words} words in {len(paragraphs)} paragraphs\n")
+
+    legacy, t_legacy = _timed(_legacy_edge, paragraphs, n_words)
+    new, t_new = _timed(_new_edge, paragraphs, n_words)
+    assert [w["p"] for w in legacy] == list(new.paras)
+    print(f"edge-tts assignment   legacy {t_legacy:8.1f} ms   new {t_new:8.1f} ms")
+
+    legacy_az, t_legacy = _timed(_legacy_azure, ranges, offsets, len(paragraphs) - 1)
+    new_az, t_new = _timed(_new_azure, ranges, offsets, len(paragraphs) - 1)
+    assert [w["p"] for w in legacy_az] == list(new_az.paras)
+    print(f"Azure assignment      legacy {t_legacy:8.1f} ms   new {t_new:8.1f} ms")
+
+    legacy_json, t_legacy = _timed(
+        lambda: json.dumps({"p": paragraphs, "w": legacy}, ensure_ascii=False)
+    )
+    new_json, t_new = _timed(new.dumps, paragraphs)
+    assert json.loads(legacy_json) == json.loads(new_json)
+    print(f"serialize             legacy {t_legacy:8.1f} ms   new {t_new:8.1f} ms")
+
+    compact, t_compact = _timed(new.dumps_compact, paragraphs)
+    decoded_paragraphs, decoded = WordTimings.loads_compact(compact)
+    assert decoded_paragraphs == paragraphs and list(decoded) == list(new)
+    print(f"compact encode        {t_compact:8.1f} ms")
+    for label, payload in (("JSON", new_json.encode()), ("compact", compact)):
+        sizes = [f"raw {len(payload) / 1024:7.1f} KB",
+                 f"gzip {len(gzip.compress(payload, 9)) / 1024:6.1f} KB"]
+        if brotli is not None:
+            sizes.append(f"brotli {len(brotli.compress(payload, quality=11)) / 1024:6.1f} KB")
+        print(f"payload {label:<13} " + "   ".join(sizes))
+
+    kb_legacy = _retained_kb(_legacy_edge, paragraphs, n_words)
+    kb_new = _retained_kb(_new_edge, paragraphs, n_words)
+    print(f"retained memory       legacy {kb_legacy:8.0f} KB   new {kb_new:8.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""Load test: replay a mix of catalog, lecture and audio reads against a running API.
+
+Discovers what to request by paging through the running instance's own
+listings (thinkers, courses, and ready lectures with ``view=summary``), then
+runs ``--users`` virtual users for ``--duration`` seconds. Each user picks a
+request from the weighted ``--mix`` and sends the next one as soon as the
+last completes (plus ``--think-time``):
+
+* ``thinkers``: the thinker list, sometimes filtered by discipline
+* ``courses``: a thinker's courses
+* ``course``: one course
+* ``lectures``: a course's lecture summaries
+* ``lecture``: one lecture with its transcript
+* ``timings``: a 30 s window of word timings around a random playhead
+* ``timings_file``: a lecture's whole timings file (gzip accepted)
+* ``audio``: a 256 KB range of a lecture's mp3, as a seeking player asks
+
+Reports throughput, p50/p90/p99/max latency and error rate per request kind
+and overall. Generate a catalog to test against with
+``scripts/generate_catalog.py``.
+
+    python benchmarks/load_test.py --base-url http://localhost:8000 --users 32 --duration 60
+    python benchmarks/load_test.py --mix lecture=3,audio=1 --max-p95-ms 250 --max-error-rate 0.01
+
+Exits non-zero when the overall p95 or error rate exceeds the given limits.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+DEFAULT_MIX = (
+    "thinkers=8,courses=8,course=10,lectures=10,lecture=25,timings=20,timings_file=4,audio=15"
+)
+AUDIO_RANGE_BYTES = 256 * 1024
+AUDIO_BYTES_PER_SECOND = 6000  # 48 kbps, the lowest bitrate any provider writes
+TIMINGS_WINDOW_MS = 30_000
+
+
+@dataclass
+class Catalog:
+    discipline_ids: list[str] = field(default_factory=list)
+    thinker_ids: list[str] = field(default_factory=list)
+    course_ids: list[str] = field(default_factory=list)
+    lectures: list[dict] = field(default_factory=list)  # LectureSummary payloads
+    voiced: list[dict] = field(default_factory=list)  # those with audio_url
+
+
+@dataclass
+class KindStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    bytes: int = 0
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(int(fraction * len(ordered) + 0.5) - 1, 0)] if ordered else 0.0
+
+
+async def _pages(client: httpx.AsyncClient, path: str, params: dict, limit: int) -> list[dict]:
+    """Follow ``X-Next-Cursor`` until ``limit`` items (or the end of the listing)."""
+    items: list[dict] = []
+    cursor = None
+    while len(items) < limit:
+        page_params = {**params, "limit": min(500, limit - len(items))}
+        if cursor:
+            page_params["cursor"] = cursor
+        response = await client.get(path, params=page_params)
+        response.raise_for_status()
+        items.extend(response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    return items
+
+
+async def discover(client: httpx.AsyncClient, limit: int) -> Catalog:
+    thinkers = await _pages(client, "/api/thinkers/", {"fields": "id,discipline_id"}, limit)
+    courses = await _pages(client, "/api/courses/", {"fields": "id"}, limit)
+    lectures = await _pages(
+        client,
+        "/api/lectures/",
+        {"view": "summary", "status": "ready", "fields": "id,audio_url,duration_seconds"},
+        limit,
+    )
+    return Catalog(
+        discipline_ids=sorted({t["discipline_id"] for t in thinkers if t.get("discipline_id")}),
+        thinker_ids=[t["id"] for t in thinkers],
+        course_ids=[c["id"] for c in courses],
+        lectures=lectures,
+        voiced=[lec for lec in lectures if lec.get("audio_url")],
+    )
+
+
+def _request(kind: str, catalog: Catalog, rng: random.Random) -> tuple[str, dict, dict]:
+    """(path, params, headers) for one request of ``kind``."""
+    if kind == "thinkers":
+        params = {}
+        if catalog.discipline_ids and rng.random() < 0.5:
+            params["discipline_id"] = rng.choice(catalog.discipline_ids)
+        return "/api/thinkers/", params, {}
+    if kind == "courses":
+        return "/api/courses/", {"thinker_id": rng.choice(catalog.thinker_ids)}, {}
+    if kind == "course":
+        return f"/api/courses/{rng.choice(catalog.course_ids)}", {}, {}
+    if kind == "lectures":
+        return "/api/lectures/", {"course_id": rng.choice(catalog.course_ids),
+                                  "view": "summary"}, {}
+    if kind == "lecture":
+        return f"/api/lectures/{rng.choice(catalog.lectures)['id']}", {}, {}
+
+    lecture = rng.choice(catalog.voiced)
+    if kind == "timings":
+        start = rng.randrange(max(1, (lecture.get("duration_seconds") or 1) * 1000))
+        return (
+            f"/api/lectures/{lecture['id']}/timings",
+            {"from_ms": start, "to_ms": start + TIMINGS_WINDOW_MS},
+            {},
+        )
+    if kind == "timings_file":
+        path = lecture["audio_url"].rsplit(".", 1)[0] + ".json"
+        return path, {}, {"Accept-Encoding": "gzip"}
+    if kind == "audio":
+        # Seek within the first minute (or the whole lecture, if shorter)
+        seconds = min(60, lecture.get("duration_seconds") or 1)
+        start = rng.randrange(AUDIO_BYTES_PER_SECOND * seconds)
+        return lecture["audio_url"], {}, {"Range": f"bytes={start}-{start + AUDIO_RANGE_BYTES - 1}"}
+    raise ValueError(f"Unknown request kind {kind!r}")
+
+
+async def _user(
+    client: httpx.AsyncClient,
+    catalog: Catalog,
+    mix: dict[str, float],
+    stats: dict[str, KindStats],
+    deadline: float,
+    think_time: float,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    kinds, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        kind = rng.choices(kinds, weights)[0]
+        path, params, headers = _request(kind, catalog, rng)
+        started = time.perf_counter()
+        try:
+            response = await client.get(path, params=params, headers=headers)
+            failed = response.status_code >= 400
+            size = len(response.content)
+        except httpx.HTTPError:
+            failed, size = True, 0
+        stats[kind].latencies_ms.append((time.perf_counter() - started) * 1000)
+        stats[kind].errors += failed
+        stats[kind].bytes += size
+        if think_time:
+            await asyncio.sleep(rng.expovariate(1 / think_time))
+
+
+def _parse_mix(spec: str, catalog: Catalog) -> dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        kind, _, weight = part.partition("=")
+        mix[kind.strip()] = float(weight or 1)
+    needs = {
+        "courses": catalog.thinker_ids, "course": catalog.course_ids,
+        "lectures": catalog.course_ids, "lecture": catalog.lectures,
+        "timings": catalog.voiced, "timings_file": catalog.voiced, "audio": catalog.voiced,
+    }
+    for kind in list(mix):
+        if kind != "thinkers" and kind not in needs:
+            raise SystemExit(f"Unknown request kind {kind!r} in --mix")
+        if kind in needs and not needs[kind]:
+            print(f"skipping {kind}: nothing to request in this catalog")
+            del mix[kind]
+    if not mix:
+        raise SystemExit("Nothing to request; generate a catalog first")
+    return mix
+
+
+def _row(label: str, s: KindStats, seconds: float) -> str:
+    count = len(s.latencies_ms)
+    return (
+        f"{label:<14}{count:>8}{count / seconds:>9.1f}"
+        f"{_percentile(s.latencies_ms, 0.5):>9.1f}{_percentile(s.latencies_ms, 0.9):>9.1f}"
+        f"{_percentile(s.latencies_ms, 0.99):>9.1f}{max(s.latencies_ms, default=0):>9.1f}"
+        f"{(s.errors / count if count else 0):>8.2%}{s.bytes / seconds / 1e6:>9.2f}"
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        catalog = await discover(client, args.discover_limit)
+        print(f"catalog: {len(catalog.thinker_ids)} thinkers, {len(catalog.course_ids)} courses, "
+              f"{len(catalog.lectures)} lectures ({len(catalog.voiced)} with audio)")
+        mix = _parse_mix(args.mix, catalog)
+        stats = {kind: KindStats() for kind in mix}
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            _user(client, catalog, mix, stats, deadline, args.think_time, args.seed + i)
+            for i in range(args.users)
+        ))
+        seconds = time.perf_counter() - started
+
+    total = KindStats()
+    print(f"\n{'kind':<14}{'requests':>8}{'req/s':>9}{'p50 ms':>9}{'p90 ms':>9}"
+          f"{'p99 ms':>9}{'max ms':>9}{'errors':>8}{'MB/s':>9}")
+    for kind, s in stats.items():
+        print(_row(kind, s, seconds))
+        total.latencies_ms += s.latencies_ms
+        total.errors += s.errors
+        total.bytes += s.bytes
+    print(_row("total", total, seconds))
+
+    p95 = _percentile(total.latencies_ms, 0.95)
+    error_rate = total.errors / len(total.latencies_ms) if total.latencies_ms else 0.0
+    status = 0
+    if args.max_p95_ms and p95 > args.max_p95_ms:
+        print(f"FAIL: p95 {p95:.1f} ms exceeds {args.max_p95_ms} ms")
+        status = 1
+    if error_rate > args.max_error_rate:
+        print(f"FAIL: error rate {error_rate:.2%} exceeds {args.max_error_rate:.2%}")
+        status = 1
+    return status
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the read API of a running instance.")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=32, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="kind=weight,... (see above)")
+    parser.add_argument(
+        "--think-time", type=float, default=0.0, help="Mean seconds between a user's requests"
+    )
+    parser.add_argument("--discover-limit", type=int, default=5000, help="Items per listing")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-p95-ms", type=float, default=0.0, help="0 = no limit")
+    parser.add_argument("--max-error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
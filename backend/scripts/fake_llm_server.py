@@ -0,0 +1,34 @@
+"""Serve a fake chat-completions endpoint for offline generation runs.
+
+    python scripts/fake_llm_server.py --port 8090 --ttft 0.5 --tokens-per-second 80
+
+Then run the API or worker with
+``GITHUB_MODELS_ENDPOINT=http://127.0.0.1:8090/chat/completions`` (any path
+works) and, for audio, ``TTS_PROVIDER=fake``.
+"""
+
+import argparse
+
+import uvicorn
+
+from app.services.fake_llm import create_app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a fake chat-completions server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--ttft", type=float, default=0.5, help="Seconds to the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=80.0)
+    parser.add_argument("--words", type=int, default=2500, help="Words per lecture")
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="Fraction of requests answered with 503"
+    )
+    args = parser.parse_args()
+
+    app = create_app(args.ttft, args.tokens_per_second, args.words, args.failure_rate)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
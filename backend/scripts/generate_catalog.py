@@ -0,0 +1,183 @@
+"""Fill the database with a large synthetic catalog for load testing.
+
+Creates disciplines, thinkers, courses and ready lectures with lecture-sized
+markdown transcripts (``--words`` on average, varying +-40%), then gives a
+fraction of the lectures audio and word-timings files through the fake TTS
+provider (edge-tts profile, unpaced), exactly as generation would write them:
+``audio/{lecture_id}.mp3`` with its ``.json``/``.wt`` timings and
+precompressed copies, and a fingerprinted ``audio_url``.
+
+Every run adds a new, separately named set of rows; point ``DATABASE_URL`` at
+a scratch database. Audio is about 5.5 MB per 2,500-word lecture, so keep
+``--audio-fraction`` modest for big catalogs. The run ends by invalidating
+the response cache, so a running API's cached listings pick up the new rows.
+
+    python scripts/generate_catalog.py --thinkers 200 --courses-per-thinker 5 \\
+        --lectures-per-course 10 --audio-fraction 0.1
+"""
+
+import argparse
+import asyncio
+import random
+import secrets
+import time
+import uuid
+
+from sqlalchemy import insert, select, update
+
+from app.config import settings
+from app.db.migrations import upgrade_database
+from app.db.session import async_session, engine
+from app.models import Course, Discipline, Lecture, Thinker
+from app.services import fake_tts_service
+from app.services.audio_assets import fingerprinted_audio_url
+from app.services.fake_llm import fake_lecture_text
+from app.services.response_cache import close_response_cache, invalidate_catalog
+
+DIFFICULTY_LEVELS = ("introductory", "intermediate", "advanced")
+NATIONALITIES = ("Greek", "German", "British", "French", "American", "Indian", "Russian", "Polish")
+
+
+async def _insert(model, rows: list[dict], batch: int) -> None:
+    for start in range(0, len(rows), batch):
+        async with async_session() as session:
+            await session.execute(insert(model), rows[start:start + batch])
+            await session.commit()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return fake_lecture_text(rng, max(1, int(words * rng.uniform(0.6, 1.4))))
+
+
+async def _lectures(
+    rng: random.Random, courses: list[dict], per_course: int, words: int, batch: int
+) -> list[uuid.UUID]:
+    """Insert the lectures in batches as they are generated; returns their ids."""
+    rows: list[dict] = []
+    ids: list[uuid.UUID] = []
+    total = len(courses) * per_course
+    started = time.perf_counter()
+    for course in courses:
+        for n in range(per_course):
+            transcript = _text(rng, words)
+            rows.append({
+                "id": uuid.uuid4(),
+                "title": f"{course['title']}: Lecture {n + 1}",
+                "sequence_number": n + 1,
+                "transcript": transcript,
+                "status": "ready",
+                "duration_seconds": int(len(transcript.split()) / 150 * 60),
+                "course_id": course["id"],
+            })
+            ids.append(rows[-1]["id"])
+            if len(rows) == batch:
+                await _insert(Lecture, rows, batch)
+                rows.clear()
+                print(f"  lectures {len(ids)}/{total} ({time.perf_counter() - started:.0f} s)")
+    if rows:
+        await _insert(Lecture, rows, batch)
+    return ids
+
+
+async def _voice(lecture_id: uuid.UUID, transcript: str, limit: asyncio.Semaphore) -> None:
+    async with limit:
+        result = await fake_tts_service.generate_audio(transcript, "", lecture_id)
+        url = await fingerprinted_audio_url(lecture_id)
+        async with async_session() as session:
+            await session.execute(
+                update(Lecture)
+                .where(Lecture.id == lecture_id)
+                .values(audio_url=url, duration_seconds=result.duration_seconds)
+            )
+            await session.commit()
+
+
+async def generate(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    tag = secrets.token_hex(3)
+    await upgrade_database()
+
+    disciplines = [
+        {"id": uuid.uuid4(), "name": f"Discipline {i} [{tag}]", "description": _text(rng, 30)}
+        for i in range(args.disciplines)
+    ]
+    await _insert(Discipline, disciplines, args.batch)
+
+    thinkers = []
+    for i in range(args.thinkers):
+        born = rng.randint(-500, 1950)
+        thinkers.append({
+            "id": uuid.uuid4(),
+            "name": f"Thinker {i} [{tag}]",
+            "era": f"{born}–{born + rng.randint(30, 90)}",
+            "birth_year": born,
+            "nationality": rng.choice(NATIONALITIES),
+            "bio": _text(rng, 120),
+            "personality_traits": _text(rng, 20),
+            "speaking_style": _text(rng, 30),
+            "system_prompt": _text(rng, 60),
+            "discipline_id": rng.choice(disciplines)["id"] if disciplines else None,
+        })
+    await _insert(Thinker, thinkers, args.batch)
+
+    courses = [
+        {
+            "id": uuid.uuid4(),
+            "title": f"Course {j} by {thinker['name']}",
+            "description": _text(rng, 80),
+            "difficulty_level": rng.choice(DIFFICULTY_LEVELS),
+            "num_lectures": args.lectures_per_course,
+            "thinker_id": thinker["id"],
+            "discipline_id": thinker["discipline_id"],
+        }
+        for thinker in thinkers
+        for j in range(args.courses_per_thinker)
+    ]
+    await _insert(Course, courses, args.batch)
+    print(f"{len(disciplines)} disciplines, {len(thinkers)} thinkers, {len(courses)} courses")
+
+    lecture_ids = await _lectures(
+        rng, courses, args.lectures_per_course, args.words, args.batch
+    )
+    print(f"{len(lecture_ids)} lectures")
+
+    voiced = rng.sample(lecture_ids, round(len(lecture_ids) * args.audio_fraction))
+    if voiced:
+        # Unpaced: write the files as fast as the disk allows
+        settings.fake_tts_profile = "edge-tts"
+        settings.fake_tts_latency = 0.0
+        settings.fake_tts_chars_per_second = float("inf")
+        async with async_session() as session:
+            result = await session.execute(
+                select(Lecture.id, Lecture.transcript).where(Lecture.id.in_(voiced))
+            )
+            transcripts = result.all()
+        started = time.perf_counter()
+        limit = asyncio.Semaphore(args.audio_concurrency)
+        await asyncio.gather(*(_voice(lid, text, limit) for lid, text in transcripts))
+        print(f"{len(voiced)} lectures with audio and timings "
+              f"({time.perf_counter() - started:.0f} s)")
+    await invalidate_catalog()
+    await close_response_cache()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic catalog.")
+    parser.add_argument("--disciplines", type=int, default=8)
+    parser.add_argument("--thinkers", type=int, default=200)
+    parser.add_argument("--courses-per-thinker", type=int, default=5)
+    parser.add_argument("--lectures-per-course", type=int, default=10)
+    parser.add_argument("--words", type=int, default=2500, help="Mean words per transcript")
+    parser.add_argument(
+        "--audio-fraction", type=float, default=0.1, help="Share of lectures given audio files"
+    )
+    parser.add_argument("--audio-concurrency", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=500, help="Rows per insert")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(generate(args))
+
+
+if __name__ == "__main__":
+    main()
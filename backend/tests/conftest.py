@@ -0,0 +1,92 @@
+"""Shared fixtures: a migrated throwaway SQLite database and an in-process API client.
+
+The environment is set before ``app`` is imported, since settings and the
+engine are created at import time.
+"""
+
+import asyncio
+import os
+import tempfile
+import uuid
+
+_TMP = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_TMP, 'test.db')}"
+os.environ["APP_DEBUG"] = "false"
+os.environ["ADMIN_API_KEY"] = "test-admin-key"
+os.environ["AUDIO_CACHE_DIR"] = os.path.join(_TMP, "audio_cache")
+os.environ["TRACING_EXPORTER"] = ""
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from app.db.migrations import upgrade_database  # noqa: E402
+from app.db.session import async_session, engine  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.models import Course, Lecture, Thinker  # noqa: E402
+from app.services import audio_assets, audio_cache, fake_tts_service  # noqa: E402
+from app.services.response_cache import close_response_cache  # noqa: E402
+
+ADMIN_HEADERS = {"X-Admin-Key": "test-admin-key"}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def migrated_database():
+    async def migrate() -> None:
+        await upgrade_database()
+        await engine.dispose()
+
+    asyncio.run(migrate())
+
+
+@pytest.fixture(autouse=True)
+async def _release_connections():
+    # Each test runs in its own event loop; pooled aiosqlite connections and
+    # cached responses must not outlive it
+    yield
+    await close_response_cache()
+    await engine.dispose()
+
+
+@pytest.fixture
+def audio_dir(tmp_path, monkeypatch) -> str:
+    """Point the generated-audio directory (``backend/audio``) at a temp dir."""
+    path = str(tmp_path / "audio")
+    for module in (audio_cache, audio_assets, fake_tts_service):
+        monkeypatch.setattr(module, "AUDIO_DIR", path)
+    return path
+
+
+@pytest.fixture
+async def client():
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+async def course():
+    """A fresh thinker with one course (lectures are added by the tests)."""
+    async with async_session() as session:
+        thinker = Thinker(name=f"Thinker {uuid.uuid4().hex[:8]}", era="Modern")
+        session.add(thinker)
+        await session.flush()
+        created = Course(title=f"Course {uuid.uuid4().hex[:8]}", thinker_id=thinker.id)
+        session.add(created)
+        await session.commit()
+        return created
+
+
+async def add_lectures(course_id: uuid.UUID, count: int, **values) -> list[Lecture]:
+    async with async_session() as session:
+        lectures = [
+            Lecture(
+                title=f"Lecture {i}",
+                sequence_number=i + 1,
+                course_id=course_id,
+                **{"status": "ready", **values},
+            )
+            for i in range(count)
+        ]
+        session.add_all(lectures)
+        await session.commit()
+        return lectures
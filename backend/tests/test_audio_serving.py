@@ -0,0 +1,114 @@
+import gzip
+import os
+import uuid
+
+import pytest
+
+from app.services.audio_assets import fingerprinted_audio_url, lecture_audio_path
+from app.services.audio_writer import write_timings
+from app.services.word_timings import COMPACT_MEDIA_TYPE, WordTimings
+
+MP3_BYTES = bytes(range(256)) * 4096  # 1 MiB of recognizable bytes
+
+
+@pytest.fixture
+async def audio_url(audio_dir):
+    """A throwaway lecture's mp3 and timings; returns the fingerprinted URL."""
+    lecture_id = uuid.uuid4()
+    os.makedirs(audio_dir)
+    with open(lecture_audio_path(lecture_id), "wb") as f:
+        f.write(MP3_BYTES)
+    timings = WordTimings()
+    for i in range(2000):
+        timings.append(i * 300, i * 300 + 250, i // 50)
+    paragraphs = [f"Paragraph {i}." for i in range(40)]
+    await write_timings(lecture_audio_path(lecture_id, "json"), paragraphs, timings)
+    return await fingerprinted_audio_url(lecture_id)
+
+
+def _timings_url(audio_url: str) -> str:
+    return audio_url.replace(".mp3", ".json")  # as the frontend derives it
+
+
+def _lecture_id(audio_url: str) -> str:
+    return audio_url.rsplit("/", 1)[1].split(".", 1)[0]
+
+
+async def test_fingerprinted_audio(client, audio_url):
+    r = await client.get(audio_url)
+    assert r.status_code == 200 and r.content == MP3_BYTES
+    assert "immutable" in r.headers["cache-control"]
+    assert not r.headers["etag"].startswith("W/")
+    assert r.headers["accept-ranges"] == "bytes"
+
+
+async def test_if_none_match_gives_304(client, audio_url):
+    etag = (await client.get(audio_url)).headers["etag"]
+    r = await client.get(audio_url, headers={"If-None-Match": etag})
+    assert r.status_code == 304 and not r.content
+    assert r.headers["etag"] == etag
+
+
+async def test_ranges(client, audio_url):
+    r = await client.get(audio_url, headers={"Range": "bytes=1000-1999"})
+    assert r.status_code == 206 and r.content == MP3_BYTES[1000:2000]
+    assert r.headers["content-range"] == f"bytes 1000-1999/{len(MP3_BYTES)}"
+
+    r = await client.get(audio_url, headers={"Range": f"bytes=-{len(MP3_BYTES) // 4}"})
+    assert r.status_code == 206 and r.content == MP3_BYTES[-len(MP3_BYTES) // 4:]
+
+    r = await client.get(audio_url, headers={"Range": "bytes=999999999-"})
+    assert r.status_code == 416
+
+
+async def test_if_range(client, audio_url):
+    etag = (await client.head(audio_url)).headers["etag"]
+    r = await client.get(audio_url, headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert r.status_code == 206
+    r = await client.get(audio_url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert r.status_code == 200 and len(r.content) == len(MP3_BYTES)
+
+
+async def test_head(client, audio_url):
+    r = await client.head(audio_url)
+    assert r.status_code == 200 and r.headers["content-length"] == str(len(MP3_BYTES))
+    assert not r.content
+
+
+async def test_legacy_and_unknown_names(client, audio_url):
+    lecture_id = _lecture_id(audio_url)
+    r = await client.get(f"/audio/{lecture_id}.mp3")
+    assert r.status_code == 200 and "no-cache" in r.headers["cache-control"]
+    assert (await client.get(f"/audio/{lecture_id}.{'0' * 16}.mp3")).status_code == 404
+    assert (await client.get("/audio/../app/main.py")).status_code == 404
+
+
+async def test_timings_encodings(client, audio_url):
+    timings_url = _timings_url(audio_url)
+    r = await client.get(timings_url, headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200 and r.headers["content-type"] == "application/json"
+    assert "immutable" in r.headers["cache-control"]
+    json_etag = r.headers["etag"]
+
+    r = await client.get(timings_url, headers={"Accept-Encoding": "gzip"})
+    assert r.headers.get("content-encoding") == "gzip"
+    assert r.headers["etag"] != json_etag
+    headers = {"Accept-Encoding": "gzip", "If-None-Match": r.headers["etag"]}
+    r = await client.get(timings_url, headers=headers)
+    assert r.status_code == 304 and "content-encoding" not in r.headers
+
+
+async def test_compact_timings(client, audio_url):
+    r = await client.get(
+        _timings_url(audio_url),
+        headers={"Accept": COMPACT_MEDIA_TYPE, "Accept-Encoding": "identity"},
+    )
+    _, timings = WordTimings.loads_compact(r.content)
+    assert r.headers["content-type"] == COMPACT_MEDIA_TYPE and len(timings) == 2000
+    assert "Accept" in r.headers["vary"] and "Accept-Encoding" in r.headers["vary"]
+
+    lecture_id = _lecture_id(audio_url)
+    with open(lecture_audio_path(lecture_id, "wt.gz"), "rb") as f:
+        compressed = f.read()
+    with open(lecture_audio_path(lecture_id, "wt"), "rb") as f:
+        assert gzip.decompress(compressed) == f.read()
@@ -0,0 +1,94 @@
+import json
+import uuid
+
+from alembic import command
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.migrations import alembic_config
+from app.db.session import async_session
+from app.models import BackfillRunLecture, Lecture
+from app.services.backfill import open_backfill, refresh_backfill
+from tests.conftest import add_lectures
+
+TRANSCRIPT = "A short lecture."
+
+
+async def _members(run_id: uuid.UUID) -> list[uuid.UUID]:
+    async with async_session() as session:
+        return list(
+            await session.scalars(
+                select(BackfillRunLecture.lecture_id).where(
+                    BackfillRunLecture.backfill_id == run_id
+                )
+            )
+        )
+
+
+async def test_resumed_run_adds_only_new_lectures(course):
+    first = await add_lectures(course.id, 3, transcript=TRANSCRIPT)
+    async with async_session() as session:
+        run = await open_backfill(session, course.id)
+        await session.commit()
+    assert run.total == 3 and run.total_chars == 3 * len(TRANSCRIPT)
+
+    later = await add_lectures(course.id, 2, transcript=TRANSCRIPT)
+    async with async_session() as session:
+        resumed = await open_backfill(session, course.id)
+        await session.commit()
+
+    assert resumed.id == run.id and resumed.total == 5
+    assert resumed.total_chars == 5 * len(TRANSCRIPT)
+    assert sorted(await _members(run.id)) == sorted(lecture.id for lecture in first + later)
+
+
+async def test_progress_is_counted_from_the_run_lectures(course):
+    lectures = await add_lectures(course.id, 3, transcript=TRANSCRIPT)
+    async with async_session() as session:
+        run = await open_backfill(session, course.id)
+        await session.commit()
+        await session.execute(
+            update(Lecture).where(Lecture.id == lectures[0].id).values(audio_url="/audio/a.mp3")
+        )
+        await refresh_backfill(session, run)
+
+    assert (run.completed, run.completed_chars, run.total) == (1, len(TRANSCRIPT), 3)
+
+
+def _json_run_round_trip(connection, lecture_ids: list[str]) -> tuple[list, str]:
+    config = alembic_config()
+    config.attributes["connection"] = connection
+    command.upgrade(config, "0007")
+    run_id = uuid.uuid4().hex
+    connection.execute(
+        text(
+            "INSERT INTO backfill_runs (id, status, lecture_ids, total, total_chars, completed,"
+            " completed_chars, failed) VALUES (:id, 'running', :ids, 2, 0, 0, 0, 0)"
+        ),
+        {"id": run_id, "ids": json.dumps(lecture_ids)},
+    )
+
+    command.upgrade(config, "head")
+    members = connection.execute(
+        text("SELECT lecture_id FROM backfill_run_lectures WHERE backfill_id = :id"),
+        {"id": run_id},
+    ).scalars().all()
+
+    command.downgrade(config, "0007")
+    restored = connection.execute(
+        text("SELECT lecture_ids FROM backfill_runs WHERE id = :id"), {"id": run_id}
+    ).scalar_one()
+    return members, restored
+
+
+async def test_migration_moves_the_json_lecture_list(tmp_path):
+    lecture_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    db_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'migrate.db'}")
+    try:
+        async with db_engine.begin() as conn:
+            members, restored = await conn.run_sync(_json_run_round_trip, lecture_ids)
+    finally:
+        await db_engine.dispose()
+
+    assert sorted(members) == sorted(uuid.UUID(i).hex for i in lecture_ids)
+    assert sorted(json.loads(restored)) == sorted(lecture_ids)
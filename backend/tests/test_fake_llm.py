@@ -0,0 +1,69 @@
+import json
+
+import httpx
+import pytest
+
+from app.services import fake_llm
+
+MESSAGES = [{"role": "user", "content": "Talk to me about entropy"}]
+
+
+@pytest.fixture
+async def llm():
+    app = fake_llm.create_app(ttft=0.0, tokens_per_second=1e6, words=200)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://fake-llm") as client:
+        yield client
+
+
+def _events(body: str) -> list[str]:
+    return [line.removeprefix("data: ") for line in body.split("\n\n") if line]
+
+
+async def test_completion_json_shape_and_token_count(llm):
+    r = await llm.post("/chat/completions", json={"model": "m", "messages": MESSAGES})
+
+    body = r.json()
+    assert r.status_code == 200 and body["object"] == "chat.completion"
+    (choice,) = body["choices"]
+    assert choice["message"]["role"] == "assistant" and choice["finish_reason"] == "stop"
+    content = choice["message"]["content"]
+    usage = body["usage"]
+    # One token per word; the lecture ends with the paragraph that reaches 200 words
+    assert usage["completion_tokens"] == len(content.split())
+    assert 200 <= usage["completion_tokens"] < 200 + 160
+    assert usage["total_tokens"] == usage["prompt_tokens"] + usage["completion_tokens"]
+
+
+async def test_stream_is_sse_deltas_of_one_token(llm):
+    request = {"model": "m", "messages": MESSAGES}
+    whole = (await llm.post("/chat/completions", json=request)).json()
+
+    r = await llm.post("/chat/completions", json={**request, "stream": True})
+
+    assert r.headers["content-type"].startswith("text/event-stream")
+    events = _events(r.text)
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    assert all(chunk["object"] == "chat.completion.chunk" for chunk in chunks)
+    assert chunks[0]["choices"][0]["delta"] == {"role": "assistant", "content": ""}
+    assert chunks[-1]["choices"][0] == {"index": 0, "delta": {}, "finish_reason": "stop"}
+    deltas = [chunk["choices"][0]["delta"]["content"] for chunk in chunks[1:-1]]
+    # Same text as the non-streamed completion, one delta per counted token
+    assert "".join(deltas) == whole["choices"][0]["message"]["content"]
+    assert len(deltas) == whole["usage"]["completion_tokens"]
+    assert all(len(delta.split()) == 1 for delta in deltas)
+
+
+async def test_max_tokens_shortens_the_lecture(llm):
+    request = {"model": "m", "messages": MESSAGES, "max_tokens": 65}  # 50 words
+    body = (await llm.post("/chat/completions", json=request)).json()
+    assert 50 <= body["usage"]["completion_tokens"] < 50 + 160
+
+
+async def test_failure_rate_answers_503():
+    app = fake_llm.create_app(ttft=0.0, failure_rate=1.0)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://fake-llm") as client:
+        r = await client.post("/chat/completions", json={"messages": MESSAGES})
+    assert r.status_code == 503
@@ -0,0 +1,79 @@
+import dataclasses
+import json
+import os
+
+import pytest
+
+from app.config import settings
+from app.services import fake_tts_service
+
+
+def test_output_format_follows_the_current_profile(monkeypatch):
+    monkeypatch.setattr(settings, "fake_tts_profile", "openai")
+    assert fake_tts_service.OUTPUT_FORMAT == "fake/tts-1/mp3"
+    monkeypatch.setattr(settings, "fake_tts_profile", "edge-tts")
+    assert fake_tts_service.OUTPUT_FORMAT == "fake/audio-24khz-48kbitrate-mono-mp3"
+
+    monkeypatch.setattr(settings, "fake_tts_profile", "bogus")
+    with pytest.raises(ValueError, match="FAKE_TTS_PROFILE"):
+        fake_tts_service.OUTPUT_FORMAT
+
+
+PARAGRAPHS = [f"Paragraph {i} says " + "something rather long. " * 40 for i in range(12)]
+
+
+@pytest.mark.parametrize(
+    "profile, chunks",
+    [("edge-tts", 1), ("azure", 3), ("openai", 3)],
+)
+def test_chunking_per_profile(profile, chunks):
+    limit = fake_tts_service.PROFILES[profile].chunk_chars
+    grouped = fake_tts_service._chunk_paragraphs(PARAGRAPHS, limit)
+
+    assert len(grouped) == chunks
+    assert [i for group in grouped for i in group] == list(range(len(PARAGRAPHS)))
+    if limit is not None:
+        assert all(sum(len(PARAGRAPHS[i]) + 2 for i in group) <= limit for group in grouped)
+
+
+@pytest.mark.parametrize(
+    "profile, frame_bytes", [("edge-tts", 144), ("azure", 576), ("openai", 192)]
+)
+def test_silent_frame_is_a_valid_mp3_frame(profile, frame_bytes):
+    mp3 = fake_tts_service.PROFILES[profile].mp3
+    frame = mp3.silent_frame()
+
+    assert len(frame) == mp3.frame_bytes == frame_bytes
+    header = int.from_bytes(frame[:4], "big")
+    assert header >> 21 == 0x7FF  # frame sync
+    assert (header >> 19) & 0b11 == 0b10  # MPEG-2
+    assert (header >> 17) & 0b11 == 0b01  # Layer III
+    assert (header >> 6) & 0b11 == 0b11  # mono
+    bitrates = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+    assert bitrates[(header >> 12) & 0xF] == mp3.bitrate_kbps
+    assert [22050, 24000, 16000][(header >> 10) & 0b11] == mp3.sample_rate
+
+
+@pytest.mark.parametrize("profile", ["edge-tts", "azure", "openai"])
+async def test_generated_audio_is_whole_frames_matching_the_timings(
+    profile, audio_dir, monkeypatch
+):
+    monkeypatch.setattr(settings, "fake_tts_profile", profile)
+    monkeypatch.setattr(settings, "fake_tts_latency", 0.0)
+    monkeypatch.setattr(settings, "fake_tts_chars_per_second", float("inf"))
+    unpaced = dataclasses.replace(fake_tts_service.PROFILES[profile], align_seconds=0.0)
+    monkeypatch.setitem(fake_tts_service.PROFILES, profile, unpaced)
+    mp3 = unpaced.mp3
+
+    result = await fake_tts_service.generate_audio("\n\n".join(PARAGRAPHS), "Kant", "lecture")
+
+    with open(os.path.join(audio_dir, "lecture.mp3"), "rb") as f:
+        audio = f.read()
+    assert len(audio) % mp3.frame_bytes == 0
+    frames = len(audio) // mp3.frame_bytes
+    assert audio == mp3.silent_frame() * frames
+    assert result.duration_seconds == int(frames * mp3.frame_ms // 1000)
+    with open(os.path.join(audio_dir, "lecture.json")) as f:
+        timings = json.load(f)
+    assert len(timings["w"]) == sum(len(p.split()) for p in PARAGRAPHS)
+    assert timings["w"][-1]["e"] <= frames * mp3.frame_ms
@@ -0,0 +1,88 @@
+"""A lecture generated end to end against the offline fakes (``TTS_PROVIDER=fake``)."""
+
+import json
+import os
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import select, update
+
+from app import worker
+from app.config import settings
+from app.db.session import async_session
+from app.models import GenerationJob, GenerationTiming
+from app.services import fake_llm, http_client, job_queue
+from app.services.text_normalizer import normalize_transcript
+from tests.conftest import ADMIN_HEADERS
+
+
+@pytest.fixture
+async def fakes(audio_dir, monkeypatch):
+    app = fake_llm.create_app(ttft=0.0, tokens_per_second=1e6, words=300)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app)) as llm:
+        monkeypatch.setattr(http_client, "_client", llm)
+        monkeypatch.setattr(settings, "github_models_endpoint", "http://fake-llm/chat/completions")
+        monkeypatch.setattr(settings, "tts_provider", "fake")
+        monkeypatch.setattr(settings, "fake_tts_profile", "azure")
+        monkeypatch.setattr(settings, "fake_tts_latency", 0.0)
+        monkeypatch.setattr(settings, "fake_tts_chars_per_second", float("inf"))
+        yield audio_dir
+
+
+async def _run(job_id: str) -> None:
+    """Claim this job (not whatever else other tests left queued) and run it."""
+    job_id = uuid.UUID(job_id)
+    async with async_session() as session:
+        await session.execute(
+            update(GenerationJob)
+            .where(GenerationJob.id == job_id)
+            .values(status="running", worker_id="test-worker", attempts=1,
+                    heartbeat_at=job_queue._now())
+        )
+        await session.commit()
+        job = await session.get(GenerationJob, job_id)
+    await worker.run_job(job)
+
+
+async def _job_status(client, job_id: str) -> str:
+    return (await client.get(f"/api/jobs/{job_id}", headers=ADMIN_HEADERS)).json()["status"]
+
+
+async def test_transcript_and_audio_jobs(client, course, fakes):
+    r = await client.post(
+        "/api/lectures/generate",
+        json={"course_id": str(course.id), "title": "Entropy", "topic": "Entropy"},
+        headers=ADMIN_HEADERS,
+    )
+    transcript_job = r.json()
+    await _run(transcript_job["id"])
+
+    assert await _job_status(client, transcript_job["id"]) == "succeeded"
+    lecture_id = transcript_job["lecture_id"]
+    lecture = (await client.get(f"/api/lectures/{lecture_id}")).json()
+    assert lecture["status"] == "ready"
+    assert len(lecture["transcript"].split()) >= 300
+
+    r = await client.post(f"/api/lectures/{lecture_id}/generate-audio", headers=ADMIN_HEADERS)
+    audio_job = r.json()
+    await _run(audio_job["id"])
+
+    assert await _job_status(client, audio_job["id"]) == "succeeded"
+    lecture = (await client.get(f"/api/lectures/{lecture_id}")).json()
+    assert lecture["duration_seconds"] > 60
+    audio = await client.get(lecture["audio_url"])
+    assert audio.status_code == 200
+    assert audio.content[:2] == b"\xff\xf3" and len(audio.content) % 576 == 0
+    with open(os.path.join(fakes, f"{lecture_id}.json")) as f:
+        timings = json.load(f)
+    words = sum(len(p.split()) for p in normalize_transcript(lecture["transcript"]).paragraphs)
+    assert len(timings["w"]) == words
+
+    async with async_session() as session:
+        kinds = await session.scalars(
+            select(GenerationTiming.kind).where(
+                GenerationTiming.lecture_id == uuid.UUID(lecture_id)
+            )
+        )
+        assert sorted(kinds) == ["audio", "transcript"]
@@ -0,0 +1,58 @@
+import json
+import uuid
+
+from app.db.session import async_session
+from app.models.generation_timing import GenerationTiming
+from app.services.generation_timings import backfill_timings
+from app.services.tracing import StageTimings
+from tests.conftest import add_lectures
+
+MS = 1_000_000
+
+
+def test_wall_time_counts_overlapping_spans_once():
+    stages = StageTimings()
+    for start, end in [(0, 10), (5, 15), (20, 25)]:
+        stages.add("tts.chunk", start * MS, end * MS)
+
+    assert stages.to_dict()["tts.chunk"] == {
+        "count": 3, "total_ms": 25.0, "max_ms": 10.0, "wall_ms": 20.0
+    }
+
+
+async def test_backfill_shares_use_wall_time(course):
+    (lecture,) = await add_lectures(course.id, 1)
+    backfill_id = uuid.uuid4()
+    stages = [
+        # Four chunks synthesized two at a time
+        {
+            "job.audio": {"count": 1, "total_ms": 1000.0, "max_ms": 1000.0, "wall_ms": 1000.0},
+            "tts.chunk": {"count": 4, "total_ms": 1600.0, "max_ms": 400.0, "wall_ms": 800.0},
+        },
+        # Stored before wall_ms was recorded
+        {
+            "job.audio": {"count": 1, "total_ms": 1000.0, "max_ms": 1000.0},
+            "tts.chunk": {"count": 4, "total_ms": 1600.0, "max_ms": 400.0},
+        },
+    ]
+    async with async_session() as session:
+        for breakdown in stages:
+            session.add(
+                GenerationTiming(
+                    lecture_id=lecture.id, backfill_id=backfill_id, kind="audio",
+                    status="succeeded", trace_id="0" * 32, total_ms=1000.0,
+                    stages=json.dumps(breakdown),
+                )
+            )
+        await session.commit()
+
+    async with async_session() as session:
+        summary = await backfill_timings(session, backfill_id)
+
+    by_name = {stage.name: stage for stage in summary.stages}
+    assert summary.total_ms == 2000.0
+    assert by_name["tts.chunk"].total_ms == 3200.0
+    assert by_name["tts.chunk"].wall_ms == 1800.0
+    assert by_name["tts.chunk"].share == 0.9
+    assert by_name["job.audio"].share == 1.0
+    assert all(stage.share <= 1.0 for stage in summary.stages)
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import timedelta
+
+from sqlalchemy import update
+
+from app import worker
+from app.config import settings
+from app.db.session import async_session
+from app.models import GenerationJob, Lecture
+from app.services import job_queue
+from tests.conftest import add_lectures
+
+
+async def _expire_lease(job_id) -> None:
+    expired = job_queue._now() - timedelta(seconds=settings.job_lease_seconds + 1)
+    async with async_session() as session:
+        await session.execute(
+            update(GenerationJob).where(GenerationJob.id == job_id).values(heartbeat_at=expired)
+        )
+        await session.commit()
+
+
+async def _claim_and_lose(kind: str, lecture: Lecture, attempts: int) -> GenerationJob:
+    async with async_session() as session:
+        job = await job_queue.enqueue_job(session, kind, lecture.id, {"topic": "t"})
+        await session.commit()
+    async with async_session() as session:
+        await session.execute(
+            update(GenerationJob).where(GenerationJob.id == job.id).values(attempts=attempts - 1)
+        )
+        await session.commit()
+    claimed = await job_queue.claim_job("lost-worker", kinds=(kind,))
+    assert claimed is not None and claimed.id == job.id
+    await _expire_lease(job.id)
+    await job_queue.claim_job("next-worker", kinds=("none",))  # runs the stale-lease sweep
+    return job
+
+
+async def test_expired_last_attempt_fails_the_lecture(course):
+    (lecture,) = await add_lectures(course.id, 1, status="generating", transcript="partial")
+    job = await _claim_and_lose(job_queue.JOB_TRANSCRIPT, lecture, settings.job_max_attempts)
+
+    async with async_session() as session:
+        assert (await session.get(GenerationJob, job.id)).status == "failed"
+        failed = await session.get(Lecture, lecture.id)
+        assert failed.status == "error"
+        assert failed.transcript == f"Generation failed: {job_queue.LEASE_EXPIRED}"
+
+
+async def test_expired_lease_with_attempts_left_is_requeued(course):
+    (lecture,) = await add_lectures(course.id, 1, status="generating")
+    job = await _claim_and_lose(job_queue.JOB_TRANSCRIPT, lecture, 1)
+
+    async with async_session() as session:
+        assert (await session.get(GenerationJob, job.id)).status == "queued"
+        assert (await session.get(Lecture, lecture.id)).status == "generating"
+
+
+async def _handed_over(lecture: Lecture) -> GenerationJob:
+    """A running transcript job that ``lost-worker`` had, now held by ``new-worker``."""
+    async with async_session() as session:
+        job = await job_queue.enqueue_job(session, job_queue.JOB_TRANSCRIPT, lecture.id, {})
+        await session.execute(
+            update(GenerationJob)
+            .where(GenerationJob.id == job.id)
+            .values(
+                status="running", worker_id="new-worker", attempts=2,
+                heartbeat_at=job_queue._now(),
+            )
+        )
+        await session.commit()
+    job.worker_id = "lost-worker"  # the stale worker's copy of the row
+    job.attempts = 1
+    return job
+
+
+async def test_stale_worker_cannot_touch_a_reassigned_job(course):
+    (lecture,) = await add_lectures(course.id, 1, status="generating")
+    job = await _handed_over(lecture)
+
+    assert not await job_queue.heartbeat(job.id, "lost-worker")
+    assert not await job_queue.complete_job(job.id, "lost-worker")
+    assert not await job_queue.fail_job(job.id, "lost-worker", "boom", retry=True)
+
+    async with async_session() as session:
+        current = await session.get(GenerationJob, job.id)
+        assert (current.status, current.worker_id) == ("running", "new-worker")
+    assert await job_queue.heartbeat(job.id, "new-worker")
+
+
+async def test_stale_worker_does_not_write_the_lecture(course):
+    (lecture,) = await add_lectures(course.id, 1, status="generating", transcript="partial")
+    job = await _handed_over(lecture)
+
+    await worker.run_job(job)
+
+    async with async_session() as session:
+        assert (await session.get(Lecture, lecture.id)).transcript == "partial"
+        current = await session.get(GenerationJob, job.id)
+        assert (current.status, current.worker_id) == ("running", "new-worker")
+
+
+async def test_lost_heartbeat_stops_the_running_job(course, monkeypatch):
+    (lecture,) = await add_lectures(course.id, 1, status="generating")
+    job = await _handed_over(lecture)
+    stopped = asyncio.Event()
+
+    async def synthesize_forever(job, final_attempt):
+        try:
+            await asyncio.sleep(60)
+        finally:
+            stopped.set()
+
+    monkeypatch.setitem(worker.JOB_HANDLERS, job_queue.JOB_TRANSCRIPT, synthesize_forever)
+    monkeypatch.setattr(settings, "job_heartbeat_interval", 0.01)
+
+    await asyncio.wait_for(worker.run_job(job), timeout=5)
+
+    assert stopped.is_set()
+    async with async_session() as session:
+        assert (await session.get(GenerationJob, job.id)).worker_id == "new-worker"
@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from app.services import metrics, response_cache
+from tests.conftest import ADMIN_HEADERS
+
+
+def _exited_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def _write(directory, name: str, value: float, age: float = 0.0) -> str:
+    path = os.path.join(directory, name)
+    family = {"type": "counter", "help": "Test", "labels": [], "samples": [[[], value]]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"test_total": family}, f)
+    if age:
+        written_at = time.time() - age
+        os.utime(path, (written_at, written_at))
+    return path
+
+
+def test_snapshots_are_keyed_by_pid_and_start_time(tmp_path):
+    metrics.write_snapshot(str(tmp_path))
+    (name,) = os.listdir(tmp_path)
+    pid, start = name.removeprefix("metrics-").removesuffix(".json").split("-")
+    assert int(pid) == os.getpid() and int(start) > 0
+
+
+def test_stale_snapshots_are_cleared(tmp_path):
+    metrics.write_snapshot(str(tmp_path))
+    (own,) = os.listdir(tmp_path)
+    dead = _write(tmp_path, f"metrics-{_exited_pid()}-1.json", 1)
+    legacy = _write(tmp_path, f"metrics-{os.getpid()}.json", 1)
+    reused = _write(tmp_path, f"metrics-{os.getpid()}-2.json", 1, age=3600)
+    in_progress = _write(tmp_path, f"metrics-{_exited_pid()}-3.json.tmp", 1)
+
+    assert metrics.clear_stale_snapshots(str(tmp_path)) == 3
+    assert sorted(os.listdir(tmp_path)) == sorted([own, os.path.basename(in_progress)])
+    assert not any(map(os.path.exists, (dead, legacy, reused)))
+
+
+def test_scrape_sums_the_snapshots(tmp_path):
+    _write(tmp_path, f"metrics-{os.getpid()}-1.json", 2)
+    _write(tmp_path, f"metrics-{_exited_pid()}-2.json", 3)
+    merged = metrics.merge_snapshots(metrics._read_snapshots(str(tmp_path)))
+    assert merged["test_total"]["samples"] == [[[], 5]]
+
+
+async def test_metrics_require_the_admin_key(client):
+    assert (await client.get("/metrics")).status_code == 403
+    bad_key = {"X-Admin-Key": "wrong"}
+    assert (await client.get("/metrics", headers=bad_key)).status_code == 403
+
+    r = await client.get("/metrics", headers=ADMIN_HEADERS)
+    assert r.status_code == 200 and r.headers["content-type"] == metrics.CONTENT_TYPE
+    assert "response_cache_entries 0" in r.text
+
+
+async def test_scraping_does_not_create_the_response_cache(client):
+    await response_cache.close_response_cache()
+    await client.get("/metrics", headers=ADMIN_HEADERS)
+    await client.get("/health/cache")
+    assert response_cache._cache is None
@@ -0,0 +1,55 @@
+import asyncio
+import json
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from app.services import openai_tts_service
+
+CHUNK_AUDIO = b"\xff\xf3" * 1000
+
+
+class _SlowWhisperClient:
+    """Instant synthesis, slow alignment; records how many chunks are held at once."""
+
+    def __init__(self) -> None:
+        self.synthesized = 0
+        self.aligned = 0
+        self.peak_held = 0  # chunks synthesized but not yet aligned
+        speech = SimpleNamespace(with_streaming_response=SimpleNamespace(create=self._speech))
+        transcriptions = SimpleNamespace(create=self._transcribe)
+        self.audio = SimpleNamespace(speech=speech, transcriptions=transcriptions)
+
+    @asynccontextmanager
+    async def _speech(self, input: str, **_):
+        self.synthesized += 1
+        self.peak_held = max(self.peak_held, self.synthesized - self.aligned)
+
+        async def iter_bytes(_size):
+            yield CHUNK_AUDIO
+
+        yield SimpleNamespace(iter_bytes=iter_bytes, text=input)
+
+    async def _transcribe(self, file, **_):
+        await asyncio.sleep(0.02)
+        self.aligned += 1
+        word = SimpleNamespace(start=0.0, end=0.5)
+        return SimpleNamespace(segments=[], words=[word], duration=1.0)
+
+
+async def test_alignments_in_flight_are_bounded(monkeypatch, tmp_path):
+    client = _SlowWhisperClient()
+    monkeypatch.setattr(openai_tts_service, "_get_client", lambda: client)
+    monkeypatch.setattr(openai_tts_service, "AUDIO_DIR", str(tmp_path))
+    monkeypatch.setattr(openai_tts_service.settings, "openai_tts_concurrency", 2)
+    paragraphs = [f"Paragraph {i} " + "word " * 700 for i in range(12)]  # one chunk each
+    lecture_id = uuid.uuid4()
+
+    result = await openai_tts_service.generate_audio("\n\n".join(paragraphs), "", lecture_id)
+
+    # Two chunks synthesizing, two aligning, one being handed over
+    assert client.peak_held <= 5
+    assert (tmp_path / f"{lecture_id}.mp3").read_bytes() == CHUNK_AUDIO * 12
+    timings = json.loads((tmp_path / f"{lecture_id}.json").read_text())
+    assert [w["s"] for w in timings["w"]] == [i * 1000 for i in range(12)]
+    assert result.duration_seconds == 12
@@ -0,0 +1,124 @@
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from app.config import settings
+from app.db.session import async_session, engine
+from app.models import Course, Discipline, Thinker
+from app.services.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from tests.conftest import add_lectures
+
+
+@pytest.fixture
+async def discipline():
+    """A fresh discipline with five thinkers, one course each."""
+    async with async_session() as session:
+        created = Discipline(name=f"Discipline {uuid.uuid4().hex[:8]}")
+        session.add(created)
+        await session.flush()
+        for i in range(5):
+            # Two thinkers share each name, so pages break inside runs of equal sort keys
+            thinker = Thinker(name=f"Thinker {i // 2}", era="Modern", discipline_id=created.id)
+            session.add(thinker)
+            await session.flush()
+            session.add(
+                Course(title=f"Course {i // 2}", thinker_id=thinker.id, discipline_id=created.id)
+            )
+        await session.commit()
+        return created
+
+
+async def _follow(client, path: str, **params) -> list[list[dict]]:
+    pages = []
+    cursor = None
+    while True:
+        r = await client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert r.status_code == 200
+        pages.append(r.json())
+        cursor = r.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+
+
+async def test_lecture_pages_return_every_row_once(client, course):
+    # Sequence numbers 1-4 twice: ties are broken by id
+    lectures = await add_lectures(course.id, 4) + await add_lectures(course.id, 4)
+
+    pages = await _follow(client, "/api/lectures/", course_id=course.id, limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 2]
+    ids = [row["id"] for page in pages for row in page]
+    assert sorted(ids) == sorted(str(lecture.id) for lecture in lectures)
+    assert [row["sequence_number"] for page in pages for row in page] == [1, 1, 2, 2, 3, 3, 4, 4]
+
+
+@pytest.mark.parametrize("path", ["/api/thinkers/", "/api/courses/"])
+async def test_catalog_pages_return_every_row_once(client, discipline, path):
+    pages = await _follow(client, path, discipline_id=discipline.id, limit=2)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    ids = [row["id"] for page in pages for row in page]
+    assert len(set(ids)) == 5
+
+
+async def test_later_pages_seek_instead_of_offset(client, course, monkeypatch):
+    monkeypatch.setattr(settings, "response_cache_enabled", False)
+    await add_lectures(course.id, 6)
+    statements: list[str] = []
+    offsets: list[int] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if "FROM lectures" in statement:
+            statements.append(" ".join(statement.split()))
+            # SQLite's dialect always renders LIMIT ? OFFSET ?; the offset must stay 0
+            if "OFFSET ?" in statement:
+                offsets.append(parameters[-1])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        pages = await _follow(client, "/api/lectures/", course_id=course.id, limit=2)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+    assert len(pages) == len(statements) == 3
+    assert all("LIMIT" in statement for statement in statements)
+    assert not any(offsets), statements
+    seek = "(lectures.sequence_number, lectures.id) > (?, ?)"
+    assert seek not in statements[0]
+    assert all(seek in statement for statement in statements[1:]), statements
+
+
+async def test_exact_last_page_has_no_cursor(client, course):
+    await add_lectures(course.id, 4)
+
+    first = await client.get("/api/lectures/", params={"course_id": course.id, "limit": 2})
+    last = await client.get(
+        "/api/lectures/",
+        params={"course_id": course.id, "limit": 2, "cursor": first.headers[NEXT_CURSOR_HEADER]},
+    )
+    assert len(last.json()) == 2 and NEXT_CURSOR_HEADER not in last.headers
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        encode_cursor("lectures", (1,)),
+        encode_cursor("lectures", (1, "not-a-uuid")),
+        encode_cursor("lectures", ("one", uuid.uuid4())),
+        encode_cursor("lectures", (1, uuid.uuid4()))[:-3],
+    ],
+)
+async def test_tampered_cursor_is_rejected(client, course, cursor):
+    r = await client.get("/api/lectures/", params={"course_id": course.id, "cursor": cursor})
+    assert r.status_code == 400
+
+
+async def test_cursor_from_another_list_is_rejected(client, discipline):
+    r = await client.get("/api/courses/", params={"discipline_id": discipline.id, "limit": 2})
+    cursor = r.headers[NEXT_CURSOR_HEADER]
+
+    params = {"discipline_id": discipline.id, "cursor": cursor}
+    r = await client.get("/api/thinkers/", params=params)
+    assert r.status_code == 400
@@ -0,0 +1,144 @@
+"""Every catalog and job query the routers run is served by an index.
+
+Each read endpoint is called (with and without its filters, and for a second
+page where it paginates) and the SELECT statements it sends are run through
+``EXPLAIN QUERY PLAN``. A full table scan (``SCAN <table>`` without an index)
+or a sort the index order doesn't provide (``USE TEMP B-TREE``) fails.
+"""
+
+import re
+import uuid
+
+import pytest
+from sqlalchemy import event, insert
+
+from app.config import settings
+from app.db.session import engine
+from app.models import (
+    BackfillRun,
+    BackfillRunLecture,
+    Course,
+    Discipline,
+    GenerationJob,
+    GenerationTiming,
+    Lecture,
+    Thinker,
+)
+from tests.conftest import ADMIN_HEADERS
+
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+ENDPOINTS = [
+    "/api/thinkers/?limit=5",
+    "/api/thinkers/?discipline_id={discipline}&limit=5",
+    "/api/thinkers/?fields=name&limit=5",
+    "/api/thinkers/{thinker}",
+    "/api/courses/?limit=5",
+    "/api/courses/?thinker_id={thinker}&limit=5",
+    "/api/courses/?discipline_id={discipline}&limit=5",
+    "/api/courses/?fields=title&limit=5",
+    "/api/courses/{course}",
+    "/api/lectures/?limit=5",
+    "/api/lectures/?course_id={course}&view=summary&limit=5",
+    "/api/lectures/?status=ready&limit=5",
+    "/api/lectures/{lecture}",
+    "/api/jobs/",
+    "/api/jobs/?lecture_id={lecture}",
+    "/api/jobs/?status=queued",
+    "/api/lectures/{lecture}/generation-timings",
+    "/api/lectures/backfill-audio/{backfill}",
+    "/api/lectures/backfill-audio/{backfill}/generation-timings",
+]
+
+
+@pytest.fixture
+async def catalog() -> dict[str, uuid.UUID]:
+    """Twenty rows per table under one discipline, thinker, course and lecture."""
+    ids = {
+        name: uuid.uuid4()
+        for name in ("discipline", "thinker", "course", "lecture", "job", "backfill")
+    }
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(Discipline), [{"id": ids["discipline"], "name": f"Discipline {ids['job']}"}]
+        )
+        await conn.execute(
+            insert(Thinker),
+            [
+                {"id": ids["thinker"] if i == 0 else uuid.uuid4(), "name": f"Thinker {i}",
+                 "era": "Modern", "discipline_id": ids["discipline"]}
+                for i in range(20)
+            ],
+        )
+        await conn.execute(
+            insert(Course),
+            [
+                {"id": ids["course"] if i == 0 else uuid.uuid4(), "title": f"Course {i}",
+                 "thinker_id": ids["thinker"], "discipline_id": ids["discipline"]}
+                for i in range(20)
+            ],
+        )
+        await conn.execute(
+            insert(Lecture),
+            [
+                {"id": ids["lecture"] if i == 0 else uuid.uuid4(), "title": f"Lecture {i}",
+                 "sequence_number": i, "course_id": ids["course"], "status": "ready"}
+                for i in range(20)
+            ],
+        )
+        await conn.execute(
+            insert(GenerationJob),
+            [{"id": ids["job"], "kind": "audio", "lecture_id": ids["lecture"]}],
+        )
+        await conn.execute(insert(BackfillRun), [{"id": ids["backfill"]}])
+        await conn.execute(
+            insert(BackfillRunLecture),
+            [{"backfill_id": ids["backfill"], "lecture_id": ids["lecture"]}],
+        )
+        await conn.execute(
+            insert(GenerationTiming),
+            [
+                {"id": uuid.uuid4(), "lecture_id": ids["lecture"], "job_id": ids["job"],
+                 "backfill_id": ids["backfill"], "kind": "audio", "status": "succeeded",
+                 "trace_id": "0" * 32, "total_ms": 1000.0 + i, "stages": "{}"}
+                for i in range(20)
+            ],
+        )
+    return ids
+
+
+async def _selects(client, url: str) -> list[tuple[str, tuple]]:
+    """The SELECT statements serving ``url`` and, if it has one, its next page."""
+    statements: list[tuple[str, tuple]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, tuple(parameters or ())))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        r = await client.get(url, headers=ADMIN_HEADERS)
+        assert r.status_code == 200
+        cursor = r.headers.get("x-next-cursor")
+        if cursor:
+            separator = "&" if "?" in url else "?"
+            r = await client.get(f"{url}{separator}cursor={cursor}", headers=ADMIN_HEADERS)
+            assert r.status_code == 200
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+    return statements
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+async def test_queries_use_an_index(client, catalog, monkeypatch, endpoint):
+    monkeypatch.setattr(settings, "response_cache_enabled", False)
+
+    statements = await _selects(client, endpoint.format(**catalog))
+
+    assert statements
+    async with engine.connect() as conn:
+        for statement, parameters in dict(statements).items():
+            plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[3] for row in plan]
+            assert not any(FULL_SCAN.match(d) for d in details), (statement, details)
+            assert not any("TEMP B-TREE" in d for d in details), (statement, details)
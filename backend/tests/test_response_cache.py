@@ -0,0 +1,41 @@
+from sqlalchemy import update
+
+from app.config import settings
+from app.db.session import async_session
+from app.models import Lecture
+from app.services.response_cache import ResponseCache
+from tests.conftest import add_lectures
+
+
+async def _worker_sets_audio(lecture: Lecture, audio_url: str) -> None:
+    """What a worker in another process does: commit, then invalidate its own cache."""
+    async with async_session() as session:
+        await session.execute(
+            update(Lecture).where(Lecture.id == lecture.id).values(audio_url=audio_url)
+        )
+        await session.commit()
+    worker_cache = ResponseCache(8, settings.response_cache_ttl)
+    await worker_cache.invalidate()
+    await worker_cache.close()
+
+
+async def test_another_process_invalidation_reaches_the_api(client, course, monkeypatch):
+    monkeypatch.setattr(settings, "response_cache_generation_poll", 0.0)
+    (lecture,) = await add_lectures(course.id, 1)
+
+    assert (await client.get(f"/api/lectures/{lecture.id}")).json()["audio_url"] is None
+    await _worker_sets_audio(lecture, "/audio/new.mp3")
+
+    r = await client.get(f"/api/lectures/{lecture.id}")
+    assert r.json()["audio_url"] == "/audio/new.mp3"
+
+
+async def test_generation_is_polled_at_most_once_per_interval(client, course, monkeypatch):
+    monkeypatch.setattr(settings, "response_cache_generation_poll", 3600.0)
+    (lecture,) = await add_lectures(course.id, 1)
+
+    assert (await client.get(f"/api/lectures/{lecture.id}")).json()["audio_url"] is None
+    await _worker_sets_audio(lecture, "/audio/new.mp3")
+
+    # Within the interval the API keeps serving what it cached
+    assert (await client.get(f"/api/lectures/{lecture.id}")).json()["audio_url"] is None
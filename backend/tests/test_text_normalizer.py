@@ -0,0 +1,81 @@
+import random
+import re
+
+import pytest
+
+from app.services.text_normalizer import normalize_transcript, strip_markdown
+
+
+def _legacy_strip_markdown(text: str) -> str:
+    """The ``strip_markdown`` each TTS provider used to carry."""
+    text = re.sub(r"#{1,6}\s*", "", text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
+    text = re.sub(r"\*(.+?)\*", r"\1", text)
+    text = re.sub(r"_(.+?)_", r"\1", text)
+    text = re.sub(r"`(.+?)`", r"\1", text)
+    text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)
+    text = re.sub(r"^[-*+]\s+", "", text, flags=re.MULTILINE)
+    text = re.sub(r"^\d+\.\s+", "", text, flags=re.MULTILINE)
+    text = re.sub(r"---+", "", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def _assert_matches_legacy(transcript: str) -> None:
+    text = _legacy_strip_markdown(transcript)
+    result = normalize_transcript(transcript)
+    assert result.text == text
+    assert list(result.paragraphs) == [p.strip() for p in text.split("\n\n") if p.strip()]
+
+
+@pytest.mark.parametrize(
+    "transcript, expected",
+    [
+        ("Use my_var, see [docs](https://ex.com/a_b).", "Use myvar, see docs."),
+        ("- 1. First step\n- 2. Second step", "First step\nSecond step"),
+        ("## 1. Introduction\n\nText.", "Introduction\n\nText."),
+    ],
+)
+def test_known_outputs(transcript, expected):
+    assert strip_markdown(transcript) == expected
+    _assert_matches_legacy(transcript)
+
+
+@pytest.mark.parametrize(
+    "transcript",
+    [
+        "### - Bulleted heading",
+        "Languages like C#\n- Java\n- Go",
+        "***Bold italic*** and **bold *italic***.",
+        "* A bullet with **bold** inside\n* Another *one*",
+        "*Italic with **bold** inside* here.",
+        "See [the *Notes*](https://example.org/notes_a_b) and `a_b`.",
+        "Text\n\n---\n\n\n\nMore text\n\n\n",
+        "snake_case_names and 3.14 and 1. not a list",
+        "[a](b) [c](d_e) f_g",
+        "`code_with_underscores` and _emphasis_",
+        "",
+    ],
+)
+def test_edge_cases_match_legacy(transcript):
+    _assert_matches_legacy(transcript)
+
+
+_PIECES = [
+    "word", "my_var", "a_b_c", "**bold**", "*it*", "_em_", "`x_y`", "***both***",
+    "[docs](https://ex.com/a_b)", "[*n*](u)", "C#", "3.14", "1.", "-", "*", "---",
+    "**open", "close**", "snake_case",
+]
+_LINE_STARTS = ["", "", "", "- ", "* ", "+ ", "1. ", "12. ", "- 1. ", "## ", "# 2. ", "### - "]
+
+
+def _line(rng: random.Random) -> str:
+    words = " ".join(rng.choice(_PIECES) for _ in range(rng.randint(1, 10)))
+    return rng.choice(_LINE_STARTS) + words + rng.choice(["", ".", "?"])
+
+
+def test_realistic_lines_match_legacy():
+    rng = random.Random(20)
+    for _ in range(3000):
+        lines = [_line(rng) for _ in range(rng.randint(1, 6))]
+        _assert_matches_legacy("".join(line + "\n" * rng.randint(1, 4) for line in lines))
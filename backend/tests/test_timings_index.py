@@ -0,0 +1,23 @@
+from app.services.timings_index import TimingsIndex
+from app.services.word_timings import WordTimings
+
+
+def _index(words: int) -> TimingsIndex:
+    timings = WordTimings()
+    for i in range(words):
+        timings.append(i * 300, i * 300 + 250, i // 10)
+    return TimingsIndex([f"Paragraph {p}." for p in range(words // 10)], timings)
+
+
+def test_window_inside_the_lecture():
+    window = _index(100).window(3_000, 6_000)
+    assert window.first_word == 10 and len(window.starts) == 10
+    assert set(window.paragraphs) == {1}
+
+
+def test_window_past_the_end_is_empty():
+    index = _index(100)
+    for from_ms in (index.duration_ms, index.duration_ms + 60_000):
+        window = index.window(from_ms, from_ms + 1_000)
+        assert window.first_word == len(index) == 100
+        assert not window.starts and not window.paragraphs
@@ -0,0 +1,52 @@
+import uuid
+
+from app.db.session import engine
+from app.services import transcript_search
+from app.services.transcript_search import SEARCH_TRUNCATED_HEADER
+from tests.conftest import add_lectures
+
+
+async def _lectures_mentioning(course_id: uuid.UUID, count: int) -> tuple[str, list]:
+    word = f"zq{uuid.uuid4().hex[:10]}"
+    lectures = await add_lectures(course_id, count, transcript=f"A lecture about {word}.")
+    return word, lectures
+
+
+async def test_search_below_the_candidate_ceiling_is_not_truncated(client, course, monkeypatch):
+    monkeypatch.setattr(transcript_search, "SEARCH_CANDIDATES", 3)
+    word, lectures = await _lectures_mentioning(course.id, 3)
+
+    r = await client.get("/api/lectures/search", params={"q": word})
+
+    assert r.status_code == 200
+    assert {hit["lecture_id"] for hit in r.json()} == {str(lecture.id) for lecture in lectures}
+    assert SEARCH_TRUNCATED_HEADER not in r.headers
+
+
+async def test_search_above_the_candidate_ceiling_is_flagged(client, course, monkeypatch):
+    monkeypatch.setattr(transcript_search, "SEARCH_CANDIDATES", 3)
+    word, lectures = await _lectures_mentioning(course.id, 5)
+
+    r = await client.get("/api/lectures/search", params={"q": word})
+
+    assert r.headers[SEARCH_TRUNCATED_HEADER] == "true"
+    # The newest candidates were ranked
+    assert {hit["lecture_id"] for hit in r.json()} == {str(lecture.id) for lecture in lectures[2:]}
+
+    r = await client.get("/api/lectures/search", params={"q": word, "course_id": course.id})
+    assert len(r.json()) == 5 and SEARCH_TRUNCATED_HEADER not in r.headers
+
+
+
+
+async def test_search_does_not_depend_on_lecture_rowids(client, course):
+    word, lectures = await _lectures_mentioning(course.id, 1)
+    # What VACUUM or a table rebuild may do to a table without an INTEGER PRIMARY KEY
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "UPDATE lectures SET rowid = (SELECT max(rowid) FROM lectures) + 1000 WHERE id = ?",
+            (lectures[0].id.hex,),
+        )
+
+    r = await client.get("/api/lectures/search", params={"q": word})
+    assert [hit["lecture_id"] for hit in r.json()] == [str(lectures[0].id)]
@@ -35,26 +35,42 @@ export interface Course {
   thinker_name?: string
 }
 
-export interface Lecture {
+/** A lecture as listed (view=summary): everything but the transcript */
+export interface LectureSummary {
   id: string
   title: string
   sequence_number: number
-  transcript: string
   audio_url: string | null
   status: string
   duration_seconds: number | null
   course_id: string
   created_at: string
   updated_at: string
+}
+
+export interface Lecture extends LectureSummary {
+  transcript: string
   thinker_name?: string | null
   thinker_image_url?: string | null
   course_title?: string | null
 }
 
+/** Fetch every page of a paginated list endpoint, following X-Next-Cursor */
+async function fetchAllPages<T>(path: string, params: Record<string, string>, error: string): Promise<T[]> {
+  const items: T[] = []
+  let cursor: string | null = null
+  do {
+    const query = new URLSearchParams(cursor ? { ...params, cursor } : params)
+    const res = await fetch(`${API_BASE}${path}?${query}`)
+    if (!res.ok) throw new Error(error)
+    items.push(...(await res.json()))
+    cursor = res.headers.get('X-Next-Cursor')
+  } while (cursor)
+  return items
+}
+
 export async function fetchThinkers(): Promise<Thinker[]> {
-  const res = await fetch(`${API_BASE}/thinkers/`)
-  if (!res.ok) throw new Error('Failed to fetch thinkers')
-  return res.json()
+  return fetchAllPages('/thinkers/', {}, 'Failed to fetch thinkers')
 }
 
 export async function fetchThinker(id: string): Promise<Thinker> {
@@ -64,10 +80,8 @@ export async function fetchThinker(id: string): Promise<Thinker> {
 }
 
 export async function fetchCourses(thinkerId?: string): Promise<Course[]> {
-  const params = thinkerId ? `?thinker_id=${thinkerId}` : ''
-  const res = await fetch(`${API_BASE}/courses/${params}`)
-  if (!res.ok) throw new Error('Failed to fetch courses')
-  return res.json()
+  const params: Record<string, string> = thinkerId ? { thinker_id: thinkerId } : {}
+  return fetchAllPages('/courses/', params, 'Failed to fetch courses')
 }
 
 export async function fetchCourse(id: string): Promise<Course> {
@@ -92,10 +106,9 @@ export async function createCourse(data: {
   return res.json()
 }
 
-export async function fetchLectures(courseId: string): Promise<Lecture[]> {
-  const res = await fetch(`${API_BASE}/lectures/?course_id=${courseId}`)
-  if (!res.ok) throw new Error('Failed to fetch lectures')
-  return res.json()
+export async function fetchLectures(courseId: string): Promise<LectureSummary[]> {
+  const params = { course_id: courseId, view: 'summary' }
+  return fetchAllPages('/lectures/', params, 'Failed to fetch lectures')
 }
 
 export async function fetchLecture(id: string): Promise<Lecture> {
@@ -104,24 +117,114 @@ export async function fetchLecture(id: string): Promise<Lecture> {
   return res.json()
 }
 
-export interface WordTiming {
-  s: number   // start time in ms
-  e: number   // end time in ms
-  p: number   // paragraph index
-}
-
+/** Word timings as parallel columns, one entry per spoken word */
 export interface TimingsData {
   p: string[]        // paragraph texts (with punctuation)
-  w: WordTiming[]    // word timings
+  s: Int32Array      // word start time in ms
+  e: Int32Array      // word end time in ms
+  wp: Int32Array     // word paragraph index
+}
+
+// Compact binary encoding served for the timings URL (see backend word_timings.py)
+const COMPACT_TIMINGS_TYPE = 'application/vnd.symposium.word-timings'
+const COMPACT_TIMINGS_VERSION = 1
+
+/** Decode the "SSWT" v1 encoding: paragraphs, then gap/duration/paragraph zigzag varint columns */
+export function decodeCompactTimings(buffer: ArrayBuffer): TimingsData {
+  const bytes = new Uint8Array(buffer)
+  const magic = String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3])
+  if (magic !== 'SSWT' || bytes[4] !== COMPACT_TIMINGS_VERSION) {
+    throw new Error('Unsupported word timings encoding')
+  }
+  let pos = 8
+  const varint = (): number => {
+    let value = 0
+    let scale = 1
+    let byte: number
+    do {
+      byte = bytes[pos++]
+      value += (byte & 0x7f) * scale
+      scale *= 128
+    } while (byte & 0x80)
+    return value % 2 ? -(value + 1) / 2 : value / 2
+  }
+
+  const decoder = new TextDecoder()
+  const paragraphs: string[] = new Array(varint())
+  for (let i = 0; i < paragraphs.length; i++) {
+    const length = varint()
+    paragraphs[i] = decoder.decode(bytes.subarray(pos, pos + length))
+    pos += length
+  }
+
+  const count = varint()
+  const s = new Int32Array(count)
+  const e = new Int32Array(count)
+  const wp = new Int32Array(count)
+  for (let i = 0; i < count; i++) s[i] = varint()  // gaps from the previous word's end
+  let end = 0
+  for (let i = 0; i < count; i++) {
+    s[i] += end
+    end = e[i] = s[i] + varint()  // durations
+  }
+  let para = 0
+  for (let i = 0; i < count; i++) {
+    para += varint()
+    wp[i] = para
+  }
+  return { p: paragraphs, s, e, wp }
+}
+
+interface LegacyTimings {
+  p: string[]
+  w: { s: number; e: number; p: number }[]
+}
+
+function fromLegacyTimings({ p, w }: LegacyTimings): TimingsData {
+  const s = new Int32Array(w.length)
+  const e = new Int32Array(w.length)
+  const wp = new Int32Array(w.length)
+  w.forEach((word, i) => {
+    s[i] = word.s
+    e[i] = word.e
+    wp[i] = word.p
+  })
+  return { p, s, e, wp }
 }
 
 export async function fetchWordTimings(audioUrl: string): Promise<TimingsData | null> {
   const timingsUrl = resolveBackendUrl(audioUrl).replace('.mp3', '.json')
   try {
-    const res = await fetch(timingsUrl)
+    const res = await fetch(timingsUrl, {
+      headers: { Accept: `${COMPACT_TIMINGS_TYPE}, application/json;q=0.9` },
+    })
     if (!res.ok) return null
-    return res.json()
+    if (res.headers.get('Content-Type')?.startsWith(COMPACT_TIMINGS_TYPE)) {
+      return decodeCompactTimings(await res.arrayBuffer())
+    }
+    return fromLegacyTimings(await res.json())
   } catch {
     return null
   }
 }
+
+export interface TranscriptSearchHit {
+  lecture_id: string
+  title: string
+  course_id: string
+  snippet: string // markdown, matches in **bold**
+  score: number
+  paragraph_index: number | null
+  offset_ms: number | null // where the match is spoken, if the audio has timings
+}
+
+export async function searchLectures(
+  q: string,
+  courseId?: string,
+): Promise<TranscriptSearchHit[]> {
+  const params = new URLSearchParams({ q })
+  if (courseId) params.set('course_id', courseId)
+  const res = await fetch(`${API_BASE}/lectures/search?${params}`)
+  if (!res.ok) throw new Error('Failed to search lectures')
+  return res.json()
+}
@@ -41,21 +41,22 @@ export default function SyncedTranscript({ timingsData, audioRef }: Props) {
   const containerRef = useRef<HTMLDivElement | null>(null)
   const rafRef = useRef<number>(0)
 
-  const { p: paragraphs, w: wordTimings } = timingsData
+  const { p: paragraphs, s: starts, e: ends, wp: wordParas } = timingsData
+  const wordCount = starts.length
 
   // Group words into phrases separated by natural pauses
   const phrases: Phrase[] = useMemo(() => {
-    if (wordTimings.length === 0) return []
+    if (wordCount === 0) return []
     const groups: Phrase[] = []
     let groupStart = 0
-    for (let i = 1; i < wordTimings.length; i++) {
-      const gap = wordTimings[i].s - wordTimings[i - 1].e
-      if (gap > PHRASE_GAP_MS || wordTimings[i].p !== wordTimings[i - 1].p) {
-        groups.push({ startIdx: groupStart, endIdx: i - 1, startMs: wordTimings[groupStart].s })
+    for (let i = 1; i < wordCount; i++) {
+      const gap = starts[i] - ends[i - 1]
+      if (gap > PHRASE_GAP_MS || wordParas[i] !== wordParas[i - 1]) {
+        groups.push({ startIdx: groupStart, endIdx: i - 1, startMs: starts[groupStart] })
         groupStart = i
       }
     }
-    groups.push({ startIdx: groupStart, endIdx: wordTimings.length - 1, startMs: wordTimings[groupStart].s })
+    groups.push({ startIdx: groupStart, endIdx: wordCount - 1, startMs: starts[groupStart] })
 
     // Merge orphan phrases (1-2 words) into the previous phrase
     // unless they cross a paragraph boundary
@@ -64,7 +65,7 @@ export default function SyncedTranscript({ timingsData, audioRef }: Props) {
       const prev = merged[merged.length - 1]
       const curr = groups[i]
       const currSize = curr.endIdx - curr.startIdx + 1
-      const samePara = wordTimings[prev.endIdx].p === wordTimings[curr.startIdx].p
+      const samePara = wordParas[prev.endIdx] === wordParas[curr.startIdx]
       if (currSize <= 2 && samePara) {
         prev.endIdx = curr.endIdx
       } else {
@@ -72,24 +73,24 @@ export default function SyncedTranscript({ timingsData, audioRef }: Props) {
       }
     }
     return merged
-  }, [wordTimings])
+  }, [starts, ends, wordParas, wordCount])
 
   // Map each global word index → phrase index for fast lookup
   const wordToPhrase = useMemo(() => {
-    const map = new Int32Array(wordTimings.length)
+    const map = new Int32Array(wordCount)
     for (let pi = 0; pi < phrases.length; pi++) {
       for (let wi = phrases[pi].startIdx; wi <= phrases[pi].endIdx; wi++) {
         map[wi] = pi
       }
     }
     return map
-  }, [phrases, wordTimings.length])
+  }, [phrases, wordCount])
 
   // Build paragraph rendering data
   const paragraphData = useMemo(() => {
     const paraWordCounts: number[] = new Array(paragraphs.length).fill(0)
-    for (const wt of wordTimings) {
-      if (wt.p < paraWordCounts.length) paraWordCounts[wt.p]++
+    for (const p of wordParas) {
+      if (p < paraWordCounts.length) paraWordCounts[p]++
     }
     const paraStartIdx: number[] = []
     let cumulative = 0
@@ -107,7 +108,7 @@ export default function SyncedTranscript({ timingsData, audioRef }: Props) {
       const tokens = tokenize(displayText)
       return { tokens, startIdx: paraStartIdx[pIdx], wordCount: paraWordCounts[pIdx], isHeading }
     })
-  }, [paragraphs, wordTimings])
+  }, [paragraphs, wordParas])
 
   const updateHighlight = useCallback(() => {
     const audio = audioRef.current
@@ -194,8 +195,8 @@ export default function SyncedTranscript({ timingsData, audioRef }: Props) {
 
   const handleWordClick = (globalIdx: number) => {
     const audio = audioRef.current
-    if (!audio || globalIdx >= wordTimings.length) return
-    audio.currentTime = (wordTimings[globalIdx].s + SYNC_OFFSET_MS) / 1000
+    if (!audio || globalIdx >= wordCount) return
+    audio.currentTime = (starts[globalIdx] + SYNC_OFFSET_MS) / 1000
     setActivePhraseIdx(wordToPhrase[globalIdx])
   }
 
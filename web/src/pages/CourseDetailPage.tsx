@@ -1,22 +1,29 @@
 import { useEffect, useState } from 'react'
 import { useParams, Link } from 'react-router-dom'
+import Markdown from 'react-markdown'
 import {
   fetchCourse,
   fetchLectures,
   fetchThinker,
+  searchLectures,
   type Course,
-  type Lecture,
+  type LectureSummary,
   type Thinker,
+  type TranscriptSearchHit,
 } from '../api/client'
 import ThinkerAvatar from '../components/ThinkerAvatar'
 
 export default function CourseDetailPage() {
   const { id } = useParams<{ id: string }>()
   const [course, setCourse] = useState<Course | null>(null)
-  const [lectures, setLectures] = useState<Lecture[]>([])
+  const [lectures, setLectures] = useState<LectureSummary[]>([])
   const [thinker, setThinker] = useState<Thinker | null>(null)
   const [loading, setLoading] = useState(true)
 
+  const [query, setQuery] = useState('')
+  const [hits, setHits] = useState<TranscriptSearchHit[] | null>(null)
+  const [searching, setSearching] = useState(false)
+
   useEffect(() => {
     if (!id) return
     Promise.all([fetchCourse(id), fetchLectures(id)])
@@ -28,6 +35,20 @@ export default function CourseDetailPage() {
       .finally(() => setLoading(false))
   }, [id])
 
+  const handleSearch = async (e: React.FormEvent) => {
+    e.preventDefault()
+    if (!query.trim() || !id) return
+    setSearching(true)
+    try {
+      setHits(await searchLectures(query.trim(), id))
+    } catch (err) {
+      console.error('Failed to search lectures:', err)
+      setHits([])
+    } finally {
+      setSearching(false)
+    }
+  }
+
   if (loading) return <p className="text-center py-12 font-sans text-muted">Loading course…</p>
   if (!course) return <p className="text-center py-12 font-sans text-burgundy">Course not found</p>
 
@@ -48,6 +69,42 @@ export default function CourseDetailPage() {
         )}
       </div>
 
+      {/* Transcript search: each hit opens the lecture where the match is spoken */}
+      <div>
+        <form onSubmit={handleSearch} className="flex gap-3">
+          <input
+            type="search"
+            value={query}
+            onChange={(e) => setQuery(e.target.value)}
+            placeholder="Search this course's transcripts"
+            className="input"
+          />
+          <button type="submit" disabled={searching || !query.trim()} className="btn-primary shrink-0">
+            {searching ? 'Searching…' : 'Search'}
+          </button>
+        </form>
+        {hits && (
+          <div className="space-y-3 mt-4">
+            {hits.length === 0 ? (
+              <p className="text-muted font-sans text-sm">No lectures mention that.</p>
+            ) : (
+              hits.map((hit) => (
+                <Link
+                  key={hit.lecture_id}
+                  to={`/lectures/${hit.lecture_id}${hit.offset_ms != null ? `?t=${hit.offset_ms}` : ''}`}
+                  className="card-interactive block p-5 group"
+                >
+                  <h3 className="text-lg font-bold group-hover:text-gold transition-colors">{hit.title}</h3>
+                  <div className="prose prose-sm max-w-none font-serif text-muted mt-1">
+                    <Markdown>{hit.snippet}</Markdown>
+                  </div>
+                </Link>
+              ))
+            )}
+          </div>
+        )}
+      </div>
+
       {/* Lectures List */}
       <div>
         <h2 className="text-2xl font-bold mb-4">
@@ -1,5 +1,5 @@
 import { useEffect, useRef, useState } from 'react'
-import { useParams, Link } from 'react-router-dom'
+import { useParams, useSearchParams, Link } from 'react-router-dom'
 import Markdown from 'react-markdown'
 import { fetchLecture, fetchWordTimings, resolveBackendUrl, type Lecture, type TimingsData } from '../api/client'
 import SyncedTranscript from '../components/SyncedTranscript'
@@ -12,6 +12,9 @@ export default function LecturePage() {
   const [loading, setLoading] = useState(true)
   const [timingsData, setTimingsData] = useState<TimingsData | null>(null)
   const audioRef = useRef<HTMLAudioElement | null>(null)
+  // ?t=<ms>: start where a search hit is spoken
+  const [searchParams] = useSearchParams()
+  const startMs = Number(searchParams.get('t')) || 0
 
   useEffect(() => {
     if (!id) return
@@ -26,6 +29,16 @@ export default function LecturePage() {
     fetchWordTimings(lecture.audio_url).then(setTimingsData)
   }, [lecture?.audio_url])
 
+  // The <audio> element mounts with the player, once the lecture has loaded
+  useEffect(() => {
+    const a = audioRef.current
+    if (!a || !startMs) return
+    const seek = () => { a.currentTime = startMs / 1000 }
+    if (a.readyState >= HTMLMediaElement.HAVE_METADATA) seek()
+    else a.addEventListener('loadedmetadata', seek, { once: true })
+    return () => a.removeEventListener('loadedmetadata', seek)
+  }, [lecture?.audio_url, startMs])
+
   if (loading) return <p className="text-center py-12 font-sans text-muted">Loading lecture…</p>
   if (!lecture) return <p className="text-center py-12 font-sans text-burgundy">Lecture not found</p>
 
@@ -71,7 +84,7 @@ export default function LecturePage() {
       {/* Transcript */}
       <div className="card p-8">
         <p className="text-xs font-sans font-semibold uppercase tracking-wider text-gold mb-4">Transcript</p>
-        {timingsData && timingsData.w.length > 0 ? (
+        {timingsData && timingsData.s.length > 0 ? (
           <SyncedTranscript timingsData={timingsData} audioRef={audioRef} />
         ) : (
           <div className="prose prose-lg max-w-none leading-relaxed font-serif">